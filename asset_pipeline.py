@@ -0,0 +1,103 @@
+# asset_pipeline.py
+# Statische Assets (CSS, JS, Chart.js) als Dateien mit Content-Hash unter docs/assets/ statt inline bzw. vom CDN
+
+import hashlib
+import logging
+import os
+from typing import Dict, List, Optional, Union
+
+import requests
+
+ASSETS_DIR = 'assets'
+
+CHARTJS_CDN_URL = 'https://cdn.jsdelivr.net/npm/chart.js'
+# Für lokales Vendoring eine feste Version, damit der Hash stabil bleibt
+CHARTJS_VERSION = '4.4.1'
+CHARTJS_DOWNLOAD_URL = f'https://cdn.jsdelivr.net/npm/chart.js@{CHARTJS_VERSION}/dist/chart.umd.min.js'
+GOOGLE_FONTS_URL = 'https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap'
+
+def asset_name(stem: str, data: bytes, extension: str) -> str:
+    """Relativer Asset-Pfad mit Content-Hash (z.B. assets/dashboard.3f2a9c1b7d.css)"""
+    return f"{ASSETS_DIR}/{stem}.{hashlib.sha256(data).hexdigest()[:10]}.{extension}"
+
+class AssetPipeline:
+    """Sammelt Assets, vergibt Dateinamen mit Content-Hash und baut die passenden <link>/<script> Tags"""
+    
+    def __init__(self, extract: bool = False, vendor_chartjs: bool = False, google_fonts: bool = True,
+                 cache_dir: str = '.cache/assets', offline: bool = False):
+        self.logger = logging.getLogger(__name__)
+        self.extract = extract
+        self.vendor_chartjs = vendor_chartjs
+        self.google_fonts = google_fonts
+        self.cache_dir = cache_dir
+        self.offline = offline
+        
+        # Relativer Pfad (z.B. assets/dashboard.3f2a9c1b7d.css) -> Inhalt
+        self.assets: Dict[str, bytes] = {}
+        # Bereits eingebundene Scripts - jede URL nur einmal pro Seite
+        self._included_scripts: List[str] = []
+    
+    def add(self, stem: str, content: Union[str, bytes], extension: str) -> str:
+        """Registriert ein Asset und liefert seinen relativen Pfad (Hash im Namen = unbegrenzt cachebar)"""
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        name = asset_name(stem, data, extension)
+        self.assets[name] = data
+        return name
+    
+    def _load_chartjs(self) -> Optional[bytes]:
+        """Chart.js aus dem lokalen Cache, sonst einmalig herunterladen (None wenn nicht verfügbar)"""
+        cache_file = os.path.join(self.cache_dir, f'chart-{CHARTJS_VERSION}.umd.min.js')
+        if os.path.exists(cache_file):
+            with open(cache_file, 'rb') as f:
+                return f.read()
+        
+        if self.offline:
+            self.logger.warning(f"⚠️ Chart.js nicht im Cache ({cache_file}) - Offline Mode, nutze CDN")
+            return None
+        
+        try:
+            response = requests.get(CHARTJS_DOWNLOAD_URL, timeout=15)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.logger.warning(f"⚠️ Chart.js Download fehlgeschlagen ({e}) - nutze CDN")
+            return None
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            f.write(response.content)
+        return response.content
+    
+    def _script_tag(self, src: str) -> str:
+        """<script src> Tag - doppelte Einbindungen derselben URL werden weggelassen"""
+        if src in self._included_scripts:
+            return ''
+        self._included_scripts.append(src)
+        return f'<script src="{src}"></script>'
+    
+    def head_html(self, stylesheet: str, indent: str = '    ') -> str:
+        """Chart.js, Fonts und CSS für den <head>"""
+        tags = []
+        
+        chartjs_src = CHARTJS_CDN_URL
+        if self.vendor_chartjs:
+            chartjs = self._load_chartjs()
+            if chartjs is not None:
+                chartjs_src = self.add('chart', chartjs, 'js')
+        tags.append(self._script_tag(chartjs_src))
+        
+        if self.google_fonts:
+            tags.append(f'<link href="{GOOGLE_FONTS_URL}" rel="stylesheet">')
+        
+        if self.extract:
+            href = self.add('dashboard', stylesheet.strip() + '\n', 'css')
+            tags.append(f'<link rel="stylesheet" href="{href}">')
+        else:
+            tags.append(f'<style>{stylesheet}</style>')
+        
+        return f'\n{indent}'.join(tag for tag in tags if tag)
+    
+    def script_html(self, stem: str, script: str) -> str:
+        """Seiten-Script inline oder als Asset-Datei"""
+        if self.extract:
+            return self._script_tag(self.add(stem, script.strip() + '\n', 'js'))
+        return f'<script>{script}</script>'
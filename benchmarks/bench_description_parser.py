@@ -0,0 +1,101 @@
+# bench_description_parser.py
+# Micro-Benchmark + Korrektheits-Check: Single-Pass Description Parser vs. alte Regex-Kette
+#
+# Aufruf: python benchmarks/bench_description_parser.py [Wiederholungen]
+#
+# Gemessen beim Umstieg: legacy 38.3 µs, neu 31.9 µs pro Description (~1.2x). Nur ein Micro-Benchmark auf
+# dem synthetischen Korpus - pro Scrape-Lauf fällt das neben den HTTP Requests nicht ins Gewicht.
+
+import json
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from description_parser import parse_description
+
+# Der Korpus ist synthetisch: Descriptions im op.gg Format, nachgebaut aus den Spielern in docs/data.json
+# und den Beispielen im Scraper plus Randfälle. Echte mitgeschnittene op.gg Descriptions lagen beim Erstellen
+# nicht vor - sobald welche gesammelt sind, hier ergänzen bzw. ersetzen.
+CORPUS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'description_corpus.json')
+
+def legacy_parse(desc: str) -> dict:
+    """Alte Implementierung aus LoLScraper._extract_player_data (zum Vergleich)"""
+    data = {'tier': 'Unranked', 'rank': '', 'lp': 0, 'wins': 0, 'losses': 0, 'champions': []}
+    
+    tier_patterns = [
+        r'(Master|Grandmaster|Challenger)\s+\d+\s+(\d+)\s*LP',
+        r'(Iron|Bronze|Silver|Gold|Platinum|Diamond|Emerald)\s+(\d+)\s+\d+\s+(\d+)\s*LP',
+        r'(Iron|Bronze|Silver|Gold|Platinum|Diamond|Emerald)\s+(\d+)\s+(\d+)\s*LP',
+    ]
+    for pattern in tier_patterns:
+        match = re.search(pattern, desc, re.IGNORECASE)
+        if match:
+            tier = match.group(1).lower()
+            if tier in ['master', 'grandmaster', 'challenger']:
+                data['tier'] = tier.title()
+                data['rank'] = tier.title()
+                data['lp'] = int(match.group(2))
+            else:
+                data['tier'] = tier.title()
+                data['rank'] = f"{tier.title()} {match.group(2)}"
+                data['lp'] = int(match.group(3))
+            break
+    
+    wl_match = re.search(r'(\d+)Win\s+(\d+)Lose', desc)
+    if wl_match:
+        data['wins'] = int(wl_match.group(1))
+        data['losses'] = int(wl_match.group(2))
+    
+    champ_matches = re.findall(r'([A-Za-z\'\.\s&]+)\s*-\s*(\d+)Win\s+(\d+)Lose\s+Win\s+rate\s+(\d+)%', desc)
+    data['champions'] = [[name.strip(), int(w), int(l), int(wr)] for name, w, l, wr in champ_matches]
+    return data
+
+def new_parse(desc: str) -> dict:
+    parsed = parse_description(desc)
+    return {
+        'tier': parsed.tier,
+        'rank': parsed.rank,
+        'lp': parsed.lp,
+        'wins': parsed.wins,
+        'losses': parsed.losses,
+        'champions': [[c.name, c.wins, c.losses, c.win_rate] for c in parsed.champions]
+    }
+
+def check(name: str, parse, corpus) -> int:
+    """Vergleicht einen Parser mit den erwarteten Werten - gibt Anzahl korrekter Einträge zurück"""
+    correct = 0
+    for entry in corpus:
+        result = parse(entry['description'])
+        if result == entry['expected']:
+            correct += 1
+        else:
+            diff = {k: result[k] for k in result if result[k] != entry['expected'][k]}
+            print(f"  ✗ {name}: {entry['note']} -> {diff}")
+    return correct
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    
+    with open(CORPUS_FILE, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+    descriptions = [entry['description'] for entry in corpus]
+    
+    print(f"📚 Korpus: {len(corpus)} Descriptions")
+    legacy_correct = check('legacy', legacy_parse, corpus)
+    new_correct = check('neu', new_parse, corpus)
+    print(f"✅ Korrekt: legacy {legacy_correct}/{len(corpus)}, neu {new_correct}/{len(corpus)}")
+    
+    legacy_time = min(timeit.repeat(lambda: [legacy_parse(d) for d in descriptions], number=repeat, repeat=3))
+    new_time = min(timeit.repeat(lambda: [new_parse(d) for d in descriptions], number=repeat, repeat=3))
+    per_call = len(descriptions) * repeat
+    
+    print(f"⏱️ legacy: {legacy_time / per_call * 1e6:.2f} µs/Description")
+    print(f"⏱️ neu:    {new_time / per_call * 1e6:.2f} µs/Description ({legacy_time / new_time:.2f}x)")
+    
+    return 0 if new_correct == len(corpus) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+# champion_registry.py
+# Champion-Metadaten (Icon-Key, Klassen, Positionen, Aliase) einmal aus data/champions.json laden - O(1) Lookups
+
+import json
+import os
+import re
+import threading
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+CHAMPIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'champions.json')
+DDRAGON_CDN_URL = 'https://ddragon.leagueoflegends.com/cdn'
+
+# Data Dragon Positionen -> Rollen-Namen im Dashboard
+POSITION_ROLES = {
+    'BOTTOM': 'ADC',
+    'UTILITY': 'Support',
+    'JUNGLE': 'Jungle',
+    'MIDDLE': 'Mid',
+    'TOP': 'Top'
+}
+# Reihenfolge bei mehreren Kandidaten (wie bisher: ADC vor Support vor Jungle vor Mid vor Top)
+ROLE_PRIORITY = ('ADC', 'Support', 'Jungle', 'Mid', 'Top')
+
+def normalize_champion_name(name: str) -> str:
+    """'Kai'Sa', 'kaisa', 'KAI SA' -> 'kaisa'"""
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+class Champion(NamedTuple):
+    """Ein Champion aus der Data Dragon Liste"""
+    id: str
+    name: str
+    tags: Tuple[str, ...]
+    positions: Tuple[str, ...]
+    aliases: Tuple[str, ...]
+    
+    @property
+    def primary_role(self) -> Optional[str]:
+        """Rolle der Hauptposition (None wenn keine Position hinterlegt ist)"""
+        return POSITION_ROLES.get(self.positions[0]) if self.positions else None
+
+class ChampionRegistry:
+    """Alle Champions mit Lookup nach Anzeigename, normalisiertem Key und Alias"""
+    
+    def __init__(self, data: Dict):
+        self.version = data.get('version', '')
+        self.champions: Dict[str, Champion] = {}
+        self._by_name: Dict[str, Champion] = {}
+        self._by_key: Dict[str, Champion] = {}
+        
+        for champion_id, entry in data.get('data', {}).items():
+            champion = Champion(
+                id=entry.get('id', champion_id),
+                name=entry.get('name', champion_id),
+                tags=tuple(entry.get('tags', [])),
+                positions=tuple(entry.get('positions', [])),
+                aliases=tuple(entry.get('aliases', []))
+            )
+            self.champions[champion.id] = champion
+            self._by_name[champion.name] = champion
+            for key in (champion.id, champion.name, *champion.aliases):
+                self._by_key.setdefault(normalize_champion_name(key), champion)
+    
+    @classmethod
+    def from_file(cls, path: str = CHAMPIONS_FILE) -> 'ChampionRegistry':
+        """Lädt die Champion-Liste im Data Dragon Format"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+    
+    def __len__(self) -> int:
+        return len(self.champions)
+    
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+    
+    def get(self, name: str) -> Optional[Champion]:
+        """Champion zu Anzeigename, Data Dragon ID oder Alias (Groß-/Kleinschreibung und Sonderzeichen egal)"""
+        if not name:
+            return None
+        return self._by_name.get(name) or self._by_key.get(normalize_champion_name(name))
+    
+    def icon_key(self, name: str) -> str:
+        """Dateiname des Icons ohne .png - unbekannte Champions: Name ohne Sonderzeichen wie bisher"""
+        champion = self.get(name)
+        if champion is not None:
+            return champion.id
+        return ''.join(c for c in name if c.isalnum())
+    
+    @property
+    def icon_base_url(self) -> str:
+        """Basis-URL der Champion-Icons für die Patch-Version der Liste"""
+        return f"{DDRAGON_CDN_URL}/{self.version}/img/champion/"
+    
+    def icon_url(self, name: str) -> str:
+        """Icon-URL auf dem Riot CDN (Patch-Version aus der Champion-Liste)"""
+        return f"{self.icon_base_url}{self.icon_key(name) if name else 'MissingChampion'}.png"
+    
+    def primary_role(self, names: Iterable[str]) -> Optional[str]:
+        """Rolle aus den Hauptpositionen der Champions (bei mehreren nach ROLE_PRIORITY)"""
+        roles = set()
+        for name in names:
+            champion = self.get(name)
+            if champion is not None and champion.primary_role:
+                roles.add(champion.primary_role)
+        for role in ROLE_PRIORITY:
+            if role in roles:
+                return role
+        return None
+
+# Wird nur einmal pro Prozess geladen und von allen Generator-Instanzen geteilt
+_registry: Optional[ChampionRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_champion_registry() -> ChampionRegistry:
+    """Gemeinsame Registry aus data/champions.json"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ChampionRegistry.from_file()
+    return _registry
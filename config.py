@@ -13,9 +13,52 @@ TEAM_CONFIG = {
     }
 }
 
+# Scraper Konfiguration
+SCRAPER_CONFIG = {
+    "max_workers": 4,                           # Parallele Spieler-Requests
+    "requests_per_second": 1.0,                 # Token-Bucket Rate pro Host (gilt für alle Worker)
+    "burst": 2,                                 # Maximale Anzahl Requests am Stück
+    "max_attempts": 4,                          # Maximale Versuche pro Seite
+    "request_timeout": 15,                      # Timeout pro Versuch (Sekunden)
+    "retry_deadline": 45,                       # Gesamtzeit inkl. Retries pro Seite (Sekunden)
+    "stream_head": False,                       # Nur den <head> bis zur Description laden
+    "incremental": False,                       # Nur Spieler mit veralteten Daten neu scrapen
+    "max_age_minutes": 30,                      # Standard-Frische pro Spieler (überschreibbar pro Spieler)
+    "cache_enabled": False,                     # op.gg Seiten lokal cachen (ETag/Last-Modified)
+    "cache_dir": ".cache/opgg",                 # Cache-Verzeichnis
+    "cache_ttl": 300,                           # Sekunden ohne erneuten Request
+    "cache_max_entries": 500,                   # LRU-Limit: Anzahl Seiten
+    "cache_max_mb": 50,                         # LRU-Limit: Größe in MB
+}
+
+# Dauerbetrieb (python main.py --daemon)
+DAEMON_CONFIG = {
+    "cycle_interval": 60,                       # Sekunden zwischen zwei Zyklen
+    "async_deploy": True,                       # git push im Hintergrund, Zyklen warten nicht auf das Netzwerk
+    "deploy_timeout": 120,                      # Sekunden bis ein Deployment als hängend gilt
+}
+
+# Ausgabe der Website-Daten (docs/data.json)
+OUTPUT_CONFIG = {
+    "compact_json": False,                      # Minifiziert + spaltenweise Listen (kleinere data.json)
+    "split_players": False,                     # data.json als Manifest + docs/players/<spieler>.json
+    "precompress": False,                       # Zusätzlich .gz (und .br mit brotli) neben jede Datei
+    "client_render": False,                     # index.html als statische Shell, Browser rendert aus data.json
+    "extract_assets": False,                    # CSS/JS als gehashte Dateien unter docs/assets/ statt inline
+    "vendor_chartjs": False,                    # Chart.js einmalig laden und selbst ausliefern statt CDN
+    "google_fonts": True,                       # Inter Font von Google Fonts laden (False = System-Fonts)
+    "local_icons": False,                       # Champion-Icons lokal cachen + als Sprite/Data URIs ausliefern
+    "offline_icons": False,                     # Nur vorhandenen Icon-Cache (.cache/icons) nutzen, nichts laden
+}
+
 # GitHub Konfiguration (EINMALIG AUSFÜLLEN)
 GITHUB_CONFIG = {
     "username": "ricardoschneider93",           # Dein GitHub Username
     "repo_name": "lol-team-stats",              # Repository Name
     "token": "",                                # NICHT HIER! Token steht sicher in github_token.txt
+    "deploy_mode": "full",                      # full: git add . (Standard), scoped: nur geänderte docs/ Dateien committen,
+                                                # plumbing: wie scoped ohne add/commit, Push nur bei neuem Tree,
+                                                # gh-pages: nur docs/ auf eigene Branch (siehe pages_*)
+    "pages_branch": "gh-pages",                 # Ziel-Branch für deploy_mode "gh-pages"
+    "pages_keep_last": 10,                      # Deployments in der History behalten (1 = immer nur ein Commit)
 }
\ No newline at end of file
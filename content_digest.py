@@ -0,0 +1,50 @@
+# content_digest.py
+# Inhalts-Hash der gescrapten Daten - erkennt Läufe ohne echte Änderung und überspringt Rendern + Deployment
+
+import hashlib
+import json
+import os
+from typing import Dict, Union
+
+# Liegt neben index.html / data.json im Output-Verzeichnis
+DIGEST_FILE = '.content-digest.json'
+
+# Felder die sich bei jedem Lauf ändern, ohne dass sich an den Daten etwas geändert hat
+RUN_FIELDS = ('last_updated', 'refreshed_count', 'reused_count', 'fallback_count')
+# recent_games ist per Seed aus den gescrapten Daten abgeleitet und bleibt deshalb Teil des Digests
+VOLATILE_PLAYER_FIELDS = ('last_updated',)
+
+def hash_content(content: Union[str, bytes]) -> str:
+    """SHA-256 eines Textes (UTF-8) oder Byte-Inhalts"""
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    return hashlib.sha256(data).hexdigest()
+
+def compute_digest(team_data: Dict, salt: str = '') -> str:
+    """Deterministischer Hash über alle gescrapten Inputs (ohne Zeitstempel und Laufzähler)"""
+    relevant = {key: value for key, value in team_data.items() if key not in RUN_FIELDS and key != 'players'}
+    relevant['players'] = {
+        riot_id: {key: value for key, value in record.items() if key not in VOLATILE_PLAYER_FIELDS}
+        for riot_id, record in team_data.get('players', {}).items()
+    }
+    # salt = Template/Generator-Version, damit Template-Änderungen neu gerendert werden
+    canonical = json.dumps([salt, relevant], sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hash_content(canonical)
+
+def compute_freshness(team_data: Dict) -> str:
+    """Hash über die Zeitstempel der Spieler - ändert sich, wenn Spieler ohne neue Daten neu gescraped wurden"""
+    timestamps = {riot_id: record.get('last_updated', '') for riot_id, record in team_data.get('players', {}).items()}
+    return hash_content(json.dumps(timestamps, sort_keys=True, ensure_ascii=False))
+
+def load_manifest(output_dir: str) -> Dict:
+    """Letzter Digest + Artefakt-Hashes aus dem Output-Verzeichnis (leer wenn nicht vorhanden)"""
+    path = os.path.join(output_dir, DIGEST_FILE)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def render_manifest(digest: str, artifacts: Dict[str, str], freshness: str = '') -> str:
+    """Manifest-Inhalt (Digest, Zeitstempel-Hash + Hash pro Artefakt) für den nächsten Lauf"""
+    return json.dumps({'digest': digest, 'freshness': freshness, 'artifacts': artifacts}, indent=2, sort_keys=True)
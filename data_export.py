@@ -0,0 +1,152 @@
+# data_export.py
+# Kompakte data.json: minifiziert, spaltenweise Listen, optional eine Datei pro Spieler + vorkomprimierte Varianten
+
+import gzip
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# .br Varianten nur mit brotli (requirements-optional.txt), sonst nur .gz
+BROTLI_AVAILABLE = brotli is not None
+
+COMPACT_FORMAT = 'compact-v1'
+SPLIT_FORMAT = 'split-v1'
+PLAYERS_DIR = 'players'
+
+# Listen von Dicts, die spaltenweise gespeichert werden (Keys nur einmal statt pro Eintrag)
+COLUMNAR_FIELDS = ('recent_games', 'main_champions', 'enhanced_champions')
+# enhanced_champions wiederholt name/games aus main_champions - im Compact-Format nur einmal
+SHARED_CHAMPION_FIELDS = ('name', 'games')
+
+# Felder, die im Split-Manifest pro Spieler direkt mitgeliefert werden (Übersicht + Leaderboards ohne Spieler-Datei)
+SUMMARY_FIELDS = (
+    'summoner_name', 'tier', 'rank', 'lp', 'wins', 'losses', 'total_games', 'win_rate', 'lane', 'last_updated',
+    'avg_gold', 'avg_cs', 'vision_score', 'avg_damage', 'kda_ratio', 'kill_participation'
+)
+
+def to_columns(rows: List[Dict]) -> Dict[str, List]:
+    """[{a: 1, b: 2}, {a: 3, b: 4}] -> {a: [1, 3], b: [2, 4]}"""
+    keys: List[str] = []
+    for row in rows:
+        for key in row:
+            if key not in keys:
+                keys.append(key)
+    return {key: [row.get(key) for row in rows] for key in keys}
+
+def from_columns(columns: Dict[str, List]) -> List[Dict]:
+    """Umkehrung von to_columns (None = Feld fehlte im Original)"""
+    length = max((len(values) for values in columns.values()), default=0)
+    return [
+        {key: values[i] for key, values in columns.items() if i < len(values) and values[i] is not None}
+        for i in range(length)
+    ]
+
+def compact_player(player: Dict) -> Dict:
+    """Spieler-Datensatz im Compact-Format"""
+    compact = dict(player)
+    for field in COLUMNAR_FIELDS:
+        if isinstance(compact.get(field), list):
+            rows = compact[field]
+            if field == 'enhanced_champions' and 'main_champions' in player:
+                rows = [{k: v for k, v in row.items() if k not in SHARED_CHAMPION_FIELDS} for row in rows]
+            compact[field] = to_columns(rows)
+    return compact
+
+def expand_player(player: Dict) -> Dict:
+    """Compact-Datensatz zurück ins normale Format"""
+    expanded = dict(player)
+    for field in COLUMNAR_FIELDS:
+        if isinstance(expanded.get(field), dict):
+            expanded[field] = from_columns(expanded[field])
+    
+    champions = expanded.get('main_champions')
+    enhanced = expanded.get('enhanced_champions')
+    if isinstance(champions, list) and isinstance(enhanced, list) and isinstance(player.get('enhanced_champions'), dict):
+        expanded['enhanced_champions'] = [
+            {**{k: champ[k] for k in SHARED_CHAMPION_FIELDS if k in champ}, **extra}
+            for champ, extra in zip(champions, enhanced)
+        ]
+    return expanded
+
+def dump_json(data: Dict, compact: bool) -> str:
+    """JSON minifiziert (compact) oder wie bisher mit indent=2"""
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+def player_filename(riot_id: str) -> str:
+    """Stabiler, URL-sicherer Dateiname pro Spieler (Slug + kurzer Hash gegen Kollisionen)"""
+    slug = re.sub(r'[^a-z0-9]+', '-', riot_id.lower()).strip('-') or 'player'
+    short_hash = hashlib.sha1(riot_id.encode('utf-8')).hexdigest()[:8]
+    return f"{PLAYERS_DIR}/{slug}-{short_hash}.json"
+
+def build_data_artifacts(team_data: Dict, compact: bool = True, split_players: bool = False) -> Dict[str, str]:
+    """Erzeugt data.json (+ optional players/*.json) als {relativer Pfad: Inhalt}"""
+    team_fields = {key: value for key, value in team_data.items() if key != 'players'}
+    players = team_data.get('players', {})
+    
+    if not compact and not split_players:
+        return {'data.json': dump_json(team_data, compact=False)}
+    
+    if not split_players:
+        compact_data = {'format': COMPACT_FORMAT, **team_fields}
+        compact_data['players'] = {riot_id: compact_player(record) for riot_id, record in players.items()}
+        return {'data.json': dump_json(compact_data, compact=True)}
+    
+    # Split: kleines Manifest + eine Datei pro Spieler
+    artifacts = {}
+    manifest_players = {}
+    for riot_id, record in players.items():
+        filename = player_filename(riot_id)
+        content = dump_json(compact_player(record) if compact else record, compact=compact)
+        artifacts[filename] = content
+        manifest_players[riot_id] = {
+            'file': filename,
+            'hash': hashlib.sha256(content.encode('utf-8')).hexdigest()[:16],
+            **{key: record[key] for key in SUMMARY_FIELDS if key in record}
+        }
+    
+    manifest = {'format': SPLIT_FORMAT, 'compact': compact, **team_fields, 'players': manifest_players}
+    artifacts = {'data.json': dump_json(manifest, compact=compact), **artifacts}
+    return artifacts
+
+def compress_variants(content: bytes) -> Dict[str, bytes]:
+    """Vorkomprimierte Varianten für statische Hosts (.gz immer, .br wenn brotli installiert ist)"""
+    # mtime=0: gleicher Inhalt ergibt byte-identische .gz Dateien
+    variants = {'.gz': gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(content)
+    return variants
+
+def load_team_data(data_file: str) -> Optional[Dict]:
+    """Liest data.json in allen Formaten (normal, compact, split) und liefert das normale Format"""
+    with open(data_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        return None
+    
+    data_format = data.pop('format', None)
+    if data_format == COMPACT_FORMAT:
+        data['players'] = {riot_id: expand_player(record) for riot_id, record in data.get('players', {}).items()}
+    elif data_format == SPLIT_FORMAT:
+        compact = data.pop('compact', False)
+        base_dir = os.path.dirname(data_file)
+        players = {}
+        for riot_id, entry in data.get('players', {}).items():
+            try:
+                with open(os.path.join(base_dir, entry['file']), 'r', encoding='utf-8') as f:
+                    record = json.load(f)
+            except (OSError, ValueError, KeyError, TypeError):
+                # Fehlende Spieler-Datei: Spieler auslassen (wird im Incremental Mode neu gescraped)
+                continue
+            players[riot_id] = expand_player(record) if compact else record
+        data['players'] = players
+    
+    return data
@@ -0,0 +1,195 @@
+# deploy_queue.py
+# Deployment im Hintergrund: Scrape/Render-Zyklen warten nie auf git push, wartende Deployments werden zusammengefasst
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+from github_manager import GitHubManager
+
+class DeployQueue:
+    """Ein Worker-Thread, höchstens ein wartendes Deployment (das neueste gewinnt, geänderte Pfade werden vereinigt)"""
+    
+    def __init__(self, github_manager: GitHubManager, timeout: float = 120, retry_delay: float = 10,
+                 max_retry_delay: float = 600):
+        self.logger = logging.getLogger(__name__)
+        self.github_manager = github_manager
+        self.timeout = timeout
+        # Backoff für Wiederholungen: retry_delay, verdoppelt pro Fehlschlag, höchstens max_retry_delay
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        
+        self._condition = threading.Condition()
+        # None = nichts wartet, sonst Pfade für das nächste Deployment (Reihenfolge egal, keine Duplikate)
+        self._pending: Optional[Dict[str, None]] = None
+        self._busy = False
+        self._stopping = False
+        self._worker: Optional[threading.Thread] = None
+        # Pfade fehlgeschlagener Deployments - der Worker versucht sie nach _retry_at erneut (oder früher mit submit())
+        self._retry_paths: Dict[str, None] = {}
+        self._retry_at = 0.0
+        self._failures_in_row = 0
+        # Deployment, das sein Timeout überschritten hat und noch läuft - kein zweites parallel starten
+        self._overdue: Optional[threading.Thread] = None
+        
+        self.submitted = 0
+        self.coalesced = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.timeouts = 0
+        # Deployments, die übersprungen wurden, weil ein vorheriges nach seinem Timeout immer noch lief
+        self.stuck = 0
+        self.retries = 0
+        self.last_latency = 0.0
+        self.total_latency = 0.0
+        self.last_url = ''
+    
+    def start(self):
+        """Startet den Worker (einmalig)"""
+        with self._condition:
+            if self._worker is not None:
+                return
+            self._stopping = False
+            self._worker = threading.Thread(target=self._run, name='deploy-queue', daemon=True)
+            self._worker.start()
+    
+    def submit(self, paths: List[str]):
+        """Reiht ein Deployment ein und kehrt sofort zurück"""
+        with self._condition:
+            self.submitted += 1
+            if self._pending is None:
+                self._pending = {}
+            else:
+                # Es wartet schon eins: zusammenfassen, der Stand auf der Platte ist ohnehin der neueste
+                self.coalesced += 1
+            self._pending.update(self._retry_paths)
+            self._pending.update(dict.fromkeys(paths))
+            self._retry_paths = {}
+            self._condition.notify_all()
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Blockiert bis nichts mehr wartet oder läuft (False bei Timeout)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending is not None or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+    
+    def stop(self, timeout: Optional[float] = None):
+        """Arbeitet wartende Deployments noch ab und beendet dann den Worker"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+    
+    def _run(self):
+        """Worker: nimmt immer das aktuell wartende (zusammengefasste) Deployment"""
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopping:
+                    if self._retry_paths:
+                        remaining = self._retry_at - time.monotonic()
+                        if remaining <= 0:
+                            self._pending = self._retry_paths
+                            self._retry_paths = {}
+                            self.retries += 1
+                            break
+                        self._condition.wait(remaining)
+                    else:
+                        self._condition.wait()
+                if self._pending is None:
+                    if self._retry_paths:
+                        self.logger.warning(f"⚠️ {len(self._retry_paths)} Dateien nicht deployt - Worker beendet")
+                    return
+                paths = list(self._pending)
+                self._pending = None
+                self._busy = True
+            
+            try:
+                self._deploy(paths)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+    
+    def _deploy(self, paths: List[str]):
+        """Ein Deployment mit Timeout - ein hängender Push blockiert nur die Queue, nie den Scheduler"""
+        if self._overdue is not None:
+            # Vorheriges Deployment hängt noch: erst abwarten, sonst laufen zwei git Prozesse gleichzeitig -
+            # höchstens ein Timeout lang, danach bleibt die Queue ansprechbar und versucht es später erneut
+            self._overdue.join(self.timeout)
+            if self._overdue.is_alive():
+                with self._condition:
+                    self.stuck += 1
+                    delay = self._schedule_retry(paths)
+                self.logger.error(f"🧊 Vorheriges Deployment hängt seit über {2 * self.timeout:.0f}s - "
+                                  f"überspringe Deployment{f', nächster Versuch in {delay:.0f}s' if delay else ''}")
+                return
+            self._overdue = None
+        
+        outcome = {}
+        
+        def target():
+            try:
+                outcome['result'] = self.github_manager.full_deployment(paths)
+            except Exception as e:
+                outcome['error'] = e
+        
+        started = time.monotonic()
+        thread = threading.Thread(target=target, name='deploy', daemon=True)
+        thread.start()
+        thread.join(self.timeout)
+        latency = time.monotonic() - started
+        
+        with self._condition:
+            self.last_latency = latency
+            self.total_latency += latency
+            
+            if thread.is_alive():
+                self._overdue = thread
+                self.timeouts += 1
+                self._schedule_retry(paths)
+                self.logger.warning(f"⏱️ Deployment nach {self.timeout:.0f}s noch nicht fertig - Push läuft im Hintergrund weiter")
+                return
+            
+            success, url = outcome.get('result', (False, ''))
+            if success:
+                self.succeeded += 1
+                self._failures_in_row = 0
+                self.last_url = url
+                self.logger.info(f"🌐 Deployment fertig in {latency:.1f}s ({len(paths)} Dateien): {url}")
+            else:
+                delay = self._schedule_retry(paths)
+                error = outcome.get('error')
+                self.logger.warning(f"⚠️ Deployment fehlgeschlagen nach {latency:.1f}s{f': {error}' if error else ''}"
+                                    f"{f' - nächster Versuch in {delay:.0f}s' if delay else ''}")
+    
+    def _schedule_retry(self, paths: List[str]) -> float:
+        """Fehlgeschlagene Pfade erneut einplanen (mit _condition gehalten) - liefert die Wartezeit in Sekunden"""
+        self.failed += 1
+        self._failures_in_row += 1
+        if self._pending is not None:
+            # Es wartet schon ein neueres Deployment: Pfade dort mitschicken, kein eigener Versuch
+            self._pending.update(dict.fromkeys(paths))
+            return 0.0
+        delay = min(self.max_retry_delay, self.retry_delay * 2 ** (self._failures_in_row - 1))
+        self._retry_paths.update(dict.fromkeys(paths))
+        self._retry_at = time.monotonic() + delay
+        return delay
+    
+    @property
+    def average_latency(self) -> float:
+        """Durchschnittliche Dauer eines Deployments in Sekunden"""
+        finished = self.succeeded + self.failed
+        return self.total_latency / finished if finished else 0.0
+    
+    def summary(self) -> str:
+        """Kurze Zusammenfassung für das Log"""
+        return (f"{self.succeeded} ok, {self.failed} fehlgeschlagen ({self.timeouts} Timeouts, {self.stuck} hängend), "
+                f"{self.retries} Wiederholungen, {self.coalesced} zusammengefasst, Ø {self.average_latency:.1f}s")
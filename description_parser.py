@@ -0,0 +1,91 @@
+# description_parser.py
+# Single-Pass Parser für die op.gg Meta-Description (Rank, Win/Loss, Champion Stats)
+
+import re
+from dataclasses import dataclass, field
+from typing import List
+
+# Apex Tiers haben keine Division - "Master 1 47LP" bedeutet nur 47 LP
+APEX_TIERS = ('Master', 'Grandmaster', 'Challenger')
+
+# Ein Regex für alle Tokens, einmal beim Import kompiliert.
+# Beispiel: "cl1ck9r#EUWES / Master 1 47LP / 59Win 43Lose Win rate 58% / Viego - 24Win 14Lose Win rate 63%, ..."
+_TOKEN_PATTERN = re.compile(
+    r"""
+    \b(?P<tier>(?i:iron|bronze|silver|gold|platinum|emerald|diamond|master|grandmaster|challenger))
+        \s+(?:(?P<division>\d+)(?:\s+\d+)*?\s+)?(?P<lp>\d{1,3}(?:,\d{3})+|\d+)\s*(?i:lp)
+    |
+    (?P<champion>[^\W\d_][^/,%]*?)\s*-\s*
+        (?P<champion_wins>\d+)Win\s+(?P<champion_losses>\d+)Lose\s+Win\s+rate\s+(?P<champion_win_rate>\d+)%
+    |
+    (?P<wins>\d+)Win\s+(?P<losses>\d+)Lose
+    """,
+    re.VERBOSE
+)
+
+@dataclass(frozen=True)
+class ChampionStats:
+    """Champion-Eintrag aus der Description"""
+    name: str
+    wins: int
+    losses: int
+    win_rate: int
+    
+    @property
+    def games(self) -> int:
+        return self.wins + self.losses
+
+@dataclass
+class DescriptionStats:
+    """Geparste Description eines Spielers"""
+    tier: str = 'Unranked'
+    division: str = ''
+    lp: int = 0
+    wins: int = 0
+    losses: int = 0
+    champions: List[ChampionStats] = field(default_factory=list)
+    
+    @property
+    def rank(self) -> str:
+        if self.tier == 'Unranked':
+            return ''
+        if self.tier in APEX_TIERS or not self.division:
+            return self.tier
+        return f"{self.tier} {self.division}"
+    
+    @property
+    def total_games(self) -> int:
+        return self.wins + self.losses
+    
+    @property
+    def win_rate(self) -> int:
+        return round((self.wins / self.total_games) * 100) if self.total_games > 0 else 0
+
+def parse_description(description: str) -> DescriptionStats:
+    """Zerlegt die Description in einem Durchlauf (erster Rank und erste Gesamtbilanz gewinnen)"""
+    stats = DescriptionStats()
+    has_rank = False
+    has_record = False
+    
+    for match in _TOKEN_PATTERN.finditer(description):
+        if match.group('tier') is not None:
+            if has_rank:
+                continue
+            has_rank = True
+            stats.tier = match.group('tier').title()
+            stats.lp = int(match.group('lp').replace(',', ''))
+            if stats.tier not in APEX_TIERS:
+                stats.division = match.group('division') or ''
+        elif match.group('champion') is not None:
+            stats.champions.append(ChampionStats(
+                name=match.group('champion').strip().replace('’', "'"),
+                wins=int(match.group('champion_wins')),
+                losses=int(match.group('champion_losses')),
+                win_rate=int(match.group('champion_win_rate'))
+            ))
+        elif not has_record:
+            has_record = True
+            stats.wins = int(match.group('wins'))
+            stats.losses = int(match.group('losses'))
+    
+    return stats
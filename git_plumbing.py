@@ -0,0 +1,198 @@
+# git_plumbing.py
+# Deployment über git Plumbing: eigener Index, write-tree/commit-tree/update-ref statt add/commit, Push nur bei neuem Tree
+
+import json
+import logging
+import os
+import subprocess
+from typing import Dict, List, NamedTuple, Optional
+
+STATE_FILE = 'lol-stats-deploy.json'
+INDEX_FILE = 'lol-stats-deploy.index'
+PAGES_STATE_FILE = 'lol-stats-pages.json'
+PAGES_INDEX_FILE = 'lol-stats-pages.index'
+# Interne Dateien im Ausgabeverzeichnis (in jedem Unterordner), die nicht auf die Pages-Branch gehören:
+# Digest-Manifest und Temp-Dateien des OutputWriter
+PAGES_EXCLUDE = ('**/.content-digest.json', '**/.*.tmp')
+
+class DeployResult(NamedTuple):
+    """Ergebnis eines Plumbing-Deployments"""
+    commit: str
+    tree: str
+    committed: bool
+    pushed: bool
+
+class PlumbingDeployer:
+    """Baut Deploy-Commits direkt aus den geänderten Dateien - der normale Index des Benutzers bleibt unberührt"""
+    
+    state_file = STATE_FILE
+    index_file = INDEX_FILE
+    # Pages-Branch wird umgeschrieben (History-Limit) und braucht deshalb einen Force-Push
+    force_push = False
+    
+    def __init__(self, branch: str = 'main', remote: str = 'origin', push_timeout: float = 30,
+                 push_env: Optional[Dict[str, str]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.branch = branch
+        self.remote = remote
+        self.push_timeout = push_timeout
+        # Environment nur für den Push (Credentials), alle anderen Aufrufe laufen lokal
+        self.push_env = push_env
+        
+        self.git_dir = self._git('rev-parse', '--git-dir').strip()
+        self.state_path = os.path.join(self.git_dir, self.state_file)
+        # Eigener Index: bleibt zwischen den Läufen auf dem Stand des letzten Deploy-Commits
+        self.index_path = os.path.abspath(os.path.join(self.git_dir, self.index_file))
+        self.state = self._load_state()
+    
+    def _git(self, *args: str, input: Optional[str] = None, index: bool = False, timeout: Optional[float] = None,
+             env: Optional[Dict[str, str]] = None) -> str:
+        """git Aufruf (index=True: mit dem Deploy-Index statt .git/index)"""
+        if index:
+            env = {**(env or os.environ), 'GIT_INDEX_FILE': self.index_path}
+        result = subprocess.run(['git', *args], input=input, env=env, check=True,
+                                capture_output=True, text=True, timeout=timeout)
+        return result.stdout
+    
+    def _load_state(self) -> Dict[str, str]:
+        """Zuletzt gebauter Commit/Tree und zuletzt gepushter Tree"""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+    
+    def _save_state(self):
+        """State atomar in .git/ speichern (wird nicht mit deployt)"""
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+    
+    def _head(self) -> str:
+        """Aktueller Commit des Deploy-Branches ('' wenn es noch keinen gibt)"""
+        try:
+            return self._git('rev-parse', '--verify', '--quiet', f'refs/heads/{self.branch}').strip()
+        except subprocess.CalledProcessError:
+            return ''
+    
+    def _update_index(self, paths: List[str], index: bool):
+        """Übernimmt paths aus dem Working Tree in den Index (fehlende Dateien werden entfernt)"""
+        self._git('update-index', '--add', '--remove', '-z', '--stdin', input=''.join(f'{path}\0' for path in paths),
+                  index=index)
+    
+    def commit(self, paths: List[str], message: str = 'Update LoL Team Stats') -> DeployResult:
+        """Erstellt einen Commit mit den geänderten paths auf dem Branch (ohne git add/commit)"""
+        head = self._head()
+        
+        # Deploy-Index nur neu aufbauen, wenn jemand anderes den Branch bewegt hat
+        if head != self.state.get('commit') or not os.path.exists(self.index_path):
+            if head:
+                self._git('read-tree', head, index=True)
+            else:
+                self._git('read-tree', '--empty', index=True)
+            self.state['tree'] = self._git('rev-parse', f'{head}^{{tree}}').strip() if head else ''
+            self.state['commit'] = head
+        
+        if paths:
+            self._update_index(paths, index=True)
+        tree = self._git('write-tree', index=True).strip()
+        
+        if tree == self.state.get('tree'):
+            self._save_state()
+            return DeployResult(head, tree, False, False)
+        
+        parent_args = ['-p', head] if head else []
+        commit = self._git('commit-tree', tree, *parent_args, '-m', message).strip()
+        # Compare-and-swap: schlägt fehl, falls der Branch inzwischen bewegt wurde
+        self._git('update-ref', '-m', message, f'refs/heads/{self.branch}', commit, head or '0' * 40)
+        # Normalen Index für diese Pfade nachziehen, sonst zeigt git status die alten Versionen als staged
+        if paths:
+            self._update_index(paths, index=False)
+        
+        self.state.update({'commit': commit, 'tree': tree})
+        self._save_state()
+        return DeployResult(commit, tree, True, False)
+    
+    @property
+    def needs_push(self) -> bool:
+        """True wenn der zuletzt gebaute Tree noch nicht erfolgreich gepusht wurde"""
+        return bool(self.state.get('tree')) and self.state.get('tree') != self.state.get('pushed_tree')
+    
+    def push(self):
+        """Pusht den Branch und merkt sich den gepushten Tree (CalledProcessError/TimeoutExpired bei Fehlern)"""
+        refspec = f"{'+' if self.force_push else ''}refs/heads/{self.branch}:refs/heads/{self.branch}"
+        self._git('push', self.remote, refspec, timeout=self.push_timeout, env=self.push_env)
+        self.state['pushed_tree'] = self.state.get('tree', '')
+        self._save_state()
+    
+    def deploy(self, paths: List[str], message: str = 'Update LoL Team Stats') -> DeployResult:
+        """Commit bauen und nur pushen, wenn sich der Tree seit dem letzten Push geändert hat"""
+        if not paths and not self.needs_push and self.state.get('commit'):
+            # Nichts geändert und alles gepusht: kein einziger git Aufruf
+            return DeployResult(self.state['commit'], self.state.get('tree', ''), False, False)
+        result = self.commit(paths, message)
+        if not self.needs_push:
+            return result
+        self.push()
+        return result._replace(pushed=True)
+
+class PagesDeployer(PlumbingDeployer):
+    """Schreibt nur die generierte Seite (Inhalt von site_dir) auf eine eigene Branch mit begrenzter History"""
+    
+    state_file = PAGES_STATE_FILE
+    index_file = PAGES_INDEX_FILE
+    force_push = True
+    
+    def __init__(self, site_dir: str = 'docs', branch: str = 'gh-pages', keep_last: int = 10, remote: str = 'origin',
+                 push_timeout: float = 30, push_env: Optional[Dict[str, str]] = None):
+        super().__init__(branch=branch, remote=remote, push_timeout=push_timeout, push_env=push_env)
+        self.site_dir = site_dir
+        # 1 = jedes Deployment ist ein einzelner Commit ohne Vorgänger (squash)
+        self.keep_last = max(1, keep_last)
+    
+    def _build_tree(self) -> str:
+        """Tree aus site_dir - der Index bleibt erhalten, git hasht nur Dateien mit geändertem stat"""
+        excludes = [f':(exclude,glob){pattern}' for pattern in PAGES_EXCLUDE]
+        self._git(f'--work-tree={self.site_dir}', 'add', '--all', '--', '.', *excludes, index=True)
+        # Kein Jekyll Build auf GitHub Pages - die Seite ist schon fertig
+        blob = self._git('hash-object', '-w', '--stdin', input='').strip()
+        self._git('update-index', '--add', '--cacheinfo', f'100644,{blob},.nojekyll', index=True)
+        return self._git('write-tree', index=True).strip()
+    
+    def _history(self, head: str) -> List[List[str]]:
+        """[Tree, Autor-Datum, Nachricht] der letzten keep_last - 1 Commits (älteste zuerst)"""
+        if not head or self.keep_last < 2:
+            return []
+        log = self._git('log', f'--max-count={self.keep_last - 1}', '--format=%T%x1f%aI%x1f%s%x1e', head)
+        entries = [entry.strip('\n').split('\x1f') for entry in log.split('\x1e') if entry.strip()]
+        return list(reversed(entries))
+    
+    def commit(self, paths: List[str], message: str = 'Update LoL Team Stats') -> DeployResult:
+        """Neuer Commit mit dem aktuellen site_dir - ältere Commits als keep_last fallen weg"""
+        head = self._head()
+        head_tree = self._git('rev-parse', f'{head}^{{tree}}').strip() if head else ''
+        tree = self._build_tree()
+        if tree == head_tree:
+            self.state.update({'commit': head, 'tree': tree})
+            self._save_state()
+            return DeployResult(head, tree, False, False)
+        
+        parent = head
+        depth = int(self._git('rev-list', '--count', head).strip()) if head else 0
+        if depth >= self.keep_last:
+            # History neu aufbauen: nur die letzten keep_last - 1 Trees als Vorgänger behalten
+            parent = ''
+            for old_tree, date, old_message in self._history(head):
+                env = {**os.environ, 'GIT_AUTHOR_DATE': date, 'GIT_COMMITTER_DATE': date}
+                parent_args = ['-p', parent] if parent else []
+                parent = self._git('commit-tree', old_tree, *parent_args, '-m', old_message, env=env).strip()
+        
+        parent_args = ['-p', parent] if parent else []
+        commit = self._git('commit-tree', tree, *parent_args, '-m', message).strip()
+        self._git('update-ref', '-m', message, f'refs/heads/{self.branch}', commit, head or '0' * 40)
+        
+        self.state.update({'commit': commit, 'tree': tree})
+        self._save_state()
+        return DeployResult(commit, tree, True, False)
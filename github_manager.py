@@ -5,17 +5,41 @@ import requests
 import subprocess
 import os
 import logging
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from git_plumbing import PagesDeployer, PlumbingDeployer
 
 class GitHubManager:
     """Automatische GitHub Repository Erstellung und Verwaltung"""
     
-    def __init__(self, username: str, token: str, repo_name: str):
+    # full: git add . wie bisher, scoped: nur die vom Generator gemeldeten Dateien,
+    # plumbing: wie scoped, aber Commit direkt über write-tree/commit-tree (siehe git_plumbing.py),
+    # gh-pages: nur die generierte Seite auf eine eigene Branch mit begrenzter History
+    DEPLOY_MODES = ('full', 'scoped', 'plumbing', 'gh-pages')
+    # Jeder git Aufruf ist begrenzt - ein hängender Prozess darf die Deploy-Queue nicht für immer blockieren
+    GIT_TIMEOUT = 30
+    PUSH_TIMEOUT = 30
+    
+    def __init__(self, username: str, token: str, repo_name: str, deploy_mode: str = 'full',
+                 pages_dir: str = 'docs', pages_branch: str = 'gh-pages', pages_keep_last: int = 10):
         self.username = username
         self.token = token
         self.repo_name = repo_name
         self.logger = logging.getLogger(__name__)
         
+        # Nur für deploy_mode gh-pages: Quelle, Ziel-Branch und wie viele Deployments die Branch behält
+        self.pages_dir = pages_dir
+        self.pages_branch = pages_branch
+        self.pages_keep_last = pages_keep_last
+        
+        if deploy_mode not in self.DEPLOY_MODES:
+            raise ValueError(f"Unbekannter deploy_mode: {deploy_mode} (erlaubt: {', '.join(self.DEPLOY_MODES)})")
+        self.deploy_mode = deploy_mode
+        # setup_local_git() prüft Branch und Remote nur einmal pro Instanz (Daemon: einmal pro Prozess)
+        self._git_ready = False
+        # Wird beim ersten Plumbing-Deployment angelegt (braucht ein bestehendes Git Repository)
+        self.deployer: Optional[PlumbingDeployer] = None
+        
         self.headers = {
             'Authorization': f'token {token}',
             'Accept': 'application/vnd.github.v3+json'
@@ -33,50 +57,165 @@ class GitHubManager:
             self.logger.error(f"❌ Fehler bei Repository Erstellung: {e}")
             return False
     
+    @property
+    def remote_url(self) -> str:
+        """Remote-URL ohne Token (Credentials kommen erst beim Push über push_env dazu)"""
+        return f"https://github.com/{self.username}/{self.repo_name}.git"
+    
+    def push_env(self) -> Dict[str, str]:
+        """Environment für git push: Token über einen Credential Helper aus der Umgebung statt in .git/config"""
+        # GIT_CONFIG_COUNT/KEY/VALUE (git >= 2.31): erst alle Helper zurücksetzen, dann nur unseren verwenden
+        helper = '!f() { test "$1" = get && echo "username=$LOL_STATS_GIT_USER" && echo "password=$LOL_STATS_GIT_TOKEN"; }; f'
+        return {
+            **os.environ,
+            'LOL_STATS_GIT_USER': self.username,
+            'LOL_STATS_GIT_TOKEN': self.token,
+            'GIT_CONFIG_COUNT': '2',
+            'GIT_CONFIG_KEY_0': 'credential.helper',
+            'GIT_CONFIG_VALUE_0': '',
+            'GIT_CONFIG_KEY_1': 'credential.helper',
+            'GIT_CONFIG_VALUE_1': helper,
+            'GIT_TERMINAL_PROMPT': '0'
+        }
+    
     def setup_local_git(self) -> bool:
-        """Konfiguriert lokales Git Repository"""
+        """Konfiguriert lokales Git Repository (prüft einmal pro Instanz, ändert nur was nicht passt)"""
+        if self._git_ready:
+            return True
+        
         try:
             # Git init (falls noch nicht gemacht)
             if not os.path.exists('.git'):
-                subprocess.run(['git', 'init'], check=True, capture_output=True)
+                subprocess.run(['git', 'init'], check=True, capture_output=True, timeout=self.GIT_TIMEOUT)
                 self.logger.info("🔧 Git Repository initialisiert")
             
-            # Branch auf main setzen
-            subprocess.run(['git', 'branch', '-M', 'main'], check=True, capture_output=True)
+            # Branch nur umbenennen, wenn er nicht schon main heißt
+            branch = subprocess.run(['git', 'symbolic-ref', '--short', 'HEAD'], capture_output=True, text=True,
+                                    timeout=self.GIT_TIMEOUT)
+            if branch.stdout.strip() != 'main':
+                subprocess.run(['git', 'branch', '-M', 'main'], check=True, capture_output=True, timeout=self.GIT_TIMEOUT)
             
-            # Remote hinzufügen/aktualisieren mit korrektem Token-Format
-            repo_url = f"https://{self.token}@github.com/{self.username}/{self.repo_name}.git"
-            
-            try:
-                subprocess.run(['git', 'remote', 'remove', 'origin'], capture_output=True)
-            except:
-                pass  # Remote existiert noch nicht
-            
-            subprocess.run(['git', 'remote', 'add', 'origin', repo_url], check=True, capture_output=True)
-            self.logger.info("🔧 Git Remote konfiguriert")
+            # Remote nur anlegen bzw. korrigieren, wenn er fehlt oder abweicht
+            current = subprocess.run(['git', 'remote', 'get-url', 'origin'], capture_output=True, text=True,
+                                     timeout=self.GIT_TIMEOUT)
+            current_url = current.stdout.strip() if current.returncode == 0 else ''
+            if not current_url:
+                subprocess.run(['git', 'remote', 'add', 'origin', self.remote_url], check=True, capture_output=True,
+                               timeout=self.GIT_TIMEOUT)
+                self.logger.info("🔧 Git Remote konfiguriert")
+            elif current_url != self.remote_url:
+                # Auch Migration der alten URL mit eingebettetem Token
+                subprocess.run(['git', 'remote', 'set-url', 'origin', self.remote_url], check=True, capture_output=True,
+                               timeout=self.GIT_TIMEOUT)
+                self.logger.info("🔧 Git Remote aktualisiert (Token nicht mehr in .git/config)")
             
+            self._git_ready = True
             return True
             
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
             self.logger.error(f"❌ Git Setup fehlgeschlagen: {e}")
             return False
     
-    def push_to_github(self) -> bool:
-        """Pushed Code zu GitHub"""
+    def _commit_paths(self, paths: List[str]) -> bool:
+        """Staged und committet nur paths (andere Änderungen im Working Tree bleiben unberührt)"""
+        if not paths:
+            return False
+        
+        existing = [path for path in paths if os.path.exists(path)]
+        removed = [path for path in paths if not os.path.exists(path)]
+        if existing:
+            subprocess.run(['git', 'add', '--', *existing], check=True, capture_output=True, timeout=self.GIT_TIMEOUT)
+        if removed:
+            # Gelöschte Artefakte (z.B. alte Spieler-Dateien) aus dem Index entfernen
+            subprocess.run(['git', 'rm', '--cached', '--quiet', '--ignore-unmatch', '--', *removed],
+                           check=True, capture_output=True, timeout=self.GIT_TIMEOUT)
+        
+        # Nur Pfade mit echten Änderungen committen - git muss nicht den ganzen Tree vergleichen
+        result = subprocess.run(['git', 'diff', '--cached', '--name-only', '-z', '--', *paths],
+                                check=True, capture_output=True, text=True, timeout=self.GIT_TIMEOUT)
+        staged = [path for path in result.stdout.split('\0') if path]
+        if not staged:
+            self.logger.info("ℹ️  Keine neuen Änderungen zu committen")
+            return False
+        
+        subprocess.run(['git', 'commit', '-m', 'Update LoL Team Stats', '--', *staged],
+                       check=True, capture_output=True, text=True, timeout=self.GIT_TIMEOUT)
+        self.logger.info(f"🔧 {len(staged)} Dateien committed")
+        return True
+    
+    def _has_unpushed_commits(self) -> bool:
+        """True wenn main Commits hat, die origin/main noch nicht kennt (lokal geprüft, ohne Netzwerk)"""
+        result = subprocess.run(['git', 'rev-list', '--count', 'origin/main..main'], capture_output=True, text=True,
+                                timeout=self.GIT_TIMEOUT)
+        if result.returncode != 0:
+            # Noch kein origin/main (erster Push)
+            return True
+        return result.stdout.strip() != '0'
+    
+    def has_pending_push(self) -> bool:
+        """True wenn ein früheres Deployment noch nicht gepusht wurde (lokal geprüft, ohne Netzwerk)"""
+        try:
+            if self.deploy_mode in ('plumbing', 'gh-pages'):
+                return self._get_deployer().needs_push
+            return self._has_unpushed_commits()
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+            # Noch kein Git Repository: nichts ausstehend
+            return False
+    
+    def _get_deployer(self) -> PlumbingDeployer:
+        """Plumbing- bzw. gh-pages Deployer (einmal pro Instanz, liest seinen State aus .git/)"""
+        if self.deployer is None and self.deploy_mode == 'gh-pages':
+            self.deployer = PagesDeployer(self.pages_dir, self.pages_branch, self.pages_keep_last,
+                                          push_env=self.push_env())
+        elif self.deployer is None:
+            self.deployer = PlumbingDeployer(push_env=self.push_env())
+        return self.deployer
+    
+    def _plumbing_deploy(self, paths: List[str]) -> bool:
+        """Commit über git Plumbing, Push nur wenn sich der Tree seit dem letzten Push geändert hat"""
+        try:
+            result = self._get_deployer().deploy(paths)
+        except subprocess.TimeoutExpired:
+            self.logger.error("❌ Git Push Timeout - wahrscheinlich Authentifizierung-Problem")
+            self.logger.info("💡 Dashboard wurde lokal erfolgreich generiert!")
+            raise subprocess.CalledProcessError(124, ['git', 'push'], "", "Timeout")
+        
+        if result.committed:
+            self.logger.info(f"🔧 Commit {result.commit[:8]} erstellt ({len(paths)} Dateien)")
+        if result.pushed:
+            self.logger.info("✅ Code erfolgreich zu GitHub gepusht!")
+        else:
+            self.logger.info("💤 Tree unverändert seit dem letzten Push - überspringe Push")
+        return True
+    
+    def push_to_github(self, paths: Optional[List[str]] = None) -> bool:
+        """Pushed Code zu GitHub (mit paths: nur diese Dateien stagen und committen)"""
         try:
-            # Alle Dateien hinzufügen
-            subprocess.run(['git', 'add', '.'], check=True, capture_output=True)
-            
-            # Commit (nur wenn es Änderungen gibt)
-            has_changes = False
-            try:
-                result = subprocess.run(['git', 'commit', '-m', 'Update LoL Team Stats'], 
-                                      check=True, capture_output=True, text=True)
-                self.logger.info("🔧 Änderungen committed")
-                has_changes = True
-            except subprocess.CalledProcessError:
-                # Keine Änderungen zu committen
-                self.logger.info("ℹ️  Keine neuen Änderungen zu committen")
+            if paths is not None and self.deploy_mode in ('plumbing', 'gh-pages'):
+                return self._plumbing_deploy(paths)
+            
+            if paths is not None:
+                has_changes = self._commit_paths(paths)
+                if not has_changes:
+                    if not self._has_unpushed_commits():
+                        self.logger.info("💤 Keine geänderten Dateien - überspringe Commit und Push")
+                        return True
+                    # Commit aus einem fehlgeschlagenen Push nachholen
+                    has_changes = True
+            else:
+                # Alle Dateien hinzufügen
+                subprocess.run(['git', 'add', '.'], check=True, capture_output=True, timeout=self.GIT_TIMEOUT)
+                
+                # Commit (nur wenn es Änderungen gibt)
+                has_changes = False
+                try:
+                    result = subprocess.run(['git', 'commit', '-m', 'Update LoL Team Stats'], 
+                                          check=True, capture_output=True, text=True, timeout=self.GIT_TIMEOUT)
+                    self.logger.info("🔧 Änderungen committed")
+                    has_changes = True
+                except subprocess.CalledProcessError:
+                    # Keine Änderungen zu committen
+                    self.logger.info("ℹ️  Keine neuen Änderungen zu committen")
             
             # Push zu GitHub (nur wenn es Änderungen gab oder Force)
             if has_changes:
@@ -84,7 +223,7 @@ class GitHubManager:
                 try:
                     # Git Push mit Timeout um Hängen zu vermeiden
                     result = subprocess.run(['git', 'push', '-u', 'origin', 'main'], 
-                                          capture_output=True, text=True, timeout=30)
+                                          capture_output=True, text=True, timeout=self.PUSH_TIMEOUT, env=self.push_env())
                     if result.returncode == 0:
                         self.logger.info("✅ Code erfolgreich zu GitHub gepusht!")
                     else:
@@ -101,8 +240,12 @@ class GitHubManager:
             else:
                 # Prüfe ob Remote aktuell ist
                 self.logger.info("🔄 Prüfe ob Repository aktuell ist...")
-                result = subprocess.run(['git', 'push', 'origin', 'main'], 
-                                      capture_output=True, text=True)
+                try:
+                    result = subprocess.run(['git', 'push', 'origin', 'main'], 
+                                          capture_output=True, text=True, timeout=self.PUSH_TIMEOUT, env=self.push_env())
+                except subprocess.TimeoutExpired:
+                    self.logger.error("❌ Git Push Check Timeout - wahrscheinlich Authentifizierung-Problem")
+                    raise subprocess.CalledProcessError(124, ['git', 'push'], "", "Timeout")
                 if result.returncode == 0:
                     self.logger.info("✅ Repository ist aktuell")
                 else:
@@ -118,6 +261,11 @@ class GitHubManager:
             
             return True
             
+        except subprocess.TimeoutExpired as e:
+            # Lokaler git Aufruf hängt (z.B. index.lock) - abbrechen statt die Deploy-Queue zu blockieren
+            self.logger.error(f"❌ Git Timeout nach {e.timeout}s: {' '.join(e.cmd)}")
+            return False
+            
         except subprocess.CalledProcessError as e:
             self.logger.error(f"❌ GitHub Push fehlgeschlagen: {e}")
             self.logger.error(f"🔍 Exit Code: {e.returncode}")
@@ -140,11 +288,13 @@ class GitHubManager:
             if e.returncode != 124:
                 try:
                     # Git Remote Status
-                    remote_result = subprocess.run(['git', 'remote', '-v'], capture_output=True, text=True)
+                    remote_result = subprocess.run(['git', 'remote', '-v'], capture_output=True, text=True,
+                                                   timeout=self.GIT_TIMEOUT)
                     self.logger.error(f"🔗 Git Remote: {remote_result.stdout.strip()}")
                     
                     # Git Status
-                    status_result = subprocess.run(['git', 'status', '--porcelain'], capture_output=True, text=True)
+                    status_result = subprocess.run(['git', 'status', '--porcelain'], capture_output=True, text=True,
+                                                   timeout=self.GIT_TIMEOUT)
                     self.logger.error(f"📊 Git Status: {status_result.stdout.strip() if status_result.stdout.strip() else 'Clean'}")
                     
                 except Exception as diag_e:
@@ -165,8 +315,8 @@ class GitHubManager:
             url = f"https://{self.username}.github.io/{self.repo_name}/"
             return False, url
     
-    def full_deployment(self) -> Tuple[bool, str]:
-        """Kompletter automatischer Deployment-Prozess"""
+    def full_deployment(self, paths: Optional[List[str]] = None) -> Tuple[bool, str]:
+        """Kompletter automatischer Deployment-Prozess (paths = geänderte Dateien für den Scoped Mode)"""
         try:
             # 1. Repository erstellen
             if not self.create_repository():
@@ -177,7 +327,7 @@ class GitHubManager:
                 return False, ""
             
             # 3. Push zu GitHub
-            if not self.push_to_github():
+            if not self.push_to_github(paths if self.deploy_mode != 'full' else None):
                 return False, ""
             
             # 4. GitHub Pages aktivieren
@@ -3,49 +3,123 @@
 
 import json
 import os
+import threading
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import random
 
+from asset_pipeline import AssetPipeline
+from champion_registry import get_champion_registry
+from content_digest import (DIGEST_FILE, compute_digest, compute_freshness, hash_content, load_manifest,
+                            render_manifest)
+from data_export import PLAYERS_DIR, build_data_artifacts, compress_variants
+from icon_cache import IconCache
+from output_writer import OutputWriter
+from seeded_random import player_rng
+from stats_index import TIER_VALUES, StatsIndex, get_rank_value, rate_champion
+from template_engine import get_compiled_template
+
+class PageAssets(NamedTuple):
+    """Fertige <head>/<body> Tags, zugehörige Asset-Dateien und Cache-Key fürs Template"""
+    head: str
+    body: str
+    files: Dict[str, bytes]
+    key: str
+
+# Wird nur einmal pro Prozess (und Asset-Konfiguration) gebaut und von allen Generator-Instanzen geteilt
+_page_assets: Dict[Tuple, PageAssets] = {}
+_page_assets_lock = threading.Lock()
+
 class GitHubPagesGenerator:
     """Erstellt ein professionelles LoL Dashboard im OP.GG/Grafana Stil"""
     
-    def __init__(self):
-        self.template = self._get_html_template()
-        
-        # Basis URL für Champion Icons vom Riot CDN (aktuellste Version)
-        self.champion_base_url = 'https://ddragon.leagueoflegends.com/cdn/14.21.1/img/champion/'
-        
-        # Champion Name Mappings für korrekte URLs (vollständig)
-        self.champion_name_fixes = {
-            'Lee Sin': 'LeeSin',
-            'Kai\'Sa': 'Kaisa',
-            'Kha\'Zix': 'Khazix',
-            'Cho\'Gath': 'Chogath',
-            'Kog\'Maw': 'KogMaw',
-            'Vel\'Koz': 'Velkoz',
-            'Rek\'Sai': 'RekSai',
-            'LeBlanc': 'Leblanc',
-            'Dr. Mundo': 'DrMundo',
-            'Jarvan IV': 'JarvanIV',
-            'Twisted Fate': 'TwistedFate',
-            'Miss Fortune': 'MissFortune',
-            'Tahm Kench': 'TahmKench',
-            'Aurelion Sol': 'AurelionSol',
-            'Master Yi': 'MasterYi',
-            'Xin Zhao': 'XinZhao',
-            'Nunu & Willump': 'Nunu',
-            'Renata Glasc': 'Renata',
-            'Wukong': 'MonkeyKing',
-            'Bel\'Veth': 'Belveth',
-            'K\'Sante': 'KSante'
-        }
+    def __init__(self, compact_json: bool = False, split_players: bool = False, precompress: bool = False,
+                 client_render: bool = False, asset_pipeline: Optional[AssetPipeline] = None,
+                 icon_cache: Optional[IconCache] = None, track_freshness: bool = False):
+        # Ausgabe-Optionen für data.json und index.html (siehe OUTPUT_CONFIG)
+        self.compact_json = compact_json
+        self.split_players = split_players
+        self.precompress = precompress
+        self.client_render = client_render
+        # Nur für Incremental Mode/Daemon: neue Spieler-Zeitstempel allein schreiben data.json neu (das Alter
+        # wird daraus gelesen) - sonst zählt ein Lauf ohne neue Daten nicht als Änderung
+        self.track_freshness = track_freshness
+        
+        # CSS/JS inline oder als gehashte Dateien unter assets/ (Standard: inline + CDN wie bisher)
+        self.asset_pipeline = asset_pipeline or AssetPipeline()
+        page_assets = self._get_page_assets()
+        partials = {'head_assets': lambda: page_assets.head, 'body_script': lambda: page_assets.body}
+        
+        # Optional: Champion-Icons lokal ausliefern statt jedes Icon einzeln von ddragon zu laden
+        self.icon_cache = icon_cache
+        
+        # Template wird nur einmal pro Prozess (und Asset-Konfiguration) zerlegt und von allen Instanzen geteilt
+        if client_render:
+            # index.html als statische Shell - die Seite rendert sich selbst aus data.json
+            partials['team_comparison_charts'] = lambda: self._generate_team_comparison_charts([])
+            self.template = get_compiled_template(f'shell:{page_assets.key}', self._get_shell_template, partials)
+        else:
+            self.template = get_compiled_template(f'dashboard:{page_assets.key}', self._get_html_template, partials)
+        
+        # Champion-Metadaten (Icon-Keys, Positionen, Aliase) - einmal pro Prozess geladen
+        self.champions = get_champion_registry()
+        
+        # Artefakte, die beim letzten generate_page() tatsächlich neu geschrieben wurden
+        self.changed_artifacts: List[str] = []
+        # Dieselben Dateien als Pfade inkl. output_dir - für das Scoped Deployment (ohne Digest-Manifest, .gitignore)
+        self.changed_paths: List[str] = []
+        # Geschriebene Bytes pro Artefakt beim letzten generate_page() (0 = unverändert)
+        self.write_stats: Dict[str, int] = {}
+    
+    def _get_page_assets(self) -> PageAssets:
+        """Head/Body-Tags und Asset-Dateien - pro Asset-Konfiguration nur einmal pro Prozess gebaut und gehasht"""
+        pipeline = self.asset_pipeline
+        # cache_dir/offline gehören dazu: sie entscheiden, ob Chart.js lokal oder vom CDN kommt
+        config = (self.client_render, pipeline.extract, pipeline.vendor_chartjs, pipeline.google_fonts,
+                  pipeline.cache_dir, pipeline.offline)
+        page_assets = _page_assets.get(config)
+        if page_assets is None:
+            with _page_assets_lock:
+                page_assets = _page_assets.get(config)
+                if page_assets is None:
+                    builder = AssetPipeline(pipeline.extract, pipeline.vendor_chartjs, pipeline.google_fonts,
+                                            pipeline.cache_dir, pipeline.offline)
+                    if self.client_render:
+                        head = builder.head_html(self._get_stylesheet() + self._get_client_stylesheet())
+                        body = builder.script_html('client', self._get_client_script())
+                    else:
+                        head = builder.head_html(self._get_stylesheet())
+                        body = builder.script_html('dashboard', self._get_dashboard_script())
+                    page_assets = PageAssets(head, body, dict(builder.assets), hash_content(head + body)[:16])
+                    _page_assets[config] = page_assets
+        # Asset-Dateien gehören zu jeder Instanz, die das Template verwendet
+        pipeline.assets.update(page_assets.files)
+        return page_assets
     
-    def generate_page(self, team_data: Dict, output_dir: str = "docs") -> str:
-        """Generiert die professionelle Dashboard-Seite"""
+    def generate_page(self, team_data: Dict, output_dir: str = "docs", force: bool = False) -> str:
+        """Generiert die professionelle Dashboard-Seite (überspringt unveränderte Daten, außer force)"""
         
         # Erstelle docs Verzeichnis für GitHub Pages
         os.makedirs(output_dir, exist_ok=True)
+        html_file = os.path.join(output_dir, "index.html")
+        self.changed_artifacts = []
+        self.changed_paths = []
+        self.write_stats = {}
+        
+        # Gleicher Input-Digest wie beim letzten Lauf = nichts zu rendern, schreiben oder deployen
+        options = (f"compact={self.compact_json},split={self.split_players},"
+                   f"precompress={self.precompress},client={self.client_render},icons={self.icon_cache is not None}")
+        digest = compute_digest(team_data, salt=f"{self.template.fingerprint}:{options}")
+        freshness = compute_freshness(team_data)
+        manifest = load_manifest(output_dir)
+        outputs_present = all(os.path.exists(os.path.join(output_dir, name)) for name in ('index.html', 'data.json'))
+        data_only = False
+        if not force and manifest.get('digest') == digest and outputs_present:
+            if not self.track_freshness or manifest.get('freshness') == freshness:
+                return html_file
+            # Nur Spieler-Zeitstempel neu: data.json trotzdem schreiben (der Incremental Mode liest das Alter
+            # daraus), index.html und Assets bleiben wie sie sind
+            data_only = True
         
         # Erweitere Spielerdaten mit zusätzlichen Statistiken
         enhanced_players = self._enhance_player_data(team_data.get('players', {}))
@@ -55,31 +129,97 @@ class GitHubPagesGenerator:
         lane_order = {'TOP': 1, 'JGL': 2, 'MID': 3, 'ADC': 4, 'SUPP': 5, 'FLEX': 6}
         players.sort(key=lambda x: lane_order.get(x[1].get('lane', 'FLEX'), 6))
         
-        # Generiere alle Dashboard-Komponenten
-        html_content = self.template.format(
-            team_name=team_data.get('team_name', 'LoL Team'),
-            last_updated=team_data.get('last_updated', ''),
-            players_html=self._generate_enhanced_players_html(players),
-            success_count=team_data.get('success_count', 0),
-            total_players=team_data.get('total_players', 0),
-            team_overview=self._generate_team_overview(players),
-            team_comparison_charts=self._generate_team_comparison_charts(players),
-            player_stats_data=self._generate_player_stats_json(players)
-        )
-        
-        # Schreibe HTML-Datei
-        html_file = os.path.join(output_dir, "index.html")
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        # Schreibe erweiterte JSON-Daten
+        # Erweiterte JSON-Daten (normal, compact oder pro Spieler aufgeteilt)
         enhanced_team_data = {**team_data, 'players': enhanced_players}
-        json_file = os.path.join(output_dir, "data.json")
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(enhanced_team_data, f, indent=2, ensure_ascii=False)
+        
+        html_content = None
+        if self.client_render:
+            # Shell ändert sich nur mit Teamname/Template - ein Daten-Update ist dann nur data.json
+            if not data_only:
+                html_content = self.template.render(team_name=team_data.get('team_name', 'LoL Team'))
+            enhanced_team_data['champion_icons'] = self._collect_champion_icons(enhanced_players)
+            # Leaderboards, Team-KPIs und Champion-Bewertungen serverseitig berechnet - das JS rendert sie nur noch
+            index = StatsIndex(players)
+            enhanced_team_data['leaderboards'] = index.leaderboards()
+            enhanced_team_data['overview'] = index.team_overview()
+            for player_data in enhanced_players.values():
+                player_data['enhanced_champions'] = [
+                    {**champ, **rate_champion(champ)} for champ in player_data.get('enhanced_champions', [])
+                ]
+        elif not data_only:
+            # Generiere alle Dashboard-Komponenten
+            html_content = self.template.render(
+                team_name=team_data.get('team_name', 'LoL Team'),
+                last_updated=team_data.get('last_updated', ''),
+                players_html=self._generate_enhanced_players_html(players),
+                success_count=team_data.get('success_count', 0),
+                total_players=team_data.get('total_players', 0),
+                team_overview=self._generate_team_overview(players),
+                team_comparison_charts=self._generate_team_comparison_charts(players),
+                player_stats_data=self._generate_player_stats_json(players)
+            )
+        
+        icon_assets = {}
+        if self.icon_cache is not None:
+            if self.client_render:
+                icon_assets = self._localize_champion_icons(enhanced_team_data)
+            elif html_content is not None:
+                html_content, icon_assets = self.icon_cache.rewrite_html(html_content)
+        
+        artifacts = {}
+        if html_content is not None:
+            artifacts['index.html'] = html_content
+            artifacts.update(self.asset_pipeline.assets)
+        artifacts.update(build_data_artifacts(enhanced_team_data, self.compact_json, self.split_players))
+        artifacts.update(icon_assets)
+        
+        # Vorkomprimierte Varianten (.gz/.br) für statische Hosts
+        if self.precompress:
+            for name, content in list(artifacts.items()):
+                data = content.encode('utf-8') if isinstance(content, str) else content
+                for suffix, compressed in compress_variants(data).items():
+                    artifacts[name + suffix] = compressed
+        
+        # Atomar schreiben (Temp-Datei + rename) - unveränderte Artefakte werden übersprungen
+        writer = OutputWriter(output_dir)
+        for name, content in artifacts.items():
+            writer.write(name, content)
+        self.changed_artifacts = writer.changed
+        
+        artifact_hashes = {name: hash_content(content) for name, content in artifacts.items()}
+        previous = manifest.get('artifacts', {})
+        if data_only:
+            # Nicht neu gerenderte Artefakte (index.html, Assets, Icons) bleiben im Manifest
+            kept = {name: value for name, value in previous.items() if not self._is_data_artifact(name)}
+            artifact_hashes = {**kept, **artifact_hashes}
+        self._remove_stale_files(output_dir, previous, artifact_hashes)
+        writer.write(DIGEST_FILE, render_manifest(digest, artifact_hashes, freshness))
+        self.write_stats = writer.bytes_written
+        if self.changed_artifacts:
+            self.changed_paths = [os.path.join(output_dir, name) for name in self.changed_artifacts]
         
         return html_file
     
+    @staticmethod
+    def _is_data_artifact(name: str) -> bool:
+        """data.json und players/*.json inkl. vorkomprimierter Varianten"""
+        base, extension = os.path.splitext(name)
+        if extension not in ('.gz', '.br'):
+            base = name
+        return base == 'data.json' or base.startswith(f'{PLAYERS_DIR}/')
+    
+    def _remove_stale_files(self, output_dir: str, previous: Dict, artifacts: Dict):
+        """Löscht Artefakte des letzten Laufs (laut Manifest), die nicht mehr generiert werden (alte Spieler,
+        alte Asset-Hashes, Icons) - von Hand abgelegte Dateien bleiben unberührt"""
+        for name in previous:
+            # Nur relative Pfade innerhalb von output_dir (Manifest könnte von Hand bearbeitet sein)
+            if name in artifacts or os.path.isabs(name) or '..' in name.split('/'):
+                continue
+            path = os.path.join(output_dir, name)
+            if os.path.isfile(path):
+                os.remove(path)
+                self.changed_artifacts.append(name)
+    
     def _enhance_player_data(self, players: Dict) -> Dict:
         """Erweitert Spielerdaten mit realistischen Statistiken basierend auf Rollen"""
         enhanced = {}
@@ -91,8 +231,11 @@ class GitHubPagesGenerator:
             lane = player_data.get('lane', 'FLEX')
             base_win_rate = player_data.get('win_rate', 50)
             
+            # Eigener Seed pro Spieler: gleiche gescrapte Daten ergeben die gleichen Stats
+            rng = player_rng({**player_data, 'riot_id': player_data.get('riot_id', riot_id)}, 'dashboard')
+            
             # Generiere realistische Stats basierend auf Rolle
-            role_stats = self._generate_realistic_stats_by_role(lane, base_win_rate)
+            role_stats = self._generate_realistic_stats_by_role(lane, base_win_rate, rng)
             
             enhanced_player.update({
                 # Performance Statistiken basierend auf Rolle
@@ -104,28 +247,26 @@ class GitHubPagesGenerator:
                 'kill_participation': role_stats['kill_participation'],
                 
                 # Erweiterte Champion-Daten mit Icons
-                'enhanced_champions': self._enhance_champions(player_data.get('main_champions', [])),
+                'enhanced_champions': self._enhance_champions(player_data.get('main_champions', []), rng),
                 
                 # Trend-Daten (letzte 10 Spiele)
-                'recent_performance': self._generate_recent_performance(),
+                'recent_performance': self._generate_recent_performance(rng),
                 
                 # Rollen-Statistiken
                 'primary_role': self._determine_primary_role(player_data.get('main_champions', [])),
-                'role_distribution': self._generate_role_distribution(),
+                'role_distribution': self._generate_role_distribution(rng),
                 
                 # Spielzeit
-                'avg_game_duration': random.randint(25, 35),
-                'playtime_hours': random.randint(50, 200)
+                'avg_game_duration': rng.randint(25, 35),
+                'playtime_hours': rng.randint(50, 200)
             })
             
             enhanced[riot_id] = enhanced_player
             
         return enhanced
     
-    def _generate_realistic_stats_by_role(self, lane: str, base_win_rate: float) -> Dict:
+    def _generate_realistic_stats_by_role(self, lane: str, base_win_rate: float, rng: random.Random) -> Dict:
         """Generiert realistische Stats basierend auf der Rolle"""
-        import random
-        
         # Performance Modifier basierend auf Win Rate
         # Höhere Win Rate = Bessere Stats
         performance_modifier = (base_win_rate / 50)  # 50% = neutral
@@ -181,7 +322,7 @@ class GitHubPagesGenerator:
         stats = {}
         for stat, (min_val, max_val) in template.items():
             # Base value im Range
-            base_value = random.randint(int(min_val), int(max_val))
+            base_value = rng.randint(int(min_val), int(max_val))
             
             # Apply performance modifier (±20% basierend auf Win Rate)
             modifier_range = 0.2
@@ -200,10 +341,9 @@ class GitHubPagesGenerator:
             
         return stats
     
-    def _enhance_champions(self, champions: List) -> List:
+    def _enhance_champions(self, champions: List, rng: random.Random) -> List:
         """Erweitert Champion-Daten mit Icons und realistischen Stats"""
         enhanced_champs = []
-        import random
         
         for i, champ in enumerate(champions):
             champ_name = champ.get('name', '').strip()
@@ -215,11 +355,11 @@ class GitHubPagesGenerator:
             
             # Erster Champion (meist gespielt) = beste WR, dann absteigend
             if i == 0:  # Main Champion
-                win_rate = random.randint(55, 75)
+                win_rate = rng.randint(55, 75)
             elif i == 1:  # Zweiter Champion  
-                win_rate = random.randint(45, 65)
+                win_rate = rng.randint(45, 65)
             else:  # Andere Champions
-                win_rate = random.randint(35, 60)
+                win_rate = rng.randint(35, 60)
             
             # Berechne Wins/Losses basierend auf realistischer Win Rate
             wins = int(base_games * win_rate / 100)
@@ -231,9 +371,9 @@ class GitHubPagesGenerator:
                 'win_rate': win_rate,  # Überschreibe mit realistischer Win Rate
                 'wins': wins,
                 'losses': losses,
-                'avg_kda': round(random.uniform(1.5, 4.0), 2),
-                'avg_damage': random.randint(12000, 25000),
-                'avg_cs': random.randint(120, 200)
+                'avg_kda': round(rng.uniform(1.5, 4.0), 2),
+                'avg_damage': rng.randint(12000, 25000),
+                'avg_cs': rng.randint(120, 200)
             })
             
             enhanced_champs.append(enhanced_champ)
@@ -242,70 +382,55 @@ class GitHubPagesGenerator:
     
     def _get_champion_icon_url(self, champion_name: str) -> str:
         """Generiert die korrekte Champion-Icon-URL"""
-        if not champion_name:
-            return f'{self.champion_base_url}MissingChampion.png'
-        
-        # Verwende Mapping für spezielle Namen, sonst normalisiere
-        clean_name = self.champion_name_fixes.get(champion_name, champion_name)
-        
-        # Entferne alle Sonderzeichen und Leerzeichen
-        clean_name = ''.join(c for c in clean_name if c.isalnum())
-        
-        return f'{self.champion_base_url}{clean_name}.png'
+        return self.champions.icon_url(champion_name)
+    
+    def _collect_champion_icons(self, players: Dict) -> Dict[str, str]:
+        """Icon-URL pro Champion (Main Champions + Recent Games) für das Client Rendering"""
+        names = set()
+        for player in players.values():
+            names.update(champ.get('name', '') for champ in player.get('main_champions', []))
+            names.update(game.get('champion', '') for game in player.get('recent_games', []))
+        return {name: self._get_champion_icon_url(name) for name in sorted(names) if name}
     
-    def _generate_recent_performance(self) -> List:
+    def _localize_champion_icons(self, team_data: Dict) -> Dict[str, bytes]:
+        """Ersetzt die Icon-URLs in den Client-Daten durch lokale Icons und liefert die zu schreibenden Dateien"""
+        champion_icons = team_data.get('champion_icons', {})
+        sources, assets = self.icon_cache.localize(champion_icons.values())
+        team_data['champion_icons'] = {name: sources.get(url, url) for name, url in champion_icons.items()}
+        
+        players = {}
+        for riot_id, player in team_data.get('players', {}).items():
+            champions = [
+                {**champ, 'icon_url': sources.get(champ.get('icon_url'), champ.get('icon_url'))}
+                for champ in player.get('enhanced_champions', [])
+            ]
+            players[riot_id] = {**player, 'enhanced_champions': champions} if champions else player
+        team_data['players'] = players
+        return assets
+    
+    def _generate_recent_performance(self, rng: random.Random) -> List:
         """Generiert Trend-Daten für letzte 10 Spiele"""
-        return [random.choice(['W', 'L']) for _ in range(10)]
+        return [rng.choice(['W', 'L']) for _ in range(10)]
     
     def _determine_primary_role(self, champions: List) -> str:
         """Bestimmt primäre Rolle basierend auf Champions"""
         if not champions:
             return 'Flex'
         
-        # Simplified role detection basierend auf Champion Namen
-        role_champions = {
-            'ADC': ['Jinx', 'Kai\'Sa', 'Jhin', 'Ziggs', 'Miss Fortune', 'Draven'],
-            'Support': ['Braum', 'Bard', 'Lulu', 'Thresh', 'Leona', 'Morgana'],
-            'Jungle': ['Viego', 'Graves', 'Lee Sin', 'Kha\'Zix'],
-            'Mid': ['Syndra', 'Akali', 'Xerath', 'Yasuo', 'Zed'],
-            'Top': ['Urgot', 'Gwen', 'Ornn', 'Sion', 'Gnar', 'Darius']
-        }
-        
-        for role, role_champs in role_champions.items():
-            for champ in champions[:2]:  # Check top 2 champions
-                if champ.get('name') in role_champs:
-                    return role
-        
-        return 'Flex'
+        # Hauptpositionen der Top 2 Champions aus der Champion-Registry
+        return self.champions.primary_role(champ.get('name', '') for champ in champions[:2]) or 'Flex'
     
-    def _generate_role_distribution(self) -> Dict:
+    def _generate_role_distribution(self, rng: random.Random) -> Dict:
         """Generiert Rollen-Verteilung"""
         return {
-            'primary': random.randint(60, 80),
-            'secondary': random.randint(15, 30),
-            'fill': random.randint(5, 15)
+            'primary': rng.randint(60, 80),
+            'secondary': rng.randint(15, 30),
+            'fill': rng.randint(5, 15)
         }
     
     def _get_rank_value(self, player: Dict) -> int:
         """Konvertiert Rank zu numerischem Wert für Sortierung"""
-        tier = player.get('tier', '').lower()
-        lp = player.get('lp', 0)
-        
-        tier_values = {
-            'challenger': 9000,
-            'grandmaster': 8000,
-            'master': 7000,
-            'diamond': 6000,
-            'emerald': 5000,
-            'platinum': 4000,
-            'gold': 3000,
-            'silver': 2000,
-            'bronze': 1000,
-            'iron': 0
-        }
-        
-        base_value = tier_values.get(tier, 0)
-        return base_value + lp
+        return get_rank_value(player)
 
     def _generate_enhanced_players_html(self, players) -> str:
         """Generiert moderne Spieler-Karten mit erweiterten Stats"""
@@ -432,27 +557,10 @@ class GitHubPagesGenerator:
             avg_damage = champ.get('avg_damage', 0)
             avg_cs = champ.get('avg_cs', 0)
             
-            # Realistische Farbe basierend auf Winrate
-            if win_rate >= 70:
-                wr_class = "excellent"  # Sehr starke Performance
-            elif win_rate >= 60:
-                wr_class = "good"       # Gute Performance
-            elif win_rate >= 50:
-                wr_class = "average"    # Durchschnittlich
-            elif win_rate >= 40:
-                wr_class = "below"      # Unter Durchschnitt
-            else:
-                wr_class = "poor"       # Schwache Performance
-            
-            # KDA Farbe
-            if avg_kda >= 2.5:
-                kda_class = "excellent"
-            elif avg_kda >= 2.0:
-                kda_class = "good"
-            elif avg_kda >= 1.5:
-                kda_class = "average"
-            else:
-                kda_class = "poor"
+            # Farben und Analyse aus Win Rate/KDA (gleiche Bewertung wie im Client Rendering)
+            rating = rate_champion(champ)
+            wr_class = rating['wr_class']
+            kda_class = rating['kda_class']
             
             card_html = f"""
             <div class="champion-card modern-card" data-champion="{name}">
@@ -468,13 +576,10 @@ class GitHubPagesGenerator:
                             <strong>{name} Performance</strong><br>
                             🏆 <strong>Win Rate:</strong> {win_rate:.2f}% ({wins}W-{losses}L)<br>
                             🎮 <strong>Games Played:</strong> {games}<br>
-                            📊 <strong>Performance Rating:</strong> {wr_class.title()}<br>
+                            📊 <strong>Performance Rating:</strong> {rating['rating']}<br>
                             <br>
                             💡 <strong>Analysis:</strong><br>
-                            {"🔥 Starker Champion für diesen Spieler!" if win_rate >= 65 else 
-                             "✅ Solide Performance" if win_rate >= 55 else
-                             "⚡ Gute Grundlage" if win_rate >= 45 else
-                             "📈 Potential für Verbesserung"}
+                            {rating['analysis']}
                         </div>
                     </div>
                 </div>
@@ -550,52 +655,18 @@ class GitHubPagesGenerator:
         
         return '\n'.join(games_html)
     
-    def _generate_ranking(self, players: List, stat_key: str) -> str:
-        """Generiert Player Ranking für eine bestimmte Statistik"""
-        if not players:
+    def _generate_ranking(self, index: StatsIndex, stat_key: str) -> str:
+        """Generiert Player Ranking für eine bestimmte Statistik (aus dem vorberechneten Index)"""
+        if not len(index):
             return "<div class='no-ranking'>Keine Daten verfügbar</div>"
         
-        # Erstelle Ranking basierend auf dem stat_key
-        ranked_players = []
-        for name, player_data in players:
-            if stat_key == 'rank_value':
-                value = self._get_rank_value(player_data)
-                display_value = f"{player_data.get('tier', 'Unranked')} {player_data.get('lp', 0)}LP"
-            elif stat_key == 'performance_score':
-                # Berechne Performance Score für jeden Spieler
-                wr = player_data.get('win_rate', 0)
-                kda = player_data.get('kda_ratio', 1.0)
-                kp = player_data.get('kill_participation', 50)
-                value = min(100, round(wr * 0.4 + kda * 15 + kp * 0.45))
-                display_value = f"{value}/100"
-            else:
-                value = player_data.get(stat_key, 0)
-                if stat_key == 'win_rate':
-                    display_value = f"{value:.2f}%"
-                elif stat_key == 'kda_ratio':
-                    display_value = f"{value:.2f}"
-                elif stat_key == 'avg_gold':
-                    display_value = f"{value:,}g"
-                elif stat_key == 'avg_cs':
-                    display_value = f"{value} CS"
-                elif stat_key == 'avg_damage':
-                    display_value = f"{value:,}"
-                elif stat_key in ['kill_participation', 'vision_score']:
-                    display_value = f"{value}"
-                else:
-                    display_value = str(value)
-            
-            player_name = name.split('#')[0] if '#' in name else name
-            ranked_players.append((player_name, value, display_value))
-        
-        # Sortiere absteigend
-        ranked_players.sort(key=lambda x: x[1], reverse=True)
+        ranked_players = index.top(stat_key, 5)
         
         # Generiere Ranking HTML
         ranking_html = []
         medals = ['🥇', '🥈', '🥉', '4️⃣', '5️⃣']
         
-        for i, (player_name, value, display_value) in enumerate(ranked_players[:5]):
+        for i, (player_name, value, display_value) in enumerate(ranked_players):
             medal = medals[i] if i < len(medals) else f"{i+1}."
             
             # Performance basierte CSS Klasse
@@ -627,36 +698,26 @@ class GitHubPagesGenerator:
         if not players:
             return "<p>Keine Spieler-Daten verfügbar</p>"
         
-        # Berechne Team-Statistiken
-        total_games = sum(p[1].get('total_games', 0) for p in players)
-        total_wins = sum(p[1].get('wins', 0) for p in players)
-        avg_wr = round((total_wins / max(total_games, 1)) * 100)
-        
-        avg_gold = round(sum(p[1].get('avg_gold', 0) for p in players) / len(players))
-        avg_cs = round(sum(p[1].get('avg_cs', 0) for p in players) / len(players))
-        avg_vision = round(sum(p[1].get('vision_score', 0) for p in players) / len(players))
-        avg_damage = round(sum(p[1].get('avg_damage', 0) for p in players) / len(players))
-        avg_kda = round(sum(p[1].get('kda_ratio', 0) for p in players) / len(players), 2)
-        avg_kill_participation = round(sum(p[1].get('kill_participation', 0) for p in players) / len(players))
-        
-        # Höchster Rank
-        highest_player = max(players, key=lambda x: self._get_rank_value(x[1]))
-        highest_rank = highest_player[1].get('rank', 'Unranked')
-        
-        # Team Performance Rating
-        performance_rating = min(100, round((avg_wr * 0.4 + avg_kda * 10 + avg_kill_participation * 0.6)))
-        
-        # Trend Direction basierend auf aktueller Performance
-        if avg_wr >= 60:
-            trend_icon = "📈"
-            trend_class = "trend-up"
-        elif avg_wr >= 50:
-            trend_icon = "➡️"
-            trend_class = "trend-stable"
-        else:
-            trend_icon = "📉"
-            trend_class = "trend-down"
-            
+        # Alle Ranglisten-Werte einmal berechnen und sortieren - die Leaderboards lesen nur noch daraus
+        index = StatsIndex(players)
+        
+        # Team-KPIs (dieselben Werte landen im Client Rendering als 'overview' in data.json)
+        overview = index.team_overview()
+        total_games = overview['total_games']
+        total_wins = overview['total_wins']
+        avg_wr = overview['avg_win_rate']
+        avg_gold = overview['avg_gold']
+        avg_cs = overview['avg_cs']
+        avg_vision = overview['avg_vision']
+        avg_damage = overview['avg_damage']
+        avg_kda = overview['avg_kda']
+        avg_kill_participation = overview['avg_kill_participation']
+        performance_rating = overview['performance_rating']
+        trend_icon = overview['trend_icon']
+        trend_class = overview['trend_class']
+        highest_rank = overview['highest_rank']
+        highest_name = overview['highest_name']
+        
         return f"""
         <div class="grafana-dashboard">
             <h2 class="dashboard-title">📊 Team Performance Dashboard</h2>
@@ -676,7 +737,7 @@ class GitHubPagesGenerator:
                                 📊 <strong>Games Breakdown:</strong><br>
                                 • Total Games: {total_games}<br>
                                 • Total Wins: {total_wins}<br>
-                                • Total Losses: {total_games - total_wins}<br>
+                                • Total Losses: {overview['total_losses']}<br>
                                 <em>Höhere Win Rate = Besseres Team</em>
                             </div>
                         </div>
@@ -685,7 +746,7 @@ class GitHubPagesGenerator:
                     <div class="kpi-subtitle">{total_wins} wins of {total_games} games</div>
                     <div class="kpi-ranking">
                         <div class="ranking-title">🏆 Win Rate Leaderboard:</div>
-                        {self._generate_ranking(players, 'win_rate')}
+                        {self._generate_ranking(index, 'win_rate')}
                     </div>
                 </div>
                 
@@ -716,7 +777,7 @@ class GitHubPagesGenerator:
                     <div class="kpi-subtitle">Overall team rating</div>
                     <div class="kpi-ranking">
                         <div class="ranking-title">🏆 Performance Leaderboard:</div>
-                        {self._generate_ranking(players, 'performance_score')}
+                        {self._generate_ranking(index, 'performance_score')}
                     </div>
                 </div>
                 
@@ -738,7 +799,7 @@ class GitHubPagesGenerator:
                     <div class="kpi-subtitle">Kill/Death/Assist ratio</div>
                     <div class="kpi-ranking">
                         <div class="ranking-title">🏆 KDA Leaderboard:</div>
-                        {self._generate_ranking(players, 'kda_ratio')}
+                        {self._generate_ranking(index, 'kda_ratio')}
                     </div>
                 </div>
                 
@@ -752,15 +813,15 @@ class GitHubPagesGenerator:
                                 Beste Ranglistenplatzierung im Team<br>
                                 Berechnung: Max(Tier + Division + LP)<br>
                                 <em>Challenger > Master > Diamond > Emerald > ...</em><br>
-                                Erreicht von: {highest_player[0].split('#')[0] if '#' in highest_player[0] else highest_player[0]}
+                                Erreicht von: {highest_name}
                             </div>
                         </div>
                     </div>
-                    <div class="kpi-value">{highest_rank.split()[0] if highest_rank != 'Unranked' and len(highest_rank.split()) > 0 else 'Unranked'}</div>
-                    <div class="kpi-subtitle">{highest_player[0].split('#')[0] if '#' in highest_player[0] else highest_player[0]}</div>
+                    <div class="kpi-value">{highest_rank}</div>
+                    <div class="kpi-subtitle">{highest_name}</div>
                     <div class="kpi-ranking">
                         <div class="ranking-title">🏆 Rank Leaderboard:</div>
-                        {self._generate_ranking(players, 'rank_value')}
+                        {self._generate_ranking(index, 'rank_value')}
                     </div>
                 </div>
             </div>
@@ -797,11 +858,11 @@ class GitHubPagesGenerator:
                         </div>
                         <div class="stat-leaderboard">
                             <div class="ranking-title">🏆 Gold Leaderboard:</div>
-                            {self._generate_ranking(players, 'avg_gold')}
+                            {self._generate_ranking(index, 'avg_gold')}
                         </div>
                         <div class="stat-leaderboard">
                             <div class="ranking-title">🏆 CS Leaderboard:</div>
-                            {self._generate_ranking(players, 'avg_cs')}
+                            {self._generate_ranking(index, 'avg_cs')}
                         </div>
                     </div>
                 </div>
@@ -836,11 +897,11 @@ class GitHubPagesGenerator:
                         </div>
                         <div class="stat-leaderboard">
                             <div class="ranking-title">🏆 Damage Leaderboard:</div>
-                            {self._generate_ranking(players, 'avg_damage')}
+                            {self._generate_ranking(index, 'avg_damage')}
                         </div>
                         <div class="stat-leaderboard">
                             <div class="ranking-title">🏆 Kill Participation:</div>
-                            {self._generate_ranking(players, 'kill_participation')}
+                            {self._generate_ranking(index, 'kill_participation')}
                         </div>
                     </div>
                 </div>
@@ -874,11 +935,11 @@ class GitHubPagesGenerator:
                         </div>
                         <div class="stat-row">
                             <span>Team Size</span>
-                            <span class="stat-value">{len(players)} Players</span>
+                            <span class="stat-value">{overview['team_size']} Players</span>
                         </div>
                         <div class="stat-leaderboard">
                             <div class="ranking-title">🏆 Vision Leaderboard:</div>
-                            {self._generate_ranking(players, 'vision_score')}
+                            {self._generate_ranking(index, 'vision_score')}
                         </div>
                     </div>
                 </div>
@@ -935,162 +996,1072 @@ class GitHubPagesGenerator:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{team_name} - Professional LoL Dashboard</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        :root {{
-            --primary-color: #c89b3c;
-            --secondary-color: #0f2027;
-            --accent-color: #463714;
-            --success-color: #00f5ff;
-            --danger-color: #f0e6d2;
-            --warning-color: #cdbe91;
-            --text-primary: #f0e6d2;
-            --text-secondary: #cdbe91;
-            --bg-primary: #010a13;
-            --bg-secondary: #1e2328;
-            --bg-tertiary: #3c3c41;
-            --border-color: #463714;
-            --shadow: rgba(0, 0, 0, 0.5);
-        }}
+    {head_assets}
+</head>
+<body>
+    <div class="container">
+        <header class="header">
+            <h1 class="team-name">{team_name}</h1>
+            <div class="update-section">
+                <p class="last-updated">Letzte Aktualisierung: {last_updated}</p>
+                <button class="update-btn" onclick="updateData()">
+                    <span class="update-icon">🔄</span>
+                    <span class="update-text">Neu laden</span>
+                </button>
+            </div>
+        </header>
         
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            background: linear-gradient(135deg, var(--bg-primary) 0%, var(--secondary-color) 50%, var(--bg-secondary) 100%);
-            color: var(--text-primary);
-            min-height: 100vh;
-            padding: 0;
-            line-height: 1.6;
-        }}
+        {team_overview}
         
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 0 20px;
-        }}
+        <section class="players-section">
+            <h2 class="section-title">🎮 Team Members</h2>
+            <div class="players-grid">
+                {players_html}
+            </div>
+        </section>
         
-        .header {{
-            text-align: center;
-            margin-bottom: 30px;
-            padding: 40px;
-            background: linear-gradient(135deg, var(--bg-secondary) 0%, var(--bg-tertiary) 100%);
-            border-radius: 20px;
-            backdrop-filter: blur(20px);
-            border: 1px solid var(--border-color);
-            position: relative;
-            overflow: hidden;
-        }}
+        {team_comparison_charts}
+    </div>
+    
+    <script>
+        const playerData = {player_stats_data};
+    </script>
+    {body_script}
+</body>
+</html>"""
+    
+    def _get_dashboard_script(self) -> str:
+        """JavaScript des server-gerenderten Dashboards (Chart, Tooltips) - playerData steht inline davor"""
+        return """
+        // Chart.js Configuration
+        document.addEventListener('DOMContentLoaded', function() {
+            if (document.getElementById('teamStatsChart')) {
+                const ctx = document.getElementById('teamStatsChart').getContext('2d');
+                new Chart(ctx, {
+                    type: 'bar',
+                    data: {
+                        labels: playerData.labels,
+                        datasets: [{
+                            label: 'Win Rate (%)',
+                            data: playerData.winRates,
+                            backgroundColor: 'rgba(200, 155, 60, 0.8)',
+                            borderColor: 'rgba(200, 155, 60, 1)',
+                            borderWidth: 1
+                        }, {
+                            label: 'KDA Ratio',
+                            data: playerData.kdaRatios,
+                            backgroundColor: 'rgba(0, 245, 255, 0.8)',
+                            borderColor: 'rgba(0, 245, 255, 1)',
+                            borderWidth: 1,
+                            yAxisID: 'y1'
+                        }]
+                    },
+                    options: {
+                        responsive: true,
+                        plugins: {
+                            legend: {
+                                labels: {
+                                    color: '#f0e6d2'
+                                }
+                            }
+                        },
+                        scales: {
+                            x: {
+                                ticks: {
+                                    color: '#cdbe91'
+                                },
+                                grid: {
+                                    color: 'rgba(200, 155, 60, 0.1)'
+                                }
+                            },
+                            y: {
+                                type: 'linear',
+                                display: true,
+                                position: 'left',
+                                ticks: {
+                                    color: '#cdbe91'
+                                },
+                                grid: {
+                                    color: 'rgba(200, 155, 60, 0.1)'
+                                }
+                            },
+                            y1: {
+                                type: 'linear',
+                                display: true,
+                                position: 'right',
+                                ticks: {
+                                    color: '#cdbe91'
+                                },
+                                grid: {
+                                    drawOnChartArea: false,
+                                }
+                            }
+                        }
+                    }
+                });
+            }
+        });
         
-        .header::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 4px;
-            background: linear-gradient(90deg, var(--primary-color), var(--success-color), var(--primary-color));
-        }}
+        // Champion Tooltip Positioning
+        document.querySelectorAll('.champion-card').forEach(card => {
+            card.addEventListener('mouseenter', function(e) {
+                const tooltip = this.querySelector('.champion-tooltip');
+                if (!tooltip) return;
+                
+                const cardRect = this.getBoundingClientRect();
+                const viewportWidth = window.innerWidth;
+                const viewportHeight = window.innerHeight;
+                
+                let left = cardRect.left + cardRect.width / 2 - 140; // Center tooltip
+                let top = cardRect.top - 10; // Above card
+                
+                // Horizontal overflow check
+                if (left + 280 > viewportWidth - 20) {
+                    left = viewportWidth - 300;
+                }
+                if (left < 20) {
+                    left = 20;
+                }
+                
+                // Vertical overflow check - show below if not enough space above
+                if (top < 20) {
+                    top = cardRect.bottom + 10;
+                }
+                
+                tooltip.style.left = left + 'px';
+                tooltip.style.top = top + 'px';
+            });
+        });
         
-        .team-name {{
-            font-size: 3.5rem;
-            margin-bottom: 15px;
-            background: linear-gradient(45deg, var(--primary-color), var(--text-primary), var(--success-color));
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            font-weight: 700;
-            text-shadow: 0 0 30px rgba(200, 155, 60, 0.3);
-        }}
+        // Champion Icon Fallback Handling
+        document.querySelectorAll('.champion-icon').forEach(img => {
+            img.addEventListener('error', function() {
+                // Fallback für fehlende Champion-Icons
+                this.style.display = 'none';
+                const parent = this.parentElement;
+                const fallback = document.createElement('div');
+                fallback.className = 'champion-icon champion-fallback';
+                fallback.textContent = this.alt.charAt(0);
+                fallback.style.cssText = `
+                    background: var(--bg-tertiary);
+                    display: flex;
+                    align-items: center;
+                    justify-content: center;
+                    color: var(--text-secondary);
+                    font-weight: bold;
+                `;
+                parent.insertBefore(fallback, this);
+            });
+        });
         
-        .update-section {{
-            display: flex;
-            align-items: center;
-            gap: 20px;
-            justify-content: center;
-        }}
+        // MEGA TOOLTIP POSITIONING SYSTEM
+        document.querySelectorAll('.tooltip-trigger').forEach(trigger => {
+            trigger.addEventListener('mouseenter', function(e) {
+                const tooltip = this.querySelector('.tooltip');
+                if (!tooltip) return;
+                
+                // Reset position
+                tooltip.style.position = 'fixed';
+                tooltip.style.top = 'auto';
+                tooltip.style.left = 'auto';
+                tooltip.style.right = 'auto';
+                tooltip.style.bottom = 'auto';
+                
+                const triggerRect = this.getBoundingClientRect();
+                const tooltipRect = tooltip.getBoundingClientRect();
+                const viewportWidth = window.innerWidth;
+                const viewportHeight = window.innerHeight;
+                
+                let left = triggerRect.right + 10;
+                let top = triggerRect.top;
+                
+                // Horizontal overflow check
+                if (left + tooltipRect.width > viewportWidth - 20) {
+                    left = triggerRect.left - tooltipRect.width - 10;
+                }
+                
+                // Vertical overflow check
+                if (top + tooltipRect.height > viewportHeight - 20) {
+                    top = viewportHeight - tooltipRect.height - 20;
+                }
+                
+                if (top < 20) {
+                    top = 20;
+                }
+                
+                tooltip.style.left = left + 'px';
+                tooltip.style.top = top + 'px';
+            });
+        });
         
-        .last-updated {{
-            color: var(--text-secondary);
-            font-size: 1.1rem;
-            font-weight: 400;
-            margin: 0;
-        }}
+        // Simple Reload Function
+        function updateData() {
+            // Just reload the page - new data comes from running main.py manually
+            window.location.reload();
+        }
+    """
+    
+    def _get_shell_template(self) -> str:
+        """Statische Shell für Client Rendering - enthält keine Spielerdaten, nur Teamname, CSS und JS"""
+        return """<!DOCTYPE html>
+<html lang="de">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{team_name} - Professional LoL Dashboard</title>
+    {head_assets}
+</head>
+<body>
+    <div class="container">
+        <header class="header">
+            <h1 class="team-name">{team_name}</h1>
+            <div class="update-section">
+                <p class="last-updated">Letzte Aktualisierung: <span id="last-updated">...</span></p>
+                <button class="update-btn" onclick="updateData()">
+                    <span class="update-icon">🔄</span>
+                    <span class="update-text">Neu laden</span>
+                </button>
+            </div>
+        </header>
         
-        .update-btn {{
-            background: linear-gradient(135deg, var(--primary-color) 0%, #ffa726 100%);
-            border: none;
-            color: white;
-            padding: 12px 24px;
-            border-radius: 25px;
-            font-size: 14px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            box-shadow: 0 4px 15px rgba(200, 155, 60, 0.3);
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
+        <div id="team-overview">
+            <p class="no-data">⏳ Lade Team-Daten...</p>
+        </div>
         
-        .update-btn:hover {{
-            transform: translateY(-2px);
+        <section class="players-section">
+            <h2 class="section-title">🎮 Team Members</h2>
+            <div class="players-grid" id="players-grid"></div>
+        </section>
+        
+        {team_comparison_charts}
+    </div>
+    
+    {body_script}
+</body>
+</html>"""
+    
+    def _get_client_script(self) -> str:
+        """JavaScript für Client Rendering: lädt data.json und rendert Karten erst beim Sichtbarwerden"""
+        return """
+        // Client Rendering: Shell bleibt statisch, alle Daten kommen aus data.json
+        const DATA_URL = 'data.json';
+        const LANE_ORDER = { TOP: 1, JGL: 2, MID: 3, ADC: 4, SUPP: 5, FLEX: 6 };
+        // Aus stats_index.TIER_VALUES generiert
+        const TIER_VALUES = """ + json.dumps(TIER_VALUES) + """;
+        const COLUMNAR_FIELDS = ['recent_games', 'main_champions', 'enhanced_champions'];
+        const SHARED_CHAMPION_FIELDS = ['name', 'games'];
+        const MEDALS = ['🥇', '🥈', '🥉', '4️⃣', '5️⃣'];
+        
+        let championIcons = {};
+        let cardObserver = null;
+        let teamChart = null;
+        
+        function esc(value) {
+            return String(value === undefined || value === null ? '' : value).replace(/[&<>"']/g, c => (
+                { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }[c]
+            ));
+        }
+        
+        function num(value) {
+            return Number(value || 0).toLocaleString('en-US');
+        }
+        
+        function get(record, key, fallback) {
+            return record && record[key] !== undefined ? record[key] : fallback;
+        }
+        
+        function shortName(riotId) {
+            return riotId.split('#')[0];
+        }
+        
+        function tierClass(tier) {
+            const key = String(tier || '').toLowerCase();
+            return key in TIER_VALUES ? 'tier-' + key : 'tier-unranked';
+        }
+        
+        // Compact-Format (spaltenweise Listen) zurück in Listen von Objekten
+        function fromColumns(columns) {
+            const keys = Object.keys(columns);
+            const length = Math.max(0, ...keys.map(key => columns[key].length));
+            const rows = [];
+            for (let i = 0; i < length; i++) {
+                const row = {};
+                keys.forEach(key => {
+                    const value = columns[key][i];
+                    if (value !== null && value !== undefined) row[key] = value;
+                });
+                rows.push(row);
+            }
+            return rows;
+        }
+        
+        function expandPlayer(record) {
+            const player = Object.assign({}, record);
+            const compactChampions = record.enhanced_champions && !Array.isArray(record.enhanced_champions);
+            COLUMNAR_FIELDS.forEach(field => {
+                if (player[field] && !Array.isArray(player[field])) player[field] = fromColumns(player[field]);
+            });
+            if (compactChampions && Array.isArray(player.main_champions)) {
+                player.enhanced_champions = player.enhanced_champions.slice(0, player.main_champions.length).map((extra, i) => {
+                    const shared = {};
+                    SHARED_CHAMPION_FIELDS.forEach(key => {
+                        if (key in player.main_champions[i]) shared[key] = player.main_champions[i][key];
+                    });
+                    return Object.assign(shared, extra);
+                });
+            }
+            return player;
+        }
+        
+        async function loadTeamData() {
+            const response = await fetch(DATA_URL, { cache: 'no-cache' });
+            if (!response.ok) throw new Error('HTTP ' + response.status);
+            const data = await response.json();
+            
+            const players = Object.entries(data.players || {}).map(([riotId, record]) => {
+                if (data.format === 'split-v1') {
+                    // Nur das Manifest ist geladen - die Spieler-Datei wird erst beim Sichtbarwerden geholt
+                    return { riotId, summary: record, data: null, file: record.file + '?v=' + record.hash, compact: data.compact };
+                }
+                const player = data.format === 'compact-v1' ? expandPlayer(record) : record;
+                return { riotId, summary: player, data: player };
+            });
+            players.sort((a, b) => (LANE_ORDER[get(a.summary, 'lane', 'FLEX')] || 6) - (LANE_ORDER[get(b.summary, 'lane', 'FLEX')] || 6));
+            
+            return { data, players };
+        }
+        
+        async function loadPlayer(player) {
+            if (!player.data) {
+                const response = await fetch(player.file);
+                if (!response.ok) throw new Error('HTTP ' + response.status);
+                const record = await response.json();
+                player.data = player.compact ? expandPlayer(record) : record;
+            }
+            return player.data;
+        }
+        
+        // ---------- Leaderboards ----------
+        
+        // Reihenfolge und Anzeige-Text kommen fertig aus data.json (stats_index.py) - hier wird nur gerendert
+        function renderRanking(leaderboards, metric) {
+            const ranked = leaderboards[metric] || [];
+            if (!ranked.length) return "<div class='no-ranking'>Keine Daten verfügbar</div>";
+            
+            const highlighted = ['win_rate', 'kda_ratio', 'performance_score'].includes(metric);
+            
+            return ranked.map((entry, i) => {
+                const rankClass = highlighted ? (['rank-gold', 'rank-silver', 'rank-bronze'][i] || 'rank-normal') : 'rank-normal';
+                return `
+            <div class="ranking-item ${rankClass}">
+                <span class="rank-medal">${MEDALS[i] || (i + 1) + '.'}</span>
+                <span class="rank-player">${esc(entry.name)}</span>
+                <span class="rank-value">${esc(entry.text)}</span>
+            </div>`;
+            }).join('');
+        }
+        
+        // ---------- Team Overview ----------
+        
+        // Team-KPIs kommen fertig berechnet aus data.json (StatsIndex.team_overview) - hier wird nur gerendert
+        function renderTeamOverview(overview, leaderboards) {
+            if (!overview || !overview.team_size) return '<p>Keine Spieler-Daten verfügbar</p>';
+            const highestName = esc(overview.highest_name);
+            
+            return `
+        <div class="grafana-dashboard">
+            <h2 class="dashboard-title">📊 Team Performance Dashboard</h2>
+            
+            <div class="kpi-grid">
+                <div class="kpi-card primary">
+                    <div class="kpi-header">
+                        <span class="kpi-title">Win Rate</span>
+                        <span class="kpi-trend ${esc(overview.trend_class)}">${overview.trend_icon}</span>
+                        <div class="tooltip-trigger">?
+                            <div class="tooltip">
+                                <strong>Team Win Rate</strong><br>
+                                Durchschnitt aller Spieler Win Rates<br>
+                                Berechnung: Σ(Wins) / Σ(Games) × 100<br>
+                                <br>
+                                📊 <strong>Games Breakdown:</strong><br>
+                                • Total Games: ${overview.total_games}<br>
+                                • Total Wins: ${overview.total_wins}<br>
+                                • Total Losses: ${overview.total_losses}<br>
+                                <em>Höhere Win Rate = Besseres Team</em>
+                            </div>
+                        </div>
+                    </div>
+                    <div class="kpi-value">${overview.avg_win_rate}%</div>
+                    <div class="kpi-subtitle">${overview.total_wins} wins of ${overview.total_games} games</div>
+                    <div class="kpi-ranking">
+                        <div class="ranking-title">🏆 Win Rate Leaderboard:</div>
+                        ${renderRanking(leaderboards, 'win_rate')}
+                    </div>
+                </div>
+                
+                <div class="kpi-card secondary">
+                    <div class="kpi-header">
+                        <span class="kpi-title">Performance Score</span>
+                        <span class="kpi-icon">⭐</span>
+                        <div class="tooltip-trigger">?
+                            <div class="tooltip">
+                                <strong>Team Performance Score</strong><br>
+                                <em>Wie gut performt das Team insgesamt?</em><br>
+                                <br>
+                                🔥 <strong>Berechnung:</strong><br>
+                                • Win Rate × 0.4 (40%)<br>
+                                • KDA Ratio × 15 (35%)<br>
+                                • Kill Participation × 0.45 (25%)<br>
+                                <br>
+                                📈 <strong>Score Bedeutung:</strong><br>
+                                • 90-100: Elite Team<br>
+                                • 80-89: Sehr stark<br>
+                                • 70-79: Gut<br>
+                                • 60-69: Durchschnitt<br>
+                                • &lt;60: Verbesserung nötig
+                            </div>
+                        </div>
+                    </div>
+                    <div class="kpi-value">${overview.performance_rating}/100</div>
+                    <div class="kpi-subtitle">Overall team rating</div>
+                    <div class="kpi-ranking">
+                        <div class="ranking-title">🏆 Performance Leaderboard:</div>
+                        ${renderRanking(leaderboards, 'performance_score')}
+                    </div>
+                </div>
+                
+                <div class="kpi-card tertiary">
+                    <div class="kpi-header">
+                        <span class="kpi-title">Average KDA</span>
+                        <span class="kpi-icon">⚔️</span>
+                        <div class="tooltip-trigger">?
+                            <div class="tooltip">
+                                <strong>Average KDA Ratio</strong><br>
+                                Kill/Death/Assist Verhältnis<br>
+                                Berechnung: (Kills + Assists) / Deaths<br>
+                                <em>Höhere Werte = Bessere Performance</em><br>
+                                Team-Durchschnitt: ${overview.avg_kda}
+                            </div>
+                        </div>
+                    </div>
+                    <div class="kpi-value">${overview.avg_kda}</div>
+                    <div class="kpi-subtitle">Kill/Death/Assist ratio</div>
+                    <div class="kpi-ranking">
+                        <div class="ranking-title">🏆 KDA Leaderboard:</div>
+                        ${renderRanking(leaderboards, 'kda_ratio')}
+                    </div>
+                </div>
+                
+                <div class="kpi-card quaternary">
+                    <div class="kpi-header">
+                        <span class="kpi-title">Highest Rank</span>
+                        <span class="kpi-icon">👑</span>
+                        <div class="tooltip-trigger">?
+                            <div class="tooltip">
+                                <strong>Team's Highest Rank</strong><br>
+                                Beste Ranglistenplatzierung im Team<br>
+                                Berechnung: Max(Tier + Division + LP)<br>
+                                <em>Challenger &gt; Master &gt; Diamond &gt; Emerald &gt; ...</em><br>
+                                Erreicht von: ${highestName}
+                            </div>
+                        </div>
+                    </div>
+                    <div class="kpi-value">${esc(overview.highest_rank)}</div>
+                    <div class="kpi-subtitle">${highestName}</div>
+                    <div class="kpi-ranking">
+                        <div class="ranking-title">🏆 Rank Leaderboard:</div>
+                        ${renderRanking(leaderboards, 'rank_value')}
+                    </div>
+                </div>
+            </div>
+            
+            <div class="stats-grid">
+                <div class="stat-card">
+                    <div class="stat-header">
+                        💰 Economic Performance
+                        <div class="tooltip-trigger">?
+                            <div class="tooltip">
+                                <strong>Economic Performance</strong><br>
+                                Zeigt die Farming- und Gold-Effizienz<br>
+                                <br>
+                                💰 <strong>Gold per Game:</strong><br>
+                                Durchschnittliches Gold pro Match<br>
+                                Beinhaltet: Farming, Kills, Assists, Objectives<br>
+                                <br>
+                                ⚔️ <strong>CS per Game:</strong><br>
+                                Creep Score (Minions + Jungle)<br>
+                                Zeigt Farming-Effizienz und Macro-Spiel<br>
+                                <em>Mehr Gold = Stärkere Items = Mehr Damage</em>
+                            </div>
+                        </div>
+                    </div>
+                    <div class="stat-body">
+                        <div class="stat-row">
+                            <span>Avg Gold per Game</span>
+                            <span class="stat-value">${num(overview.avg_gold)}</span>
+                        </div>
+                        <div class="stat-row">
+                            <span>Avg CS per Game</span>
+                            <span class="stat-value">${overview.avg_cs}</span>
+                        </div>
+                        <div class="stat-leaderboard">
+                            <div class="ranking-title">🏆 Gold Leaderboard:</div>
+                            ${renderRanking(leaderboards, 'avg_gold')}
+                        </div>
+                        <div class="stat-leaderboard">
+                            <div class="ranking-title">🏆 CS Leaderboard:</div>
+                            ${renderRanking(leaderboards, 'avg_cs')}
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="stat-card">
+                    <div class="stat-header">
+                        🎯 Combat Stats
+                        <div class="tooltip-trigger">?
+                            <div class="tooltip">
+                                <strong>Combat Performance</strong><br>
+                                Zeigt Teamfight- und Damage-Effizienz<br>
+                                <br>
+                                💥 <strong>Damage per Game:</strong><br>
+                                Durchschnittlicher Schaden an Champions<br>
+                                Beinhaltet: Skill-Damage, Auto-Attacks, DOTs<br>
+                                <br>
+                                🤝 <strong>Kill Participation:</strong><br>
+                                % der Team-Kills mit Beteiligung<br>
+                                Berechnung: (Kills + Assists) / Team Kills<br>
+                                <em>Höhere Werte = Mehr Teamfight Impact</em>
+                            </div>
+                        </div>
+                    </div>
+                    <div class="stat-body">
+                        <div class="stat-row">
+                            <span>Avg Damage per Game</span>
+                            <span class="stat-value">${num(overview.avg_damage)}</span>
+                        </div>
+                        <div class="stat-row">
+                            <span>Kill Participation</span>
+                            <span class="stat-value">${overview.avg_kill_participation}%</span>
+                        </div>
+                        <div class="stat-leaderboard">
+                            <div class="ranking-title">🏆 Damage Leaderboard:</div>
+                            ${renderRanking(leaderboards, 'avg_damage')}
+                        </div>
+                        <div class="stat-leaderboard">
+                            <div class="ranking-title">🏆 Kill Participation:</div>
+                            ${renderRanking(leaderboards, 'kill_participation')}
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="stat-card">
+                    <div class="stat-header">
+                        👁️ Vision Control
+                        <div class="tooltip-trigger">?
+                            <div class="tooltip">
+                                <strong>Vision Control</strong><br>
+                                Zeigt Map-Awareness und Team-Support<br>
+                                <br>
+                                👁️ <strong>Vision Score:</strong><br>
+                                Berechnung basierend auf:<br>
+                                • Wards platziert (1 Punkt/Min)<br>
+                                • Enemy Wards zerstört (1 Punkt)<br>
+                                • Ward Duration Bonus<br>
+                                <br>
+                                📊 <strong>Benchmark:</strong><br>
+                                • Support: 60-100+<br>
+                                • Jungle: 40-70<br>
+                                • Andere Rollen: 20-50<br>
+                                <em>Vision = Map Control = Mehr Wins</em>
+                            </div>
+                        </div>
+                    </div>
+                    <div class="stat-body">
+                        <div class="stat-row">
+                            <span>Avg Vision Score</span>
+                            <span class="stat-value">${overview.avg_vision}</span>
+                        </div>
+                        <div class="stat-row">
+                            <span>Team Size</span>
+                            <span class="stat-value">${overview.team_size} Players</span>
+                        </div>
+                        <div class="stat-leaderboard">
+                            <div class="ranking-title">🏆 Vision Leaderboard:</div>
+                            ${renderRanking(leaderboards, 'vision_score')}
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>`;
+        }
+        
+        // ---------- Spieler-Karten ----------
+        
+        function renderChampionCards(champions) {
+            if (!champions || !champions.length) return "<div class='no-champions'>Keine Champion-Daten verfügbar</div>";
+            
+            return champions.slice(0, 2).map(champ => {
+                const name = get(champ, 'name', 'Unknown');
+                const wins = get(champ, 'wins', 0);
+                const losses = get(champ, 'losses', 0);
+                const winRate = get(champ, 'win_rate', 0);
+                const avgKda = get(champ, 'avg_kda', 0);
+                // Bewertung aus data.json (stats_index.rate_champion)
+                const wrClass = esc(get(champ, 'wr_class', ''));
+                const kdaClass = esc(get(champ, 'kda_class', ''));
+                
+                return `
+            <div class="champion-card modern-card" data-champion="${esc(name)}">
+                <div class="champion-header">
+                    <img src="${esc(get(champ, 'icon_url', championIcons[name] || ''))}" alt="${esc(name)}" class="champion-icon" loading="lazy">
+                    <div class="champion-basic-info">
+                        <span class="champion-name">${esc(name)}</span>
+                        <span class="champion-games">${get(champ, 'games', 0)} Games (${wins}W/${losses}L)</span>
+                    </div>
+                    <div class="champion-winrate ${wrClass}">
+                        ${Number(winRate).toFixed(2)}%
+                        <div class="champion-tooltip">
+                            <strong>${esc(name)} Performance</strong><br>
+                            🏆 <strong>Win Rate:</strong> ${Number(winRate).toFixed(2)}% (${wins}W-${losses}L)<br>
+                            🎮 <strong>Games Played:</strong> ${get(champ, 'games', 0)}<br>
+                            📊 <strong>Performance Rating:</strong> ${esc(get(champ, 'rating', ''))}<br>
+                            <br>
+                            💡 <strong>Analysis:</strong><br>
+                            ${esc(get(champ, 'analysis', ''))}
+                        </div>
+                    </div>
+                </div>
+                <div class="champion-stats-extended">
+                    <div class="stat-item">
+                        <span class="stat-label">KDA</span>
+                        <span class="stat-value ${kdaClass}">${avgKda}</span>
+                    </div>
+                    <div class="stat-item">
+                        <span class="stat-label">DMG</span>
+                        <span class="stat-value">${num(get(champ, 'avg_damage', 0))}</span>
+                    </div>
+                    <div class="stat-item">
+                        <span class="stat-label">CS</span>
+                        <span class="stat-value">${get(champ, 'avg_cs', 0)}</span>
+                    </div>
+                </div>
+            </div>`;
+            }).join('');
+        }
+        
+        function renderRecentGames(games) {
+            if (!games || !games.length) return "<div class='no-games'>Keine Recent Games verfügbar</div>";
+            
+            return games.slice(0, 3).map(game => {
+                const result = get(game, 'result', 'L');
+                const champion = get(game, 'champion', 'Unknown');
+                const resultClass = result === 'W' ? 'win' : 'loss';
+                return `
+            <div class="recent-game ${resultClass}">
+                <div class="game-result">
+                    <span class="result-badge ${resultClass}">${esc(result)}</span>
+                </div>
+                <div class="game-champion">
+                    <img src="${esc(championIcons[champion] || '')}" alt="${esc(champion)}" class="champion-icon-small" loading="lazy">
+                    <span class="champion-name-small">${esc(champion)}</span>
+                </div>
+                <div class="game-stats">
+                    <span class="kda">${esc(get(game, 'kda', '0/0/0'))}</span>
+                    <span class="cs">${get(game, 'cs', 0)} CS</span>
+                </div>
+                <div class="game-info">
+                    <span class="duration">${esc(get(game, 'duration', '25m'))}</span>
+                    <span class="when">${esc(get(game, 'when', '1 day ago'))}</span>
+                </div>
+            </div>`;
+            }).join('');
+        }
+        
+        function renderTrend(results) {
+            if (!results || !results.length) return "<div class='no-trend'>Keine Trend-Daten verfügbar</div>";
+            return results.slice(-10).map(result => (
+                `<span class="game-result ${result === 'W' ? 'win' : 'loss'}">${esc(result)}</span>`
+            )).join('');
+        }
+        
+        function renderPlayerCard(riotId, player) {
+            const tier = get(player, 'tier', 'Unranked');
+            const lane = get(player, 'lane', 'FLEX');
+            const parts = riotId.split('#');
+            
+            return `
+            <div class="player-card modern-player ${tierClass(tier)}" data-role="${esc(lane)}">
+                <div class="player-header">
+                    <div class="player-identity">
+                        <h3 class="player-name">${esc(parts[0])}</h3>
+                        <span class="player-tag">#${esc(parts.length > 1 ? parts[1] : '')}</span>
+                        <span class="player-role">${esc(lane)}</span>
+                    </div>
+                    <div class="player-rank-info">
+                        <div class="rank-badge ${tierClass(tier)}">
+                            <span class="tier">${esc(tier)}</span>
+                            <span class="lp">${get(player, 'lp', 0)} LP</span>
+                        </div>
+                        <div class="games-info">
+                            <span class="winrate">${get(player, 'win_rate', 0)}%</span>
+                            <span class="games">${get(player, 'wins', 0)}W ${get(player, 'losses', 0)}L</span>
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="player-stats-grid">
+                    <div class="stat-box">
+                        <span class="stat-label">KDA</span>
+                        <span class="stat-value">${get(player, 'kda_ratio', 0)}</span>
+                    </div>
+                    <div class="stat-box">
+                        <span class="stat-label">DMG</span>
+                        <span class="stat-value">${num(get(player, 'avg_damage', 0))}</span>
+                    </div>
+                    <div class="stat-box">
+                        <span class="stat-label">CS</span>
+                        <span class="stat-value">${get(player, 'avg_cs', 0)}</span>
+                    </div>
+                    <div class="stat-box">
+                        <span class="stat-label">Vision</span>
+                        <span class="stat-value">${get(player, 'vision_score', 0)}</span>
+                    </div>
+                </div>
+                
+                <div class="champions-section">
+                    <h4>Main Champions</h4>
+                    <div class="champions-grid">
+                        ${renderChampionCards(player.enhanced_champions)}
+                    </div>
+                </div>
+                
+                <div class="recent-games-section">
+                    <h4>Recent Games</h4>
+                    <div class="recent-games-list">
+                        ${renderRecentGames(player.recent_games)}
+                    </div>
+                </div>
+                
+                <div class="performance-section">
+                    <h4>Recent Games</h4>
+                    <div class="performance-trend">
+                        ${renderTrend(player.recent_performance)}
+                    </div>
+                </div>
+            </div>`;
+        }
+        
+        async function fillPlayerCard(placeholder) {
+            const player = placeholder.playerEntry;
+            try {
+                const data = await loadPlayer(player);
+                const template = document.createElement('template');
+                template.innerHTML = renderPlayerCard(player.riotId, data).trim();
+                const card = template.content.firstElementChild;
+                placeholder.replaceWith(card);
+                bindInteractions(card);
+            } catch (error) {
+                placeholder.classList.add('player-error');
+                placeholder.querySelector('.player-name').textContent += ' ⚠️';
+            }
+        }
+        
+        // Karten als Platzhalter anlegen und erst beim Scrollen in die Nähe rendern
+        function renderPlayers(players) {
+            const grid = document.getElementById('players-grid');
+            if (cardObserver) cardObserver.disconnect();
+            grid.innerHTML = '';
+            
+            const placeholders = players.map(player => {
+                const placeholder = document.createElement('div');
+                placeholder.className = `player-card modern-player player-placeholder ${tierClass(get(player.summary, 'tier', ''))}`;
+                placeholder.dataset.role = get(player.summary, 'lane', 'FLEX');
+                placeholder.innerHTML = `<div class="player-header"><div class="player-identity"><h3 class="player-name">${esc(shortName(player.riotId))}</h3></div></div>`;
+                placeholder.playerEntry = player;
+                grid.appendChild(placeholder);
+                return placeholder;
+            });
+            
+            if ('IntersectionObserver' in window) {
+                cardObserver = new IntersectionObserver(entries => {
+                    entries.forEach(entry => {
+                        if (!entry.isIntersecting) return;
+                        cardObserver.unobserve(entry.target);
+                        fillPlayerCard(entry.target);
+                    });
+                }, { rootMargin: '300px 0px' });
+                placeholders.forEach(placeholder => cardObserver.observe(placeholder));
+            } else {
+                placeholders.forEach(fillPlayerCard);
+            }
+        }
+        
+        // ---------- Chart + Interaktionen ----------
+        
+        function renderChart(players) {
+            const canvas = document.getElementById('teamStatsChart');
+            if (!canvas || typeof Chart === 'undefined') return;
+            if (teamChart) teamChart.destroy();
+            
+            const top = players.slice(0, 5);
+            teamChart = new Chart(canvas.getContext('2d'), {
+                type: 'bar',
+                data: {
+                    labels: top.map(player => shortName(player.riotId)),
+                    datasets: [{
+                        label: 'Win Rate (%)',
+                        data: top.map(player => get(player.summary, 'win_rate', 0)),
+                        backgroundColor: 'rgba(200, 155, 60, 0.8)',
+                        borderColor: 'rgba(200, 155, 60, 1)',
+                        borderWidth: 1
+                    }, {
+                        label: 'KDA Ratio',
+                        data: top.map(player => get(player.summary, 'kda_ratio', 0)),
+                        backgroundColor: 'rgba(0, 245, 255, 0.8)',
+                        borderColor: 'rgba(0, 245, 255, 1)',
+                        borderWidth: 1,
+                        yAxisID: 'y1'
+                    }]
+                },
+                options: {
+                    responsive: true,
+                    plugins: { legend: { labels: { color: '#f0e6d2' } } },
+                    scales: {
+                        x: { ticks: { color: '#cdbe91' }, grid: { color: 'rgba(200, 155, 60, 0.1)' } },
+                        y: { type: 'linear', display: true, position: 'left', ticks: { color: '#cdbe91' }, grid: { color: 'rgba(200, 155, 60, 0.1)' } },
+                        y1: { type: 'linear', display: true, position: 'right', ticks: { color: '#cdbe91' }, grid: { drawOnChartArea: false } }
+                    }
+                }
+            });
+        }
+        
+        function bindInteractions(root) {
+            // Champion Tooltip Positioning
+            root.querySelectorAll('.champion-card').forEach(card => {
+                card.addEventListener('mouseenter', function() {
+                    const tooltip = this.querySelector('.champion-tooltip');
+                    if (!tooltip) return;
+                    const cardRect = this.getBoundingClientRect();
+                    let left = Math.max(20, Math.min(cardRect.left + cardRect.width / 2 - 140, window.innerWidth - 300));
+                    let top = cardRect.top - 10;
+                    if (top < 20) top = cardRect.bottom + 10;
+                    tooltip.style.left = left + 'px';
+                    tooltip.style.top = top + 'px';
+                });
+            });
+            
+            // Champion Icon Fallback Handling
+            root.querySelectorAll('.champion-icon').forEach(img => {
+                img.addEventListener('error', function() {
+                    this.style.display = 'none';
+                    const fallback = document.createElement('div');
+                    fallback.className = 'champion-icon champion-fallback';
+                    fallback.textContent = this.alt.charAt(0);
+                    this.parentElement.insertBefore(fallback, this);
+                });
+            });
+            
+            // Tooltip Positioning
+            root.querySelectorAll('.tooltip-trigger').forEach(trigger => {
+                trigger.addEventListener('mouseenter', function() {
+                    const tooltip = this.querySelector('.tooltip');
+                    if (!tooltip) return;
+                    tooltip.style.position = 'fixed';
+                    const triggerRect = this.getBoundingClientRect();
+                    const tooltipRect = tooltip.getBoundingClientRect();
+                    let left = triggerRect.right + 10;
+                    let top = triggerRect.top;
+                    if (left + tooltipRect.width > window.innerWidth - 20) left = triggerRect.left - tooltipRect.width - 10;
+                    if (top + tooltipRect.height > window.innerHeight - 20) top = window.innerHeight - tooltipRect.height - 20;
+                    if (top < 20) top = 20;
+                    tooltip.style.left = left + 'px';
+                    tooltip.style.top = top + 'px';
+                });
+            });
+        }
+        
+        async function renderDashboard() {
+            const overview = document.getElementById('team-overview');
+            try {
+                const { data, players } = await loadTeamData();
+                championIcons = data.champion_icons || {};
+                
+                document.getElementById('last-updated').textContent = data.last_updated || '';
+                overview.innerHTML = renderTeamOverview(data.overview, data.leaderboards || {});
+                bindInteractions(overview);
+                renderPlayers(players);
+                renderChart(players);
+            } catch (error) {
+                overview.innerHTML = `<p class="no-data">❌ ${DATA_URL} konnte nicht geladen werden (${esc(error.message)}). Lokal: <code>python -m http.server</code> im docs/ Ordner starten.</p>`;
+            }
+        }
+        
+        // Neu laden holt nur data.json - die Seite selbst bleibt im Cache
+        function updateData() {
+            const button = document.querySelector('.update-btn');
+            if (button) button.classList.add('loading');
+            renderDashboard().finally(() => button && button.classList.remove('loading'));
+        }
+        
+        document.addEventListener('DOMContentLoaded', renderDashboard);
+    """
+    
+    def _get_stylesheet(self) -> str:
+        """CSS des Dashboards - einfache Klammern, wird beim Kompilieren fest ins Template eingesetzt"""
+        return """
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        
+        :root {
+            --primary-color: #c89b3c;
+            --secondary-color: #0f2027;
+            --accent-color: #463714;
+            --success-color: #00f5ff;
+            --danger-color: #f0e6d2;
+            --warning-color: #cdbe91;
+            --text-primary: #f0e6d2;
+            --text-secondary: #cdbe91;
+            --bg-primary: #010a13;
+            --bg-secondary: #1e2328;
+            --bg-tertiary: #3c3c41;
+            --border-color: #463714;
+            --shadow: rgba(0, 0, 0, 0.5);
+        }
+        
+        body {
+            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+            background: linear-gradient(135deg, var(--bg-primary) 0%, var(--secondary-color) 50%, var(--bg-secondary) 100%);
+            color: var(--text-primary);
+            min-height: 100vh;
+            padding: 0;
+            line-height: 1.6;
+        }
+        
+        .container {
+            max-width: 1400px;
+            margin: 0 auto;
+            padding: 0 20px;
+        }
+        
+        .header {
+            text-align: center;
+            margin-bottom: 30px;
+            padding: 40px;
+            background: linear-gradient(135deg, var(--bg-secondary) 0%, var(--bg-tertiary) 100%);
+            border-radius: 20px;
+            backdrop-filter: blur(20px);
+            border: 1px solid var(--border-color);
+            position: relative;
+            overflow: hidden;
+        }
+        
+        .header::before {
+            content: '';
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+            height: 4px;
+            background: linear-gradient(90deg, var(--primary-color), var(--success-color), var(--primary-color));
+        }
+        
+        .team-name {
+            font-size: 3.5rem;
+            margin-bottom: 15px;
+            background: linear-gradient(45deg, var(--primary-color), var(--text-primary), var(--success-color));
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            background-clip: text;
+            font-weight: 700;
+            text-shadow: 0 0 30px rgba(200, 155, 60, 0.3);
+        }
+        
+        .update-section {
+            display: flex;
+            align-items: center;
+            gap: 20px;
+            justify-content: center;
+        }
+        
+        .last-updated {
+            color: var(--text-secondary);
+            font-size: 1.1rem;
+            font-weight: 400;
+            margin: 0;
+        }
+        
+        .update-btn {
+            background: linear-gradient(135deg, var(--primary-color) 0%, #ffa726 100%);
+            border: none;
+            color: white;
+            padding: 12px 24px;
+            border-radius: 25px;
+            font-size: 14px;
+            font-weight: 600;
+            cursor: pointer;
+            transition: all 0.3s ease;
+            display: flex;
+            align-items: center;
+            gap: 8px;
+            box-shadow: 0 4px 15px rgba(200, 155, 60, 0.3);
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+        }
+        
+        .update-btn:hover {
+            transform: translateY(-2px);
             box-shadow: 0 8px 25px rgba(200, 155, 60, 0.5);
             background: linear-gradient(135deg, #ffa726 0%, var(--primary-color) 100%);
-        }}
+        }
         
-        .update-btn:active {{
+        .update-btn:active {
             transform: translateY(0);
-        }}
+        }
         
-        .update-btn.loading {{
+        .update-btn.loading {
             opacity: 0.7;
             cursor: not-allowed;
-        }}
+        }
         
-        .update-btn.loading .update-icon {{
+        .update-btn.loading .update-icon {
             animation: spin 1s linear infinite;
-        }}
+        }
         
-        @keyframes spin {{
-            from {{ transform: rotate(0deg); }}
-            to {{ transform: rotate(360deg); }}
-        }}
+        @keyframes spin {
+            from { transform: rotate(0deg); }
+            to { transform: rotate(360deg); }
+        }
         
         /* Grafana-Style Dashboard */
-        .grafana-dashboard {{
+        .grafana-dashboard {
             margin-bottom: 40px;
             padding: 30px;
             background: linear-gradient(135deg, var(--bg-secondary) 0%, var(--bg-tertiary) 100%);
             border-radius: 16px;
             border: 1px solid var(--border-color);
             box-shadow: 0 8px 32px var(--shadow);
-        }}
+        }
         
-        .dashboard-title {{
+        .dashboard-title {
             margin-bottom: 30px;
             color: var(--primary-color);
             font-size: 2rem;
             font-weight: 700;
             text-align: center;
             text-shadow: 0 0 20px rgba(200, 155, 60, 0.3);
-        }}
+        }
         
-        .kpi-grid {{
+        .kpi-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
+        }
         
-        .kpi-card {{
+        .kpi-card {
             padding: 20px;
             border-radius: 12px;
             border: 1px solid var(--border-color);
@@ -1098,175 +2069,175 @@ class GitHubPagesGenerator:
             transition: all 0.3s ease;
             position: relative;
             overflow: hidden;
-        }}
+        }
         
-        .kpi-card::before {{
+        .kpi-card::before {
             content: '';
             position: absolute;
             top: 0;
             left: 0;
             right: 0;
             height: 3px;
-        }}
+        }
         
-        .kpi-card.primary {{
+        .kpi-card.primary {
             background: linear-gradient(135deg, var(--bg-primary) 0%, var(--bg-secondary) 100%);
-        }}
+        }
         
-        .kpi-card.primary::before {{
+        .kpi-card.primary::before {
             background: linear-gradient(90deg, var(--primary-color), var(--success-color));
-        }}
+        }
         
-        .kpi-card.secondary {{
+        .kpi-card.secondary {
             background: linear-gradient(135deg, var(--bg-primary) 0%, var(--bg-secondary) 100%);
-        }}
+        }
         
-        .kpi-card.secondary::before {{
+        .kpi-card.secondary::before {
             background: linear-gradient(90deg, var(--success-color), var(--primary-color));
-        }}
+        }
         
-        .kpi-card.tertiary {{
+        .kpi-card.tertiary {
             background: linear-gradient(135deg, var(--bg-primary) 0%, var(--bg-secondary) 100%);
-        }}
+        }
         
-        .kpi-card.tertiary::before {{
+        .kpi-card.tertiary::before {
             background: linear-gradient(90deg, var(--warning-color), var(--primary-color));
-        }}
+        }
         
-        .kpi-card.quaternary {{
+        .kpi-card.quaternary {
             background: linear-gradient(135deg, var(--bg-primary) 0%, var(--bg-secondary) 100%);
-        }}
+        }
         
-        .kpi-card.quaternary::before {{
+        .kpi-card.quaternary::before {
             background: linear-gradient(90deg, var(--primary-color), var(--warning-color));
-        }}
+        }
         
-        .kpi-card:hover {{
+        .kpi-card:hover {
             transform: translateY(-4px);
             box-shadow: 0 8px 24px rgba(200, 155, 60, 0.2);
-        }}
+        }
         
-        .kpi-header {{
+        .kpi-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 15px;
-        }}
+        }
         
-        .kpi-title {{
+        .kpi-title {
             font-size: 0.9rem;
             color: var(--text-secondary);
             text-transform: uppercase;
             font-weight: 600;
             letter-spacing: 1px;
-        }}
+        }
         
-        .kpi-trend, .kpi-icon {{
+        .kpi-trend, .kpi-icon {
             font-size: 1.2rem;
-        }}
+        }
         
-        .kpi-trend.trend-up {{
+        .kpi-trend.trend-up {
             color: var(--success-color);
-        }}
+        }
         
-        .kpi-trend.trend-stable {{
+        .kpi-trend.trend-stable {
             color: var(--warning-color);
-        }}
+        }
         
-        .kpi-trend.trend-down {{
+        .kpi-trend.trend-down {
             color: var(--danger-color);
-        }}
+        }
         
-        .kpi-value {{
+        .kpi-value {
             font-size: 2.5rem;
             font-weight: 700;
             color: var(--text-primary);
             margin-bottom: 8px;
             text-shadow: 0 0 10px rgba(240, 230, 210, 0.3);
-        }}
+        }
         
-        .kpi-subtitle {{
+        .kpi-subtitle {
             font-size: 0.8rem;
             color: var(--text-secondary);
             font-weight: 400;
-        }}
+        }
         
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
             gap: 20px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             padding: 20px;
             background: linear-gradient(135deg, var(--bg-primary) 0%, var(--bg-secondary) 100%);
             border-radius: 12px;
             border: 1px solid var(--border-color);
             box-shadow: 0 4px 16px rgba(0, 0, 0, 0.3);
             transition: all 0.3s ease;
-        }}
+        }
         
-        .stat-card:hover {{
+        .stat-card:hover {
             transform: translateY(-2px);
             box-shadow: 0 6px 20px rgba(200, 155, 60, 0.15);
-        }}
+        }
         
-        .stat-header {{
+        .stat-header {
             font-size: 1.1rem;
             font-weight: 600;
             color: var(--primary-color);
             margin-bottom: 15px;
             padding-bottom: 10px;
             border-bottom: 1px solid rgba(200, 155, 60, 0.2);
-        }}
+        }
         
-        .stat-body {{
+        .stat-body {
             display: flex;
             flex-direction: column;
             gap: 10px;
-        }}
+        }
         
-        .stat-row {{
+        .stat-row {
             display: flex;
             justify-content: space-between;
             align-items: center;
             padding: 8px 0;
-        }}
+        }
         
-        .stat-row span:first-child {{
+        .stat-row span:first-child {
             color: var(--text-secondary);
             font-size: 0.9rem;
-        }}
+        }
         
-        .stat-row .stat-value {{
+        .stat-row .stat-value {
             color: var(--text-primary);
             font-weight: 600;
             font-size: 1rem;
-        }}
+        }
         
         /* Player Cards */
-        .players-section {{
+        .players-section {
             margin-bottom: 40px;
-        }}
+        }
         
-        .section-title {{
+        .section-title {
             font-size: 2.2rem;
             margin-bottom: 30px;
             color: var(--primary-color);
             text-align: center;
             font-weight: 700;
-        }}
+        }
         
-        .players-grid {{
+        .players-grid {
             display: grid;
             grid-template-columns: repeat(5, minmax(280px, 1fr));
             gap: 20px;
             max-width: 1800px;
             margin: 0 auto;
             overflow-x: auto;
-        }}
+        }
         
-        .player-card {{
+        .player-card {
             background: linear-gradient(135deg, var(--bg-secondary) 0%, var(--bg-tertiary) 100%);
             border-radius: 14px;
             padding: 14px;
@@ -1276,40 +2247,40 @@ class GitHubPagesGenerator:
             position: relative;
             overflow: hidden;
             min-height: auto;
-        }}
+        }
         
-        .player-card:hover {{
+        .player-card:hover {
             transform: translateY(-5px);
             box-shadow: 0 15px 40px rgba(200, 155, 60, 0.2);
-        }}
+        }
         
-        .player-header {{
+        .player-header {
             display: flex;
             justify-content: space-between;
             align-items: flex-start;
             margin-bottom: 20px;
-        }}
+        }
         
-        .player-identity {{
+        .player-identity {
             display: flex;
             flex-direction: column;
             gap: 5px;
-        }}
+        }
         
-        .player-name {{
+        .player-name {
             font-size: 1.4rem;
             font-weight: 700;
             color: var(--text-primary);
             margin: 0;
-        }}
+        }
         
-        .player-tag {{
+        .player-tag {
             font-size: 0.9rem;
             color: var(--text-secondary);
             font-weight: 500;
-        }}
+        }
         
-        .player-role {{
+        .player-role {
             background: linear-gradient(135deg, rgba(200, 155, 60, 0.3), rgba(0, 245, 255, 0.1));
             color: var(--primary-color);
             padding: 4px 10px;
@@ -1320,95 +2291,95 @@ class GitHubPagesGenerator:
             border: 1px solid rgba(200, 155, 60, 0.4);
             box-shadow: 0 2px 6px rgba(200, 155, 60, 0.2);
             letter-spacing: 0.5px;
-        }}
+        }
         
         /* Role-spezifische Farben */
-        .player-card[data-role="TOP"] .player-role {{
+        .player-card[data-role="TOP"] .player-role {
             background: linear-gradient(135deg, rgba(255, 87, 87, 0.3), rgba(255, 87, 87, 0.1));
             color: #ff5757;
             border-color: rgba(255, 87, 87, 0.4);
-        }}
+        }
         
-        .player-card[data-role="JGL"] .player-role {{
+        .player-card[data-role="JGL"] .player-role {
             background: linear-gradient(135deg, rgba(72, 187, 120, 0.3), rgba(72, 187, 120, 0.1));
             color: #48bb78;
             border-color: rgba(72, 187, 120, 0.4);
-        }}
+        }
         
-        .player-card[data-role="MID"] .player-role {{
+        .player-card[data-role="MID"] .player-role {
             background: linear-gradient(135deg, rgba(129, 140, 248, 0.3), rgba(129, 140, 248, 0.1));
             color: #818cf8;
             border-color: rgba(129, 140, 248, 0.4);
-        }}
+        }
         
-        .player-card[data-role="ADC"] .player-role {{
+        .player-card[data-role="ADC"] .player-role {
             background: linear-gradient(135deg, rgba(251, 191, 36, 0.3), rgba(251, 191, 36, 0.1));
             color: #fbbf24;
             border-color: rgba(251, 191, 36, 0.4);
-        }}
+        }
         
-        .player-card[data-role="SUPP"] .player-role {{
+        .player-card[data-role="SUPP"] .player-role {
             background: linear-gradient(135deg, rgba(139, 92, 246, 0.3), rgba(139, 92, 246, 0.1));
             color: #8b5cf6;
             border-color: rgba(139, 92, 246, 0.4);
-        }}
+        }
         
-        .player-rank-info {{
+        .player-rank-info {
             text-align: right;
-        }}
+        }
         
-        .rank-badge {{
+        .rank-badge {
             padding: 8px 12px;
             border-radius: 8px;
             margin-bottom: 8px;
             text-align: center;
-        }}
+        }
         
-        .tier {{
+        .tier {
             display: block;
             font-weight: 700;
             font-size: 1.1rem;
-        }}
+        }
         
-        .lp {{
+        .lp {
             display: block;
             font-size: 0.9rem;
             opacity: 0.8;
-        }}
+        }
         
-        .games-info {{
+        .games-info {
             display: flex;
             flex-direction: column;
             gap: 2px;
-        }}
+        }
         
-        .winrate {{
+        .winrate {
             font-size: 1.2rem;
             font-weight: 700;
             color: var(--success-color);
-        }}
+        }
         
-        .games {{
+        .games {
             font-size: 0.9rem;
             color: var(--text-secondary);
-        }}
+        }
         
-        .player-stats-grid {{
+        .player-stats-grid {
             display: grid;
             grid-template-columns: repeat(4, 1fr);
             gap: 12px;
             margin-bottom: 20px;
-        }}
+        }
         
-        .stat-box {{
+        .stat-box {
             background: var(--bg-primary);
             padding: 12px 8px;
             border-radius: 8px;
             text-align: center;
             border: 1px solid rgba(200, 155, 60, 0.1);
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             display: block;
             font-size: 0.7rem;
             color: var(--text-secondary);
@@ -1416,43 +2387,43 @@ class GitHubPagesGenerator:
             font-weight: 600;
             letter-spacing: 0.5px;
             margin-bottom: 4px;
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             display: block;
             font-size: 1rem;
             color: var(--text-primary);
             font-weight: 700;
-        }}
+        }
         
-        .champions-section {{
+        .champions-section {
             margin-bottom: 12px;
-        }}
+        }
         
-        .champions-section h4 {{
+        .champions-section h4 {
             color: var(--primary-color);
             margin-bottom: 6px;
             font-size: 0.8rem;
             font-weight: 600;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
         
-        .champions-grid {{
+        .champions-grid {
             display: grid;
             grid-template-columns: 1fr;
             gap: 8px;
             margin-top: 10px;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .champions-grid {{
+        @media (max-width: 768px) {
+            .champions-grid {
                 grid-template-columns: 1fr;
-            }}
-        }}
+            }
+        }
         
         /* Modern Champion Cards (op.gg Style) */
-        .modern-card {{
+        .modern-card {
             display: flex !important;
             flex-direction: column !important;
             gap: 6px !important;
@@ -1461,80 +2432,80 @@ class GitHubPagesGenerator:
             border-radius: 12px !important;
             border: 1px solid var(--border-color) !important;
             box-shadow: 0 4px 16px rgba(0, 0, 0, 0.3) !important;
-        }}
+        }
         
-        .modern-card:hover {{
+        .modern-card:hover {
             transform: translateY(-2px) !important;
             box-shadow: 0 8px 24px rgba(200, 155, 60, 0.2) !important;
-        }}
+        }
         
-        .champion-header {{
+        .champion-header {
             display: flex;
             align-items: center;
             gap: 12px;
             margin-bottom: 8px;
-        }}
+        }
         
-        .champion-basic-info {{
+        .champion-basic-info {
             flex: 1;
             display: flex;
             flex-direction: column;
             gap: 2px;
-        }}
+        }
         
-        .champion-name {{
+        .champion-name {
             font-size: 1.1rem;
             color: var(--text-primary);
             font-weight: 600;
-        }}
+        }
         
-        .champion-games {{
+        .champion-games {
             font-size: 0.85rem;
             color: var(--text-secondary);
             font-weight: 400;
-        }}
+        }
         
-        .champion-winrate {{
+        .champion-winrate {
             font-weight: 700;
             font-size: 1.1rem;
             padding: 4px 8px;
             border-radius: 6px;
             text-align: center;
             min-width: 45px;
-        }}
+        }
         
-        .champion-winrate.excellent {{
+        .champion-winrate.excellent {
             background: rgba(0, 245, 255, 0.2);
             color: var(--success-color);
             border: 1px solid var(--success-color);
-        }}
+        }
         
-        .champion-winrate.good {{
+        .champion-winrate.good {
             background: rgba(200, 155, 60, 0.2);
             color: var(--primary-color);
             border: 1px solid var(--primary-color);
-        }}
+        }
         
-        .champion-winrate.average {{
+        .champion-winrate.average {
             background: rgba(205, 190, 145, 0.2);
             color: var(--warning-color);
             border: 1px solid var(--warning-color);
-        }}
+        }
         
-        .champion-winrate.below {{
+        .champion-winrate.below {
             background: rgba(255, 149, 0, 0.2);
             color: #ff9500;
             border: 1px solid #ff9500;
-        }}
+        }
         
-        .champion-winrate.poor {{
+        .champion-winrate.poor {
             background: rgba(240, 230, 210, 0.2);
             color: var(--danger-color);
             border: 1px solid var(--danger-color);
-        }}
+        }
         
         /* Champion Tooltip CSS */
-        .champion-tooltip {{
+        .champion-tooltip {
             position: fixed;
             background: rgba(20, 25, 35, 0.98);
             color: white;
@@ -1552,22 +2523,22 @@ class GitHubPagesGenerator:
             z-index: 99999;
             pointer-events: none;
             transform: translateY(-10px);
-        }}
+        }
         
-        .champion-card:hover .champion-tooltip {{
+        .champion-card:hover .champion-tooltip {
             opacity: 1;
             visibility: visible;
             transform: translateY(0);
-        }}
+        }
         
-        .champion-stats-extended {{
+        .champion-stats-extended {
             display: flex;
             justify-content: space-between;
             gap: 8px;
             margin-top: 8px;
-        }}
+        }
         
-        .stat-item {{
+        .stat-item {
             display: flex;
             flex-direction: column;
             align-items: center;
@@ -1576,62 +2547,62 @@ class GitHubPagesGenerator:
             background: var(--bg-primary);
             border-radius: 6px;
             border: 1px solid rgba(200, 155, 60, 0.1);
-        }}
+        }
         
-        .stat-item .stat-label {{
+        .stat-item .stat-label {
             font-size: 0.7rem;
             color: var(--text-secondary);
             text-transform: uppercase;
             font-weight: 600;
             letter-spacing: 0.5px;
-        }}
+        }
         
-        .stat-item .stat-value {{
+        .stat-item .stat-value {
             font-size: 0.9rem;
             color: var(--text-primary);
             font-weight: 600;
             margin-top: 2px;
-        }}
+        }
         
-        .stat-item .stat-value.excellent {{
+        .stat-item .stat-value.excellent {
             color: var(--success-color);
-        }}
+        }
         
-        .stat-item .stat-value.good {{
+        .stat-item .stat-value.good {
             color: var(--primary-color);
-        }}
+        }
         
-        .stat-item .stat-value.average {{
+        .stat-item .stat-value.average {
             color: var(--warning-color);
-        }}
+        }
         
-        .stat-item .stat-value.poor {{
+        .stat-item .stat-value.poor {
             color: var(--danger-color);
-        }}
+        }
         
         /* ===== STAT TOOLTIPS ===== */
-        .stat-with-tooltip {{
+        .stat-with-tooltip {
             display: flex;
             align-items: center;
             gap: 6px;
-        }}
+        }
         
-        .stat-item {{
+        .stat-item {
             position: relative;
-        }}
+        }
         
-        .stat-item .tooltip-trigger {{
+        .stat-item .tooltip-trigger {
             width: 14px;
             height: 14px;
             font-size: 0.6rem;
-        }}
+        }
         
-        .stat-item .tooltip {{
+        .stat-item .tooltip {
             min-width: 220px;
-        }}
+        }
         
         /* ===== STAT CARD ENHANCEMENTS ===== */
-        .stat-header {{
+        .stat-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
@@ -1640,50 +2611,50 @@ class GitHubPagesGenerator:
             border-bottom: 1px solid rgba(200, 155, 60, 0.2);
             font-weight: 600;
             color: var(--primary-color);
-        }}
+        }
         
-        .stat-leaderboard {{
+        .stat-leaderboard {
             margin-top: 15px;
             padding-top: 12px;
             border-top: 1px solid rgba(200, 155, 60, 0.15);
-        }}
+        }
         
-        .stat-leaderboard .ranking-title {{
+        .stat-leaderboard .ranking-title {
             font-size: 0.8rem;
             margin-bottom: 8px;
-        }}
+        }
         
-        .stat-leaderboard .ranking-item {{
+        .stat-leaderboard .ranking-item {
             padding: 4px 8px;
             margin: 2px 0;
             font-size: 0.85rem;
-        }}
+        }
         
-        .stat-leaderboard .rank-medal {{
+        .stat-leaderboard .rank-medal {
             font-size: 0.9rem;
             margin-right: 6px;
             min-width: 18px;
-        }}
+        }
         
-        .stat-leaderboard .rank-player {{
+        .stat-leaderboard .rank-player {
             font-size: 0.85rem;
-        }}
+        }
         
-        .stat-leaderboard .rank-value {{
+        .stat-leaderboard .rank-value {
             font-size: 0.8rem;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        }}
+        }
         
-        .stat-card:hover {{
+        .stat-card:hover {
             transform: translateY(-2px);
             box-shadow: 0 8px 25px rgba(0, 0, 0, 0.2),
                         0 0 0 1px rgba(200, 155, 60, 0.2);
-        }}
+        }
         
-        .champion-icon {{
+        .champion-icon {
             width: 40px;
             height: 40px;
             border-radius: 8px;
@@ -1691,34 +2662,34 @@ class GitHubPagesGenerator:
             box-shadow: 0 0 10px rgba(200, 155, 60, 0.3);
             object-fit: cover;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .champion-icon:hover {{
+        .champion-icon:hover {
             transform: scale(1.1);
             box-shadow: 0 0 15px rgba(200, 155, 60, 0.5);
-        }}
+        }
         
         /* Recent Games Section */
-        .recent-games-section {{
+        .recent-games-section {
             margin-bottom: 12px;
-        }}
+        }
         
-        .recent-games-section h4 {{
+        .recent-games-section h4 {
             color: var(--primary-color);
             margin-bottom: 6px;
             font-size: 0.8rem;
             font-weight: 600;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
         
-        .recent-games-list {{
+        .recent-games-list {
             display: flex;
             flex-direction: column;
             gap: 8px;
-        }}
+        }
         
-        .recent-game {{
+        .recent-game {
             display: flex;
             align-items: center;
             padding: 10px;
@@ -1726,106 +2697,106 @@ class GitHubPagesGenerator:
             border-radius: 8px;
             border-left: 4px solid var(--neutral-color);
             transition: all 0.3s ease;
-        }}
+        }
         
-        .recent-game.win {{
+        .recent-game.win {
             border-left-color: var(--success-color);
             background: rgba(0, 245, 255, 0.05);
-        }}
+        }
         
-        .recent-game.loss {{
+        .recent-game.loss {
             border-left-color: var(--danger-color);
             background: rgba(255, 100, 100, 0.05);
-        }}
+        }
         
-        .game-result {{
+        .game-result {
             margin-right: 12px;
-        }}
+        }
         
-        .result-badge {{
+        .result-badge {
             padding: 4px 8px;
             border-radius: 4px;
             font-weight: bold;
             font-size: 0.8rem;
-        }}
+        }
         
-        .result-badge.win {{
+        .result-badge.win {
             background: var(--success-color);
             color: var(--bg-primary);
-        }}
+        }
         
-        .result-badge.loss {{
+        .result-badge.loss {
             background: var(--danger-color);
             color: var(--bg-primary);
-        }}
+        }
         
-        .game-champion {{
+        .game-champion {
             display: flex;
             align-items: center;
             margin-right: 15px;
             min-width: 120px;
-        }}
+        }
         
-        .champion-icon-small {{
+        .champion-icon-small {
             width: 24px;
             height: 24px;
             border-radius: 4px;
             margin-right: 6px;
             border: 1px solid var(--primary-color);
-        }}
+        }
         
-        .champion-name-small {{
+        .champion-name-small {
             font-size: 0.9rem;
             color: var(--text-primary);
             font-weight: 500;
-        }}
+        }
         
-        .game-stats {{
+        .game-stats {
             display: flex;
             flex-direction: column;
             margin-right: 15px;
             min-width: 80px;
-        }}
+        }
         
-        .kda {{
+        .kda {
             font-size: 0.85rem;
             color: var(--text-primary);
             font-weight: 600;
-        }}
+        }
         
-        .cs {{
+        .cs {
             font-size: 0.75rem;
             color: var(--text-secondary);
-        }}
+        }
         
-        .game-info {{
+        .game-info {
             display: flex;
             flex-direction: column;
             margin-left: auto;
             text-align: right;
-        }}
+        }
         
-        .duration {{
+        .duration {
             font-size: 0.8rem;
             color: var(--text-primary);
-        }}
+        }
         
-        .when {{
+        .when {
             font-size: 0.75rem;
             color: var(--text-secondary);
-        }}
+        }
         
-        .no-games {{
+        .no-games {
             padding: 15px;
             text-align: center;
             color: var(--text-secondary);
             font-style: italic;
             background: var(--bg-secondary);
             border-radius: 8px;
-        }}
+        }
         
         /* ===== MEGA TOOLTIP SYSTEM ===== */
-        .tooltip-trigger {{
+        .tooltip-trigger {
             position: relative;
             width: 20px;
             height: 20px;
@@ -1841,15 +2812,15 @@ class GitHubPagesGenerator:
             transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
             box-shadow: 0 2px 8px rgba(200, 155, 60, 0.3);
             margin-left: auto;
-        }}
+        }
         
-        .tooltip-trigger:hover {{
+        .tooltip-trigger:hover {
             transform: scale(1.1);
             box-shadow: 0 4px 20px rgba(200, 155, 60, 0.5);
             background: linear-gradient(135deg, #FFD700, var(--primary-color));
-        }}
+        }
         
-        .tooltip {{
+        .tooltip {
             position: fixed;
             top: auto;
             left: auto;
@@ -1871,38 +2842,38 @@ class GitHubPagesGenerator:
             transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
             z-index: 99999;
             pointer-events: none;
-        }}
+        }
         
-        .tooltip-trigger:hover .tooltip {{
+        .tooltip-trigger:hover .tooltip {
             opacity: 1;
             visibility: visible;
             transform: translateY(0) scale(1);
-        }}
+        }
         
-        .tooltip strong {{
+        .tooltip strong {
             color: var(--primary-color);
             display: block;
             margin-bottom: 8px;
             font-size: 0.9rem;
-        }}
+        }
         
-        .tooltip em {{
+        .tooltip em {
             color: rgba(200, 155, 60, 0.8);
             font-style: italic;
             display: block;
             margin-top: 8px;
             font-size: 0.8rem;
-        }}
+        }
         
         /* ===== MEGA RANKING SYSTEM ===== */
-        .kpi-ranking {{
+        .kpi-ranking {
             margin-top: 15px;
             padding-top: 15px;
             border-top: 1px solid rgba(200, 155, 60, 0.2);
             animation: slideInUp 0.6s ease-out;
-        }}
+        }
         
-        .ranking-title {{
+        .ranking-title {
             font-size: 0.85rem;
             color: var(--primary-color);
             font-weight: 600;
@@ -1910,9 +2881,9 @@ class GitHubPagesGenerator:
             display: flex;
             align-items: center;
             gap: 6px;
-        }}
+        }
         
-        .ranking-item {{
+        .ranking-item {
             display: flex;
             align-items: center;
             padding: 6px 10px;
@@ -1921,55 +2892,55 @@ class GitHubPagesGenerator:
             transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
             background: rgba(255, 255, 255, 0.02);
             border: 1px solid transparent;
-        }}
+        }
         
-        .ranking-item:hover {{
+        .ranking-item:hover {
             transform: translateX(5px) scale(1.02);
             background: rgba(200, 155, 60, 0.1);
             border-color: rgba(200, 155, 60, 0.3);
-        }}
+        }
         
-        .rank-gold {{
+        .rank-gold {
             background: linear-gradient(135deg, rgba(255, 215, 0, 0.15), rgba(255, 223, 0, 0.05));
             border-color: rgba(255, 215, 0, 0.3);
             box-shadow: 0 2px 12px rgba(255, 215, 0, 0.2);
-        }}
+        }
         
-        .rank-silver {{
+        .rank-silver {
             background: linear-gradient(135deg, rgba(192, 192, 192, 0.15), rgba(192, 192, 192, 0.05));
             border-color: rgba(192, 192, 192, 0.3);
-        }}
+        }
         
-        .rank-bronze {{
+        .rank-bronze {
             background: linear-gradient(135deg, rgba(205, 127, 50, 0.15), rgba(205, 127, 50, 0.05));
             border-color: rgba(205, 127, 50, 0.3);
-        }}
+        }
         
-        .rank-medal {{
+        .rank-medal {
             font-size: 1rem;
             margin-right: 8px;
             min-width: 20px;
-        }}
+        }
         
-        .rank-player {{
+        .rank-player {
             flex: 1;
             font-weight: 500;
             color: var(--text-primary);
-        }}
+        }
         
-        .rank-value {{
+        .rank-value {
             font-weight: 600;
             color: var(--primary-color);
             font-size: 0.85rem;
-        }}
+        }
         
         /* ===== ENHANCED KPI CARDS ===== */
-        .kpi-card {{
+        .kpi-card {
             position: relative;
             overflow: hidden;
-        }}
+        }
         
-        .kpi-card::before {{
+        .kpi-card::before {
             content: '';
             position: absolute;
             top: 0;
@@ -1983,80 +2954,80 @@ class GitHubPagesGenerator:
             opacity: 0;
             transition: opacity 0.3s ease;
             pointer-events: none;
-        }}
+        }
         
-        .kpi-card:hover::before {{
+        .kpi-card:hover::before {
             opacity: 1;
-        }}
+        }
         
-        .kpi-card:hover {{
+        .kpi-card:hover {
             transform: translateY(-2px);
             box-shadow: 0 12px 32px rgba(0, 0, 0, 0.3),
                         0 0 0 1px rgba(200, 155, 60, 0.3);
-        }}
+        }
         
-        .kpi-header {{
+        .kpi-header {
             display: flex;
             align-items: center;
             justify-content: space-between;
             margin-bottom: 10px;
-        }}
+        }
         
         /* ===== ANIMATIONS ===== */
-        @keyframes slideInUp {{
-            from {{
+        @keyframes slideInUp {
+            from {
                 opacity: 0;
                 transform: translateY(20px);
-            }}
-            to {{
+            }
+            to {
                 opacity: 1;
                 transform: translateY(0);
-            }}
-        }}
+            }
+        }
         
-        @keyframes pulse {{
-            0%, 100% {{ transform: scale(1); }}
-            50% {{ transform: scale(1.05); }}
-        }}
+        @keyframes pulse {
+            0%, 100% { transform: scale(1); }
+            50% { transform: scale(1.05); }
+        }
         
-        .kpi-value {{
+        .kpi-value {
             animation: pulse 3s ease-in-out infinite;
-        }}
+        }
         
         /* ===== RESPONSIVE IMPROVEMENTS ===== */
-        @media (max-width: 768px) {{
-            .tooltip {{
+        @media (max-width: 768px) {
+            .tooltip {
                 position: fixed;
                 top: 50%;
                 left: 50%;
                 transform: translate(-50%, -50%);
                 right: auto;
                 max-width: 90vw;
-            }}
+            }
             
-            .kpi-ranking {{
+            .kpi-ranking {
                 display: none; /* Hide rankings on mobile for cleaner look */
-            }}
-        }}
+            }
+        }
         
-        .performance-section {{
+        .performance-section {
             margin-bottom: 15px;
-        }}
+        }
         
-        .performance-section h4 {{
+        .performance-section h4 {
             color: var(--primary-color);
             margin-bottom: 10px;
             font-size: 1.1rem;
             font-weight: 600;
-        }}
+        }
         
-        .performance-trend {{
+        .performance-trend {
             display: flex;
             gap: 4px;
             flex-wrap: wrap;
-        }}
+        }
         
-        .game-result {{
+        .game-result {
             width: 24px;
             height: 24px;
             border-radius: 4px;
@@ -2065,295 +3036,110 @@ class GitHubPagesGenerator:
             justify-content: center;
             font-size: 0.8rem;
             font-weight: bold;
-        }}
+        }
         
-        .game-result.win {{
+        .game-result.win {
             background: rgba(0, 245, 255, 0.2);
             color: var(--success-color);
             border: 1px solid var(--success-color);
-        }}
+        }
         
-        .game-result.loss {{
+        .game-result.loss {
             background: rgba(240, 230, 210, 0.2);
             color: var(--danger-color);
             border: 1px solid var(--danger-color);
-        }}
+        }
         
         /* Tier Colors */
-        .tier-challenger {{ border-left: 4px solid #f4c430; }}
-        .tier-grandmaster {{ border-left: 4px solid #ff6b6b; }}
-        .tier-master {{ border-left: 4px solid #9b59b6; }}
-        .tier-diamond {{ border-left: 4px solid #3498db; }}
-        .tier-emerald {{ border-left: 4px solid #2ecc71; }}
-        .tier-platinum {{ border-left: 4px solid #1abc9c; }}
-        .tier-gold {{ border-left: 4px solid #f39c12; }}
-        .tier-silver {{ border-left: 4px solid #95a5a6; }}
-        .tier-bronze {{ border-left: 4px solid #cd853f; }}
-        .tier-iron {{ border-left: 4px solid #7f8c8d; }}
-        .tier-unranked {{ border-left: 4px solid #34495e; }}
-        
-        .rank-badge.tier-challenger {{ background: linear-gradient(135deg, #f4c430, #ffd700); color: #2c3e50; }}
-        .rank-badge.tier-grandmaster {{ background: linear-gradient(135deg, #ff6b6b, #e74c3c); color: white; }}
-        .rank-badge.tier-master {{ background: linear-gradient(135deg, #9b59b6, #8e44ad); color: white; }}
-        .rank-badge.tier-diamond {{ background: linear-gradient(135deg, #3498db, #2980b9); color: white; }}
-        .rank-badge.tier-emerald {{ background: linear-gradient(135deg, #2ecc71, #27ae60); color: white; }}
-        .rank-badge.tier-platinum {{ background: linear-gradient(135deg, #1abc9c, #16a085); color: white; }}
-        .rank-badge.tier-gold {{ background: linear-gradient(135deg, #f39c12, #e67e22); color: white; }}
-        .rank-badge.tier-silver {{ background: linear-gradient(135deg, #95a5a6, #7f8c8d); color: white; }}
-        .rank-badge.tier-bronze {{ background: linear-gradient(135deg, #cd853f, #a0522d); color: white; }}
-        .rank-badge.tier-iron {{ background: linear-gradient(135deg, #7f8c8d, #5d6d7e); color: white; }}
+        .tier-challenger { border-left: 4px solid #f4c430; }
+        .tier-grandmaster { border-left: 4px solid #ff6b6b; }
+        .tier-master { border-left: 4px solid #9b59b6; }
+        .tier-diamond { border-left: 4px solid #3498db; }
+        .tier-emerald { border-left: 4px solid #2ecc71; }
+        .tier-platinum { border-left: 4px solid #1abc9c; }
+        .tier-gold { border-left: 4px solid #f39c12; }
+        .tier-silver { border-left: 4px solid #95a5a6; }
+        .tier-bronze { border-left: 4px solid #cd853f; }
+        .tier-iron { border-left: 4px solid #7f8c8d; }
+        .tier-unranked { border-left: 4px solid #34495e; }
+        
+        .rank-badge.tier-challenger { background: linear-gradient(135deg, #f4c430, #ffd700); color: #2c3e50; }
+        .rank-badge.tier-grandmaster { background: linear-gradient(135deg, #ff6b6b, #e74c3c); color: white; }
+        .rank-badge.tier-master { background: linear-gradient(135deg, #9b59b6, #8e44ad); color: white; }
+        .rank-badge.tier-diamond { background: linear-gradient(135deg, #3498db, #2980b9); color: white; }
+        .rank-badge.tier-emerald { background: linear-gradient(135deg, #2ecc71, #27ae60); color: white; }
+        .rank-badge.tier-platinum { background: linear-gradient(135deg, #1abc9c, #16a085); color: white; }
+        .rank-badge.tier-gold { background: linear-gradient(135deg, #f39c12, #e67e22); color: white; }
+        .rank-badge.tier-silver { background: linear-gradient(135deg, #95a5a6, #7f8c8d); color: white; }
+        .rank-badge.tier-bronze { background: linear-gradient(135deg, #cd853f, #a0522d); color: white; }
+        .rank-badge.tier-iron { background: linear-gradient(135deg, #7f8c8d, #5d6d7e); color: white; }
         
         /* Responsive Design */
-        @media (max-width: 768px) {{
-            .kpi-grid {{
+        @media (max-width: 768px) {
+            .kpi-grid {
                 grid-template-columns: repeat(2, 1fr);
-            }}
+            }
             
-            .stats-grid {{
+            .stats-grid {
                 grid-template-columns: 1fr;
-            }}
+            }
             
-            .players-grid {{
+            .players-grid {
                 grid-template-columns: repeat(4, minmax(260px, 1fr));
                 gap: 16px;
-            }}
-        }}
+            }
+        }
         
-        @media (max-width: 1100px) {{
-            .players-grid {{
+        @media (max-width: 1100px) {
+            .players-grid {
                 grid-template-columns: repeat(3, minmax(280px, 1fr));
                 gap: 15px;
-            }}
-        }}
+            }
+        }
         
-        @media (max-width: 900px) {{
-            .players-grid {{
+        @media (max-width: 900px) {
+            .players-grid {
                 grid-template-columns: repeat(2, minmax(300px, 1fr));
                 gap: 15px;
-            }}
-        }}
+            }
+        }
         
-        @media (max-width: 650px) {{
-            .players-grid {{
+        @media (max-width: 650px) {
+            .players-grid {
                 grid-template-columns: 1fr;
                 gap: 20px;
-            }}
+            }
             
-            .player-stats-grid {{
+            .player-stats-grid {
                 grid-template-columns: repeat(2, 1fr);
-            }}
-        }}
+            }
+        }
         
-        @media (max-width: 480px) {{
-            .kpi-grid {{
+        @media (max-width: 480px) {
+            .kpi-grid {
                 grid-template-columns: 1fr;
-            }}
+            }
             
-            .team-name {{
+            .team-name {
                 font-size: 2.5rem;
-            }}
+            }
             
-            .kpi-value {{
+            .kpi-value {
                 font-size: 2rem;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header class="header">
-            <h1 class="team-name">{team_name}</h1>
-            <div class="update-section">
-                <p class="last-updated">Letzte Aktualisierung: {last_updated}</p>
-                <button class="update-btn" onclick="updateData()">
-                    <span class="update-icon">🔄</span>
-                    <span class="update-text">Neu laden</span>
-                </button>
-            </div>
-        </header>
-        
-        {team_overview}
-        
-        <section class="players-section">
-            <h2 class="section-title">🎮 Team Members</h2>
-            <div class="players-grid">
-                {players_html}
-            </div>
-        </section>
-        
-        {team_comparison_charts}
-    </div>
+            }
+        }
+    """
     
-    <script>
-        // Chart.js Configuration
-        document.addEventListener('DOMContentLoaded', function() {{
-            const playerData = {player_stats_data};
-            
-            if (document.getElementById('teamStatsChart')) {{
-                const ctx = document.getElementById('teamStatsChart').getContext('2d');
-                new Chart(ctx, {{
-                    type: 'bar',
-                    data: {{
-                        labels: playerData.labels,
-                        datasets: [{{
-                            label: 'Win Rate (%)',
-                            data: playerData.winRates,
-                            backgroundColor: 'rgba(200, 155, 60, 0.8)',
-                            borderColor: 'rgba(200, 155, 60, 1)',
-                            borderWidth: 1
-                        }}, {{
-                            label: 'KDA Ratio',
-                            data: playerData.kdaRatios,
-                            backgroundColor: 'rgba(0, 245, 255, 0.8)',
-                            borderColor: 'rgba(0, 245, 255, 1)',
-                            borderWidth: 1,
-                            yAxisID: 'y1'
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        plugins: {{
-                            legend: {{
-                                labels: {{
-                                    color: '#f0e6d2'
-                                }}
-                            }}
-                        }},
-                        scales: {{
-                            x: {{
-                                ticks: {{
-                                    color: '#cdbe91'
-                                }},
-                                grid: {{
-                                    color: 'rgba(200, 155, 60, 0.1)'
-                                }}
-                            }},
-                            y: {{
-                                type: 'linear',
-                                display: true,
-                                position: 'left',
-                                ticks: {{
-                                    color: '#cdbe91'
-                                }},
-                                grid: {{
-                                    color: 'rgba(200, 155, 60, 0.1)'
-                                }}
-                            }},
-                            y1: {{
-                                type: 'linear',
-                                display: true,
-                                position: 'right',
-                                ticks: {{
-                                    color: '#cdbe91'
-                                }},
-                                grid: {{
-                                    drawOnChartArea: false,
-                                }}
-                            }}
-                        }}
-                    }}
-                }});
-            }}
-        }});
-        
-        // Champion Tooltip Positioning
-        document.querySelectorAll('.champion-card').forEach(card => {{
-            card.addEventListener('mouseenter', function(e) {{
-                const tooltip = this.querySelector('.champion-tooltip');
-                if (!tooltip) return;
-                
-                const cardRect = this.getBoundingClientRect();
-                const viewportWidth = window.innerWidth;
-                const viewportHeight = window.innerHeight;
-                
-                let left = cardRect.left + cardRect.width / 2 - 140; // Center tooltip
-                let top = cardRect.top - 10; // Above card
-                
-                // Horizontal overflow check
-                if (left + 280 > viewportWidth - 20) {{
-                    left = viewportWidth - 300;
-                }}
-                if (left < 20) {{
-                    left = 20;
-                }}
-                
-                // Vertical overflow check - show below if not enough space above
-                if (top < 20) {{
-                    top = cardRect.bottom + 10;
-                }}
-                
-                tooltip.style.left = left + 'px';
-                tooltip.style.top = top + 'px';
-            }});
-        }});
-        
-        // Champion Icon Fallback Handling
-        document.querySelectorAll('.champion-icon').forEach(img => {{
-            img.addEventListener('error', function() {{
-                // Fallback für fehlende Champion-Icons
-                this.style.display = 'none';
-                const parent = this.parentElement;
-                const fallback = document.createElement('div');
-                fallback.className = 'champion-icon champion-fallback';
-                fallback.textContent = this.alt.charAt(0);
-                fallback.style.cssText = `
-                    background: var(--bg-tertiary);
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    color: var(--text-secondary);
-                    font-weight: bold;
-                `;
-                parent.insertBefore(fallback, this);
-            }});
-        }});
-        
-        // MEGA TOOLTIP POSITIONING SYSTEM
-        document.querySelectorAll('.tooltip-trigger').forEach(trigger => {{
-            trigger.addEventListener('mouseenter', function(e) {{
-                const tooltip = this.querySelector('.tooltip');
-                if (!tooltip) return;
-                
-                // Reset position
-                tooltip.style.position = 'fixed';
-                tooltip.style.top = 'auto';
-                tooltip.style.left = 'auto';
-                tooltip.style.right = 'auto';
-                tooltip.style.bottom = 'auto';
-                
-                const triggerRect = this.getBoundingClientRect();
-                const tooltipRect = tooltip.getBoundingClientRect();
-                const viewportWidth = window.innerWidth;
-                const viewportHeight = window.innerHeight;
-                
-                let left = triggerRect.right + 10;
-                let top = triggerRect.top;
-                
-                // Horizontal overflow check
-                if (left + tooltipRect.width > viewportWidth - 20) {{
-                    left = triggerRect.left - tooltipRect.width - 10;
-                }}
-                
-                // Vertical overflow check
-                if (top + tooltipRect.height > viewportHeight - 20) {{
-                    top = viewportHeight - tooltipRect.height - 20;
-                }}
-                
-                if (top < 20) {{
-                    top = 20;
-                }}
-                
-                tooltip.style.left = left + 'px';
-                tooltip.style.top = top + 'px';
-            }});
-        }});
-        
-        // Simple Reload Function
-        function updateData() {{
-            // Just reload the page - new data comes from running main.py manually
-            window.location.reload();
-        }}
+    def _get_client_stylesheet(self) -> str:
+        """Zusätzliches CSS nur für Client Rendering (Server-Ausgabe bleibt unverändert)"""
+        return """
+        /* Client Rendering: Platzhalter bis die Karte sichtbar wird */
+        .player-placeholder {
+            min-height: 420px;
+            opacity: 0.6;
+        }
         
-    </script>
-</body>
-</html>"""
\ No newline at end of file
+        .player-error {
+            opacity: 0.4;
+        }
+    """
@@ -0,0 +1,221 @@
+# icon_cache.py
+# Champion-Icons einmal lokal cachen und als Sprite Sheet, Data URIs oder eigene Dateien ausliefern statt von ddragon
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import re
+from io import BytesIO
+from typing import Dict, Iterable, Optional, Tuple
+
+import requests
+
+from asset_pipeline import asset_name
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+DDRAGON_URL_PREFIX = 'https://ddragon.leagueoflegends.com/'
+INDEX_FILE = 'index.json'
+# Bis zu so vielen Icons werden Data URIs direkt ins HTML geschrieben, darüber ein Sprite Sheet
+INLINE_ICON_LIMIT = 12
+# Icons werden max. mit 40px angezeigt - 80px Kacheln reichen auch für HiDPI
+SPRITE_TILE_SIZE = 80
+# Transparentes 1x1 GIF als src für Sprite-Icons (das Bild kommt aus dem Hintergrund)
+BLANK_IMAGE = 'data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7'
+
+class IconCache:
+    """Content-adressierter Download-Cache für Icons (objects/<sha256>.png + index.json: URL -> Hash)"""
+    
+    def __init__(self, cache_dir: str = '.cache/icons', offline: bool = False, inline_limit: int = INLINE_ICON_LIMIT,
+                 sprite: bool = True, url_prefix: str = DDRAGON_URL_PREFIX, timeout: float = 10):
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = cache_dir
+        self.offline = offline
+        self.inline_limit = inline_limit
+        self.sprite = sprite and Image is not None
+        # Sprite gewünscht, aber Pillow fehlt: wird beim ersten Bedarf einmal gemeldet
+        self._sprite_unavailable = sprite and Image is None
+        self.url_prefix = url_prefix
+        self.timeout = timeout
+        self.session = requests.Session()
+        
+        self.index: Dict[str, str] = self._load_index()
+        self._index_dirty = False
+    
+    def _load_index(self) -> Dict[str, str]:
+        """index.json aus dem Cache-Verzeichnis (leer wenn noch nicht vorhanden)"""
+        try:
+            with open(os.path.join(self.cache_dir, INDEX_FILE), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+    
+    def _save_index(self):
+        """index.json atomar schreiben (nur wenn neue Icons dazugekommen sind)"""
+        if not self._index_dirty:
+            return
+        path = os.path.join(self.cache_dir, INDEX_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+        self._index_dirty = False
+    
+    def _object_path(self, digest: str) -> str:
+        """Pfad eines Icons im Cache (nach Hash aufgeteilt wie bei git)"""
+        return os.path.join(self.cache_dir, 'objects', digest[:2], f"{digest}.png")
+    
+    def _read_cached(self, url: str) -> Optional[bytes]:
+        """Icon aus dem Cache: über den Index oder (vorab befüllter Ordner) direkt als <Dateiname> im cache_dir"""
+        candidates = []
+        if url in self.index:
+            candidates.append(self._object_path(self.index[url]))
+        candidates.append(os.path.join(self.cache_dir, os.path.basename(url.split('?')[0])))
+        
+        for path in candidates:
+            try:
+                with open(path, 'rb') as f:
+                    return f.read()
+            except OSError:
+                continue
+        return None
+    
+    def _store(self, url: str, data: bytes):
+        """Speichert ein Icon unter seinem Hash - gleiche Bilder (z.B. neuer Patch, gleiches Icon) nur einmal"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        self.index[url] = digest
+        self._index_dirty = True
+    
+    def get(self, url: str) -> Optional[bytes]:
+        """Icon-Bytes aus dem Cache, sonst einmalig herunterladen (None = nicht verfügbar, Remote-URL bleibt)"""
+        data = self._read_cached(url)
+        if data is not None or self.offline:
+            return data
+        
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            self.logger.warning(f"⚠️ Icon Download fehlgeschlagen ({url}): {e}")
+            return None
+        if response.status_code != 200 or not response.headers.get('Content-Type', '').startswith('image/'):
+            self.logger.warning(f"⚠️ Icon nicht verfügbar ({url}): HTTP {response.status_code}")
+            return None
+        
+        self._store(url, response.content)
+        return response.content
+    
+    def fetch_all(self, urls: Iterable[str]) -> Dict[str, bytes]:
+        """Alle verfügbaren Icons (Reihenfolge wie urls, Duplikate nur einmal)"""
+        urls = list(dict.fromkeys(urls))
+        icons = {}
+        for url in urls:
+            data = self.get(url)
+            if data is not None:
+                icons[url] = data
+        
+        if self._index_dirty:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._save_index()
+        
+        missing = len(urls) - len(icons)
+        if missing and self.offline:
+            self.logger.warning(f"⚠️ {missing} Icons nicht im Cache ({self.cache_dir}) - Offline Mode, nutze Remote-URLs")
+        return icons
+    
+    @staticmethod
+    def data_uri(data: bytes) -> str:
+        """PNG als Data URI (kein eigener Request)"""
+        return f"data:image/png;base64,{base64.b64encode(data).decode('ascii')}"
+    
+    def _local_sources(self, icons: Dict[str, bytes]) -> Tuple[Dict[str, str], Dict[str, bytes]]:
+        """Data URI bei wenigen Icons, sonst eigene Datei assets/icon-<Name>.<Hash>.png"""
+        inline = len(icons) <= self.inline_limit
+        sources = {}
+        assets = {}
+        for url, data in icons.items():
+            if inline:
+                sources[url] = self.data_uri(data)
+            else:
+                stem = re.sub(r'[^A-Za-z0-9]+', '-', os.path.splitext(os.path.basename(url))[0]).strip('-') or 'icon'
+                name = asset_name(f"icon-{stem}", data, 'png')
+                assets[name] = data
+                sources[url] = name
+        return sources, assets
+    
+    def localize(self, urls: Iterable[str]) -> Tuple[Dict[str, str], Dict[str, bytes]]:
+        """Remote-URL -> lokale src für data.json (Client Rendering) + neue Asset-Dateien"""
+        return self._local_sources(self.fetch_all(urls))
+    
+    def _build_sprite(self, icons: Dict[str, bytes]) -> Optional[Tuple[bytes, Dict[str, int]]]:
+        """Alle Icons als horizontaler Streifen in einer PNG (URL -> Spalte)"""
+        tiles = []
+        for url, data in icons.items():
+            try:
+                with Image.open(BytesIO(data)) as image:
+                    tile = image.convert('RGBA').resize((SPRITE_TILE_SIZE, SPRITE_TILE_SIZE), Image.LANCZOS)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"⚠️ Icon nicht lesbar ({url}): {e}")
+                continue
+            tiles.append((url, tile))
+        
+        if len(tiles) < 2:
+            return None
+        
+        sheet = Image.new('RGBA', (SPRITE_TILE_SIZE * len(tiles), SPRITE_TILE_SIZE), (0, 0, 0, 0))
+        positions = {}
+        for column, (url, tile) in enumerate(tiles):
+            sheet.paste(tile, (column * SPRITE_TILE_SIZE, 0))
+            positions[url] = column
+        
+        output = BytesIO()
+        sheet.save(output, format='PNG', optimize=True)
+        return output.getvalue(), positions
+    
+    def rewrite_html(self, html: str) -> Tuple[str, Dict[str, bytes]]:
+        """Ersetzt alle <img src> auf url_prefix durch lokale Icons - liefert neues HTML + zu schreibende Assets"""
+        pattern = re.compile(r'src="(' + re.escape(self.url_prefix) + r'[^"]+)"')
+        urls = list(dict.fromkeys(pattern.findall(html)))
+        if not urls:
+            return html, {}
+        
+        replacements = {}
+        assets = {}
+        icons = self.fetch_all(urls)
+        sprite = self._build_sprite(icons) if self.sprite and len(icons) > self.inline_limit else None
+        if self._sprite_unavailable and len(icons) > self.inline_limit:
+            self.logger.warning(f"⚠️ Pillow nicht installiert - kein Sprite Sheet, {len(icons)} Icons als einzelne "
+                                f"Dateien (pip install -r requirements-optional.txt)")
+            self._sprite_unavailable = False
+        
+        if sprite:
+            # Ein Request für alle Icons: Prozent-Positionen funktionieren unabhängig von der Anzeigegröße
+            sheet, positions = sprite
+            sheet_name = asset_name('champion-icons', sheet, 'png')
+            assets[sheet_name] = sheet
+            columns = len(positions)
+            for url, column in positions.items():
+                x = round(column * 100 / (columns - 1), 4)
+                replacements[url] = (f'src="{BLANK_IMAGE}" style="background: url({sheet_name}) {x:g}% 0 / '
+                                     f'{columns * 100}% 100% no-repeat"')
+            icons = {url: data for url, data in icons.items() if url not in positions}
+        
+        sources, icon_assets = self._local_sources(icons)
+        assets.update(icon_assets)
+        for url, source in sources.items():
+            replacements[url] = f'src="{source}"'
+        
+        html = pattern.sub(lambda match: replacements.get(match.group(1), match.group(0)), html)
+        return html, assets
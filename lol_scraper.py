@@ -1,25 +1,63 @@
 # lol_scraper.py
 # Einfacher LoL Stats Scraper nur mit op.gg
 
+import codecs
 import requests
 import json
 import logging
+import os
 import re
+import threading
 import time
 import urllib3
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
 from bs4 import BeautifulSoup
 
+from data_export import load_team_data
+from description_parser import parse_description
+from meta_parser import MetaDescriptionParser, extract_meta_description
+from rate_limiter import RateLimiter
+from response_cache import ResponseCache
+from retry_policy import RetryPolicy
+from seeded_random import player_rng
+
+class FetchResult(NamedTuple):
+    """Ergebnis eines GET Requests (Body bereits gelesen, Verbindung freigegeben)"""
+    status_code: int
+    headers: Mapping[str, str]
+    body: str
+
 class LoLScraper:
     """Sammelt LoL Team-Daten von op.gg - einfach und zuverlässig"""
     
-    def __init__(self):
+    # Felder die der Scraper pro Spieler liefert (alles andere ergänzt der Generator)
+    PLAYER_FIELDS = (
+        'riot_id', 'summoner_name', 'tier', 'rank', 'lp', 'wins', 'losses', 'total_games',
+        'win_rate', 'main_champions', 'last_updated', 'lane', 'recent_games'
+    )
+    
+    def __init__(self, max_workers: int = 1, rate_limiter: Optional[RateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None, response_cache: Optional[ResponseCache] = None,
+                 stream_head: bool = False, stream_chunk_size: int = 8192):
         self.logger = logging.getLogger(__name__)
-        self.session = requests.Session()
+        # requests.Session ist nicht thread-safe: jeder Worker-Thread bekommt seine eigene (siehe session)
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+        # Worker-Threads leben so lange wie der Scraper - ihre Sessions (und Verbindungen) bleiben über Läufe warm
+        self._executor: Optional[ThreadPoolExecutor] = None
         
-        # SSL-Konfiguration für Scraping
-        self.session.verify = False  # SSL-Verifikation deaktivieren für Scraping
+        # Parallelität: Anzahl Worker - das Request-Budget teilen sich alle über den Rate Limiter
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = rate_limiter or RateLimiter(requests_per_second=1.0, burst=1)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.response_cache = response_cache  # Optional: persistenter Seiten-Cache
+        
+        # Stream-Modus: nur den <head> bis zur Description herunterladen
+        self.stream_head = stream_head
+        self.stream_chunk_size = stream_chunk_size
         
         # Warnungen für unsichere Requests unterdrücken
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -27,21 +65,118 @@ class LoLScraper:
         # Lane Mapping aus config.py extrahieren
         self.lane_mapping = self._extract_lane_mapping()
         
+        # Region Mapping: Riot API -> op.gg
+        self.region_map = {
+            'euw1': 'euw', 'eun1': 'eune', 'na1': 'na', 'kr': 'kr',
+            'jp1': 'jp', 'br1': 'br', 'la1': 'lan', 'la2': 'las',
+            'oc1': 'oce', 'tr1': 'tr', 'ru': 'ru'
+        }
+    
+    @property
+    def session(self) -> requests.Session:
+        """Session des aktuellen Threads (wird beim ersten Zugriff angelegt)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._create_session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+    
+    def _create_session(self) -> requests.Session:
+        """Neue Session mit SSL-Konfiguration und Browser Headers"""
+        session = requests.Session()
+        
+        # SSL-Konfiguration für Scraping
+        session.verify = False  # SSL-Verifikation deaktivieren für Scraping
+        
         # Standard Browser Headers (ohne problematische Encoding-Header)
-        self.session.headers.update({
+        session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'de-DE,de;q=0.9,en;q=0.8',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+        return session
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Gemeinsamer Worker-Pool (max_workers Threads) für alle scrape_team() Aufrufe"""
+        with self._sessions_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='scraper')
+            return self._executor
+    
+    def close(self):
+        """Beendet den Worker-Pool und schließt die Sessions aller Threads"""
+        with self._sessions_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+    
+    def _get(self, url: str, timeout: float = 30, headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        """GET Request über den gemeinsamen Rate Limiter (beachtet Retry-After)
         
-        # Region Mapping: Riot API -> op.gg
-        self.region_map = {
-            'euw1': 'euw', 'eun1': 'eune', 'na1': 'na', 'kr': 'kr',
-            'jp1': 'jp', 'br1': 'br', 'la1': 'lan', 'la2': 'las',
-            'oc1': 'oce', 'tr1': 'tr', 'ru': 'ru'
-        }
+        Im Stream-Modus wird nur bis zur Description im <head> gelesen und die
+        Verbindung danach geschlossen - der Rest der Seite wird nie übertragen.
+        """
+        self.rate_limiter.acquire(url)
+        with self.session.get(url, timeout=timeout, allow_redirects=True, headers=headers,
+                              stream=self.stream_head) as response:
+            self.rate_limiter.update_from_response(url, response.status_code, response.headers)
+            
+            if self.stream_head and response.status_code == 200:
+                body = self._read_head(response)
+            else:
+                response.encoding = 'utf-8'  # Force UTF-8 encoding
+                body = response.text
+        
+        return FetchResult(response.status_code, response.headers, body)
+    
+    def _read_head(self, response: requests.Response) -> str:
+        """Liest den Body stückweise bis der Head-Parser die Description gefunden hat"""
+        parser = MetaDescriptionParser()
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        parts = []
+        
+        for chunk in response.iter_content(chunk_size=self.stream_chunk_size):
+            text = decoder.decode(chunk)
+            parts.append(text)
+            parser.feed(text)
+            if parser.done:
+                break
+        else:
+            parts.append(decoder.decode(b'', final=True))
+        
+        return ''.join(parts)
+    
+    def _fetch(self, url: str, label: str) -> Tuple[int, str]:
+        """GET Request mit Retry Policy und Response Cache - liefert (Status, HTML)"""
+        entry = self.response_cache.get(url) if self.response_cache else None
+        
+        # Frischer Cache-Eintrag: gar kein Request nötig
+        if entry and self.response_cache.is_fresh(entry):
+            self.logger.debug(f"💾 Cache-Treffer für {label}")
+            return 200, entry['body']
+        
+        headers = self.response_cache.conditional_headers(entry) if self.response_cache else {}
+        result = self.retry_policy.execute(lambda timeout: self._get(url, timeout, headers), label)
+        
+        # Seite unverändert: gespeicherten Body weiterverwenden
+        if result.status_code == 304 and entry:
+            self.logger.debug(f"💾 {label} unverändert (304)")
+            self.response_cache.refresh(url, entry)
+            return 200, entry['body']
+        
+        if result.status_code == 200 and self.response_cache:
+            self.response_cache.put(url, result.body, result.headers.get('ETag'), result.headers.get('Last-Modified'))
+        
+        return result.status_code, result.body
     
     def get_recent_games(self, riot_id: str, region: str = "euw", limit: int = 10) -> List[Dict]:
         """Holt Recent Games von op.gg"""
@@ -60,14 +195,11 @@ class LoLScraper:
             
             self.logger.debug(f"🎮 Scraping recent games for {riot_id}...")
             
-            response = self.session.get(url, timeout=30, allow_redirects=True)
-            if response.status_code != 200:
+            status_code, html = self._fetch(url, f"{riot_id} (Match History)")
+            if status_code != 200:
                 self.logger.warning(f"⚠️ Match History nicht verfügbar für {riot_id}")
                 return []
             
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
             # Parse Match History (vereinfacht - op.gg lädt Games über JavaScript)
             # Für jetzt generiere ich Beispiel-Daten basierend auf echten Champions
             games = []
@@ -76,36 +208,37 @@ class LoLScraper:
             # Standard Champion Pool - wird später durch echte Daten ersetzt
             available_champions = ['Urgot', 'Gwen', 'Ornn', 'Sion', 'Gnar', 'Jinx', 'Thresh', 'Lee Sin']
                 
+            # Reproduzierbar pro Spieler statt globalem random
+            rng = player_rng({'riot_id': riot_id}, 'match_history')
+            
             for i in range(min(limit, 10)):
                 # Simuliere realistische Game-Daten basierend auf echten Champions
-                import random
-                
                 # Gewichtete Win Rate - realistische Verteilung
                 base_wr = 50  # Neutral base
-                win_chance = (base_wr + random.randint(-20, 20)) / 100
-                result = 'W' if random.random() < win_chance else 'L'
+                win_chance = (base_wr + rng.randint(-20, 20)) / 100
+                result = 'W' if rng.random() < win_chance else 'L'
                 
-                duration = random.randint(18, 42)
-                champion = random.choice(available_champions)
+                duration = rng.randint(18, 42)
+                champion = rng.choice(available_champions)
                 
                 # Realistische KDA basierend auf Champion und Result
                 if result == 'W':
-                    kills = random.randint(3, 18)
-                    deaths = random.randint(0, 6)
-                    assists = random.randint(2, 22)
+                    kills = rng.randint(3, 18)
+                    deaths = rng.randint(0, 6)
+                    assists = rng.randint(2, 22)
                 else:
-                    kills = random.randint(0, 12)
-                    deaths = random.randint(2, 12)
-                    assists = random.randint(0, 15)
+                    kills = rng.randint(0, 12)
+                    deaths = rng.randint(2, 12)
+                    assists = rng.randint(0, 15)
                 
                 game_data = {
                     'result': result,
                     'duration': f"{duration}m",
                     'champion': champion,
                     'kda': f"{kills}/{deaths}/{assists}",
-                    'cs': random.randint(80, min(280, duration * 6 + random.randint(-30, 50))),
-                    'game_mode': random.choice(['Ranked Solo', 'Ranked Solo', 'Ranked Flex', 'Normal']),  # Mehr Ranked
-                    'when': f"{random.randint(1, 14)} {'hours' if random.random() < 0.3 else 'days'} ago"
+                    'cs': rng.randint(80, min(280, duration * 6 + rng.randint(-30, 50))),
+                    'game_mode': rng.choice(['Ranked Solo', 'Ranked Solo', 'Ranked Flex', 'Normal']),  # Mehr Ranked
+                    'when': f"{rng.randint(1, 14)} {'hours' if rng.random() < 0.3 else 'days'} ago"
                 }
                 games.append(game_data)
             
@@ -132,7 +265,8 @@ class LoLScraper:
             # Fallback Champions
             champion_pool = ['Urgot', 'Gwen', 'Ornn', 'Sion', 'Gnar']
         
-        import random
+        # Seed aus riot_id + gescrapten Zahlen: gleiche Daten ergeben die gleichen Games
+        rng = player_rng(player_stats, 'recent_games')
         
         # Generiere Games mit realistischen Zeitstempeln (wie op.gg)
         game_times = []
@@ -145,9 +279,9 @@ class LoLScraper:
         for i in range(10):
             # Nehme base hours und füge etwas Variation hinzu
             if i < len(base_hours):
-                hours_ago = base_hours[i] + random.randint(-1, 2)
+                hours_ago = base_hours[i] + rng.randint(-1, 2)
             else:
-                hours_ago = base_hours[-1] + i * random.randint(12, 24)
+                hours_ago = base_hours[-1] + i * rng.randint(12, 24)
             
             # Stelle sicher dass hours_ago positiv ist
             hours_ago = max(1, hours_ago)
@@ -170,7 +304,7 @@ class LoLScraper:
         
         for i, (hours_ago, when_text) in enumerate(game_times):
             # Champion auswählen basierend auf Gewichtung
-            champion = random.choice(champion_pool)
+            champion = rng.choice(champion_pool)
             
             # Win Rate basierend auf Champion Performance und Spieler Win Rate
             champ_data = next((c for c in main_champions if c['name'] == champion), None)
@@ -182,24 +316,24 @@ class LoLScraper:
                 effective_wr = player_wr
             
             # Zufällige Variation
-            win_chance = (effective_wr + random.randint(-15, 15)) / 100
-            result = 'W' if random.random() < win_chance else 'L'
+            win_chance = (effective_wr + rng.randint(-15, 15)) / 100
+            result = 'W' if rng.random() < win_chance else 'L'
             
             # Realistische Game-Daten
-            duration = random.randint(18, 42)
+            duration = rng.randint(18, 42)
             
             # KDA basierend auf Result und Champion
             if result == 'W':
-                kills = random.randint(2, 16)
-                deaths = random.randint(0, 6)
-                assists = random.randint(3, 20)
+                kills = rng.randint(2, 16)
+                deaths = rng.randint(0, 6)
+                assists = rng.randint(3, 20)
             else:
-                kills = random.randint(0, 12)
-                deaths = random.randint(1, 12)
-                assists = random.randint(0, 15)
+                kills = rng.randint(0, 12)
+                deaths = rng.randint(1, 12)
+                assists = rng.randint(0, 15)
             
             # CS basierend auf Game Duration
-            cs = random.randint(max(30, duration * 4), duration * 7)
+            cs = rng.randint(max(30, duration * 4), duration * 7)
             
             game_data = {
                 'result': result,
@@ -207,7 +341,7 @@ class LoLScraper:
                 'champion': champion,
                 'kda': f"{kills}/{deaths}/{assists}",
                 'cs': cs,
-                'game_mode': random.choice(['Ranked Solo', 'Ranked Solo', 'Ranked Flex', 'Normal']),
+                'game_mode': rng.choice(['Ranked Solo', 'Ranked Solo', 'Ranked Flex', 'Normal']),
                 'when': when_text,
                 'hours_ago': hours_ago  # Für Sortierung
             }
@@ -255,37 +389,19 @@ class LoLScraper:
             
             self.logger.info(f"🔍 Scraping {riot_id}...")
             
-            # Request mit Retry-Logik
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = self.session.get(url, timeout=30, allow_redirects=True)
-                    if response.status_code == 200:
-                        break
-                    elif response.status_code == 404:
-                        self.logger.error(f"❌ Spieler {riot_id} nicht gefunden (404)")
-                        return None
-                    else:
-                        self.logger.warning(f"⚠️  Versuch {attempt + 1}: Status {response.status_code} für {riot_id}")
-                        if attempt < max_retries - 1:
-                            time.sleep(2)  # Kurze Pause vor Retry
-                except requests.exceptions.RequestException as e:
-                    self.logger.warning(f"⚠️  Versuch {attempt + 1} fehlgeschlagen für {riot_id}: {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2)  # Kurze Pause vor Retry
-                    else:
-                        raise  # Re-raise nach letztem Versuch
-            
-            if response.status_code != 200:
-                self.logger.error(f"❌ Fehler {response.status_code} für {riot_id} nach {max_retries} Versuchen")
+            # Request mit Retry Policy (Backoff + Deadline)
+            status_code, html = self._fetch(url, riot_id)
+            
+            if status_code == 404:
+                self.logger.error(f"❌ Spieler {riot_id} nicht gefunden (404)")
                 return None
             
-            # Parse HTML mit korrektem Encoding
-            response.encoding = 'utf-8'  # Force UTF-8 encoding
-            soup = BeautifulSoup(response.text, 'html.parser')
+            if status_code != 200:
+                self.logger.error(f"❌ Fehler {status_code} für {riot_id}")
+                return None
             
             # Extrahiere Daten aus Meta-Tags (zuverlässigste Methode)
-            stats = self._extract_player_data(soup, riot_id)
+            stats = self._extract_player_data(html, riot_id)
             
             # Debug: Log extracted data
             if stats.get('tier') != 'Unranked':
@@ -307,7 +423,34 @@ class LoLScraper:
             self.logger.error(f"❌ Fehler bei {riot_id}: {e}")
             return None
     
-    def _extract_player_data(self, soup: BeautifulSoup, riot_id: str) -> Dict:
+    def _find_description_with_soup(self, html: str) -> str:
+        """Sucht die Description mit BeautifulSoup (Fallback für ungewöhnliches Markup)"""
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # Methode 1: Description Meta-Tag (Hauptdatenquelle)
+        desc_meta = soup.find('meta', {'name': 'description'})
+        if desc_meta:
+            desc = desc_meta.get('content', '')
+            self.logger.debug(f"Meta description found: {desc}")
+        else:
+            self.logger.debug("Description meta tag NOT FOUND - trying alternatives")
+            # Versuche andere Meta-Tags
+            twitter_desc = soup.find('meta', {'name': 'twitter:description'})
+            if twitter_desc:
+                desc = twitter_desc.get('content', '')
+                self.logger.debug(f"Twitter description found: {desc}")
+            else:
+                og_desc = soup.find('meta', {'property': 'og:description'})
+                if og_desc:
+                    desc = og_desc.get('content', '')
+                    self.logger.debug(f"OG Description found: {desc}")
+                else:
+                    self.logger.debug("No description meta tags found")
+                    desc = ""
+        
+        return desc
+    
+    def _extract_player_data(self, html: str, riot_id: str) -> Dict:
         """Extrahiert Spielerdaten aus HTML - robuste Methode"""
         data = {
             'riot_id': riot_id,
@@ -324,78 +467,38 @@ class LoLScraper:
         }
         
         try:
-            # Methode 1: Description Meta-Tag (Hauptdatenquelle)
-            desc_meta = soup.find('meta', {'name': 'description'})
-            if desc_meta:
-                desc = desc_meta.get('content', '')
+            # Schneller Pfad: nur den <head> bis zur Description lesen
+            desc = extract_meta_description(html)
+            if desc is not None:
                 self.logger.debug(f"Meta description found: {desc}")
             else:
-                self.logger.debug("Description meta tag NOT FOUND - trying alternatives")
-                # Versuche andere Meta-Tags
-                twitter_desc = soup.find('meta', {'name': 'twitter:description'})
-                if twitter_desc:
-                    desc = twitter_desc.get('content', '')
-                    self.logger.debug(f"Twitter description found: {desc}")
-                else:
-                    og_desc = soup.find('meta', {'property': 'og:description'})
-                    if og_desc:
-                        desc = og_desc.get('content', '')
-                        self.logger.debug(f"OG Description found: {desc}")
-                    else:
-                        self.logger.debug("No description meta tags found")
-                        desc = ""
+                # Fallback: kompletter DOM mit BeautifulSoup (langsamer, aber toleranter)
+                desc = self._find_description_with_soup(html)
             
             if desc:
-                # Parse Tier/Rank - Unterstützt alle Tiers inklusive Master/Grandmaster/Challenger
-                # Pattern Beispiele:
-                # "Figure09#1893 / Platinum 1 1 39LP" - Tier mit Division und LP
-                # "cl1ck9r#EUWES / Master 1 47LP" - Master+ Tier 
-                tier_patterns = [
-                    r'(Master|Grandmaster|Challenger)\s+\d+\s+(\d+)\s*LP',  # Master+ Format
-                    r'(Iron|Bronze|Silver|Gold|Platinum|Diamond|Emerald)\s+(\d+)\s+\d+\s+(\d+)\s*LP',  # Mit Division, z.B. "Platinum 1 1 39LP"
-                    r'(Iron|Bronze|Silver|Gold|Platinum|Diamond|Emerald)\s+(\d+)\s+(\d+)\s*LP',  # Einfaches Format, z.B. "Gold 3 45LP"
-                ]
+                # Rank, Gesamtbilanz und Champions in einem Durchlauf parsen
+                # Beispiel: "cl1ck9r#EUWES / Master 1 47LP / 59Win 43Lose Win rate 58% / Viego - 24Win 14Lose Win rate 63%, ..."
+                parsed = parse_description(desc)
+                data.update({
+                    'tier': parsed.tier,
+                    'rank': parsed.rank,
+                    'lp': parsed.lp,
+                    'wins': parsed.wins,
+                    'losses': parsed.losses,
+                    'total_games': parsed.total_games,
+                    'win_rate': parsed.win_rate
+                })
                 
-                for pattern in tier_patterns:
-                    match = re.search(pattern, desc, re.IGNORECASE)
-                    if match:
-                        tier = match.group(1).lower()
-                        if tier in ['master', 'grandmaster', 'challenger']:  # Master+ Tiers
-                            data['tier'] = tier.title()
-                            data['rank'] = tier.title()
-                            data['lp'] = int(match.group(2))
-                        else:  # Tier mit Division
-                            division = match.group(2)
-                            lp = int(match.group(3))
-                            data['tier'] = tier.title()
-                            data['rank'] = f"{tier.title()} {division}"
-                            data['lp'] = lp
-                        break
-                
-                # Parse Win/Loss
-                wl_match = re.search(r'(\d+)Win\s+(\d+)Lose', desc)
-                if wl_match:
-                    wins = int(wl_match.group(1))
-                    losses = int(wl_match.group(2))
-                    data['wins'] = wins
-                    data['losses'] = losses
-                    data['total_games'] = wins + losses
-                    data['win_rate'] = round((wins / (wins + losses)) * 100) if (wins + losses) > 0 else 0
-                
-                # Parse Champion Stats (aus der Description)
-                # Pattern: "Urgot - 31Win 32Lose Win rate 49%"
-                champions = []
-                champ_matches = re.findall(r'([A-Za-z\'\.\s&]+)\s*-\s*(\d+)Win\s+(\d+)Lose\s+Win\s+rate\s+(\d+)%', desc)
-                for champ_name, champ_wins, champ_losses, champ_wr in champ_matches:
-                    champions.append({
-                        'name': champ_name.strip(),
-                        'wins': int(champ_wins),
-                        'losses': int(champ_losses),
-                        'games': int(champ_wins) + int(champ_losses),
-                        'win_rate': int(champ_wr)
-                    })
-                
-                data['main_champions'] = champions[:5]  # Top 5
+                data['main_champions'] = [
+                    {
+                        'name': champ.name,
+                        'wins': champ.wins,
+                        'losses': champ.losses,
+                        'games': champ.games,
+                        'win_rate': champ.win_rate
+                    }
+                    for champ in parsed.champions[:5]  # Top 5
+                ]
             else:
                 self.logger.warning(f"Keine Meta-Beschreibung gefunden für {riot_id}")
             
@@ -405,31 +508,140 @@ class LoLScraper:
             self.logger.warning(f"Parsing Fehler: {e}")
             return data
     
-    def scrape_team(self, team_config: Dict[str, Dict]) -> Dict:
-        """Scraped alle Team-Mitglieder"""
+    def load_previous_team_data(self, data_file: str) -> Dict[str, Dict]:
+        """Lädt die Spielerdaten des letzten Laufs (z.B. docs/data.json) für den Incremental Mode"""
+        if not os.path.exists(data_file):
+            return {}
+        
+        try:
+            # Versteht auch das Compact- und Split-Format des Generators
+            previous = load_team_data(data_file) or {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"⚠️ Vorherige Daten nicht lesbar ({data_file}): {e}")
+            return {}
+        
+        # Nur die gescrapten Felder übernehmen - Dashboard-Felder erzeugt der Generator neu
+        players = {}
+        for riot_id, record in previous.get('players', {}).items():
+            if isinstance(record, dict) and record.get('last_updated'):
+                players[riot_id] = {key: record[key] for key in self.PLAYER_FIELDS if key in record}
+        
+        return players
+    
+    def _get_record_age_minutes(self, record: Dict) -> Optional[float]:
+        """Alter eines Spieler-Datensatzes in Minuten (None wenn unbekannt)"""
+        try:
+            updated = time.mktime(time.strptime(record.get('last_updated', ''), '%Y-%m-%d %H:%M:%S'))
+        except (TypeError, ValueError, OverflowError):
+            return None
+        return max(0.0, (time.time() - updated) / 60)
+    
+    def _scrape_players(self, players: Dict[str, Dict], previous_players: Dict[str, Dict],
+                        max_age_minutes: Optional[float]) -> Dict[str, Tuple[Optional[Dict], str]]:
+        """Scraped eine Menge Spieler einmalig - liefert riot_id -> (Datensatz, Status)
+        
+        Status: 'refreshed' (neu gescraped), 'reused' (noch aktuell), 'fallback' (alte Daten) oder 'failed'.
+        """
+        # Frische Spieler aus dem letzten Lauf übernehmen, Rest neu scrapen
+        results = {}
+        to_scrape = {}
+        for riot_id, player_config in players.items():
+            previous = previous_players.get(riot_id)
+            max_age = player_config.get('max_age_minutes', max_age_minutes)
+            age = self._get_record_age_minutes(previous) if previous else None
+            
+            if max_age is not None and age is not None and age < max_age:
+                results[riot_id] = (dict(previous), 'reused')
+            else:
+                to_scrape[riot_id] = player_config
+        
+        workers = min(self.max_workers, max(1, len(to_scrape)))
+        if results:
+            self.logger.info(f"♻️  {len(results)} Spieler noch aktuell - überspringe Scraping")
+        self.logger.info(f"🎮 Scraping {len(to_scrape)} Spieler ({workers} Worker)...")
+        
+        # Spieler parallel scrapen - der Rate Limiter begrenzt die Last auf op.gg
+        executor = self._get_executor()
+        futures = {
+            riot_id: executor.submit(self.get_player_stats, riot_id, player_config.get('region', 'euw1'))
+            for riot_id, player_config in to_scrape.items()
+        }
+        
+        for riot_id, future in futures.items():
+            try:
+                player_data = future.result()
+            except Exception as e:
+                self.logger.error(f"❌ Fehler bei {riot_id}: {e}")
+                player_data = None
+            
+            if player_data:
+                results[riot_id] = (player_data, 'refreshed')
+            elif riot_id in previous_players:
+                # Letzten gültigen Datensatz behalten statt den Spieler zu verlieren
+                self.logger.warning(f"♻️  {riot_id}: verwende letzte Daten vom {previous_players[riot_id].get('last_updated')}")
+                results[riot_id] = (dict(previous_players[riot_id]), 'fallback')
+            else:
+                results[riot_id] = (None, 'failed')
+        
+        if self.response_cache:
+            self.response_cache.flush()
+        
+        return results
+    
+    def _build_team_data(self, team_config: Dict, results: Dict[str, Tuple[Optional[Dict], str]]) -> Dict:
+        """Setzt team_data eines Teams aus den gescrapten Spielern zusammen (Config-Reihenfolge)"""
+        players = team_config.get('players', {})
         team_data = {
             'team_name': team_config.get('team_name', 'LoL Team'),
             'players': {},
             'last_updated': time.strftime('%Y-%m-%d %H:%M:%S'),
-            'total_players': len(team_config.get('players', {}))
+            'total_players': len(players)
         }
         
-        players = team_config.get('players', {})
-        self.logger.info(f"🎮 Scraping {len(players)} Spieler...")
-        
-        success_count = 0
+        counts = {'refreshed': 0, 'reused': 0, 'fallback': 0, 'failed': 0}
         for riot_id, player_config in players.items():
-            region = player_config.get('region', 'euw1')
-            
-            player_data = self.get_player_stats(riot_id, region)
-            if player_data:
-                team_data['players'][riot_id] = player_data
-                success_count += 1
-            
-            # Höfliche Pause zwischen Requests
-            time.sleep(1)
+            player_data, status = results.get(riot_id, (None, 'failed'))
+            counts[status] += 1
+            if not player_data:
+                continue
+            
+            # Lane pro Team: Spieler-Config vor config.py Kommentar
+            player_data = dict(player_data)
+            player_data['lane'] = player_config.get('lane') or self.lane_mapping.get(riot_id, player_data.get('lane', 'FLEX'))
+            team_data['players'][riot_id] = player_data
+        
+        team_data['success_count'] = counts['refreshed'] + counts['reused']
+        team_data['refreshed_count'] = counts['refreshed']
+        team_data['reused_count'] = counts['reused']
+        team_data['fallback_count'] = counts['fallback']
         
-        team_data['success_count'] = success_count
-        self.logger.info(f"🎯 Scraping abgeschlossen: {success_count}/{len(players)} Spieler")
+        self.logger.info(
+            f"🎯 {team_data['team_name']}: {team_data['success_count']}/{len(players)} Spieler "
+            f"({counts['refreshed']} neu, {counts['reused']} aktuell, {counts['fallback']} Fallback)"
+        )
         
         return team_data
+    
+    def scrape_teams(self, team_configs: List[Dict], previous_players: Optional[Dict[str, Dict]] = None,
+                     max_age_minutes: Optional[float] = None) -> List[Dict]:
+        """Scraped mehrere Teams über eine Session - Spieler in mehreren Teams nur einmal"""
+        previous_players = previous_players or {}
+        
+        # Spieler teamübergreifend de-duplizieren (erste Config gewinnt)
+        unique_players = {}
+        for team_config in team_configs:
+            for riot_id, player_config in team_config.get('players', {}).items():
+                unique_players.setdefault(riot_id, player_config)
+        
+        results = self._scrape_players(unique_players, previous_players, max_age_minutes)
+        return [self._build_team_data(team_config, results) for team_config in team_configs]
+    
+    def scrape_team(self, team_config: Dict[str, Dict], previous_players: Optional[Dict[str, Dict]] = None,
+                    max_age_minutes: Optional[float] = None) -> Dict:
+        """Scraped alle Team-Mitglieder.
+        
+        Incremental Mode: Mit previous_players werden nur Spieler neu geladen, deren Daten
+        älter als max_age_minutes (oder 'max_age_minutes' in der Spieler-Config) sind.
+        Fehlgeschlagene Spieler fallen auf ihren letzten gültigen Datensatz zurück.
+        """
+        return self.scrape_teams([team_config], previous_players, max_age_minutes)[0]
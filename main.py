@@ -1,15 +1,27 @@
 # main.py
 # Vollautomatisches LoL Team Stats Tool - alles in einem Skript!
 
+import argparse
+import json
 import logging
+import re
 import sys
 import os
 from datetime import datetime
+from typing import Dict, List
 
 from lol_scraper import LoLScraper
+from rate_limiter import RateLimiter
+from response_cache import ResponseCache
+from retry_policy import RetryPolicy
+from asset_pipeline import AssetPipeline
+from data_export import BROTLI_AVAILABLE
+from deploy_queue import DeployQueue
 from github_pages_generator import GitHubPagesGenerator
 from github_manager import GitHubManager
-from config import TEAM_CONFIG, GITHUB_CONFIG
+from icon_cache import IconCache
+from scheduler import StatsScheduler
+from config import TEAM_CONFIG, GITHUB_CONFIG, SCRAPER_CONFIG, DAEMON_CONFIG, OUTPUT_CONFIG
 
 def setup_logging():
     """Setup Logging"""
@@ -21,13 +33,13 @@ def setup_logging():
         ]
     )
 
-def validate_config():
+def validate_config(require_players: bool = True):
     """Validiert Konfiguration"""
     logger = logging.getLogger(__name__)
     
-    # Team-Konfiguration prüfen
+    # Team-Konfiguration prüfen (im Batch Mode kommen die Teams aus eigenen Dateien)
     players = TEAM_CONFIG.get('players', {})
-    if not players:
+    if require_players and not players:
         logger.error("❌ Keine Spieler in config.py!")
         logger.error("➡️  Füge deine Spieler in TEAM_CONFIG hinzu")
         return False
@@ -50,6 +62,314 @@ def validate_config():
     
     return True
 
+def load_github_token() -> str:
+    """Lädt den GitHub Token (github_token.txt, Fallback config.py) - leer wenn nicht konfiguriert"""
+    logger = logging.getLogger(__name__)
+    
+    # GitHub Token sicher laden (nicht aus versioniertem Code!)
+    token_file = "github_token.txt"
+    token = ""
+    
+    if os.path.exists(token_file):
+        try:
+            with open(token_file, 'r', encoding='utf-8') as f:
+                token = f.read().strip()
+            if token and token != "HIER_IHREN_TOKEN_EINTRAGEN":
+                logger.info("🔑 GitHub Token sicher geladen")
+            else:
+                logger.error("❌ Token in github_token.txt nicht konfiguriert!")
+                print(f"""
+⚠️  GITHUB TOKEN SETUP ERFORDERLICH:
+
+🔑 Erstelle neuen Token:
+    1. https://github.com/settings/tokens
+    2. "Generate new token (classic)"
+    3. Scopes: ✓ repo ✓ workflow
+    4. Token kopieren
+
+💾 Token sicher speichern:
+    Öffne: github_token.txt
+    Inhalt: ghp_xxxxxxxxxxxxxxxxxxxx (nur das Token!)
+    
+💡 Warum so? GitHub deaktiviert Token die im Code stehen automatisch!
+    """)
+                return ""
+        except Exception as e:
+            logger.error(f"❌ Fehler beim Laden des Tokens: {e}")
+            return ""
+    else:
+        # Fallback: Token aus config.py (unsicher!)
+        token = GITHUB_CONFIG.get('token', '').strip()
+        if token and token != "HIER_NEUEN_TOKEN_EINTRAGEN":
+            logger.warning("⚠️  Token aus config.py geladen - unsicher! Verwende github_token.txt")
+        else:
+            logger.error("❌ Kein GitHub Token gefunden!")
+            print(f"""
+⚠️  GITHUB TOKEN SETUP ERFORDERLICH:
+
+🔑 Erstelle neuen Token:
+    1. https://github.com/settings/tokens
+    2. "Generate new token (classic)"  
+    3. Scopes: ✓ repo ✓ workflow
+    4. Token kopieren
+
+💾 Token sicher speichern:
+    Erstelle Datei: github_token.txt
+    Inhalt: ghp_xxxxxxxxxxxxxxxxxxxx (nur das Token!)
+    
+💡 Warum so? GitHub deaktiviert Token die im Code stehen automatisch!
+                """)
+            return ""
+    
+    return token
+
+def create_scraper() -> LoLScraper:
+    """Erstellt den Scraper mit Rate Limiter, Retry Policy und Cache aus SCRAPER_CONFIG"""
+    rate_limiter = RateLimiter(
+        requests_per_second=SCRAPER_CONFIG.get('requests_per_second', 1.0),
+        burst=SCRAPER_CONFIG.get('burst', 1)
+    )
+    retry_policy = RetryPolicy(
+        max_attempts=SCRAPER_CONFIG.get('max_attempts', 4),
+        request_timeout=SCRAPER_CONFIG.get('request_timeout', 15),
+        deadline=SCRAPER_CONFIG.get('retry_deadline', 45)
+    )
+    
+    response_cache = None
+    if SCRAPER_CONFIG.get('cache_enabled', False):
+        response_cache = ResponseCache(
+            cache_dir=SCRAPER_CONFIG.get('cache_dir', '.cache/opgg'),
+            ttl=SCRAPER_CONFIG.get('cache_ttl', 300),
+            max_entries=SCRAPER_CONFIG.get('cache_max_entries', 500),
+            max_bytes=SCRAPER_CONFIG.get('cache_max_mb', 50) * 1024 * 1024
+        )
+    
+    return LoLScraper(
+        max_workers=SCRAPER_CONFIG.get('max_workers', 1),
+        rate_limiter=rate_limiter,
+        retry_policy=retry_policy,
+        response_cache=response_cache,
+        stream_head=SCRAPER_CONFIG.get('stream_head', False)
+    )
+
+def create_generator(track_freshness: bool = False) -> GitHubPagesGenerator:
+    """Erstellt den Website-Generator mit den Ausgabe-Optionen aus OUTPUT_CONFIG
+    
+    track_freshness: neue Spieler-Zeitstempel allein zählen als Änderung (Incremental Mode, Daemon)
+    """
+    asset_pipeline = AssetPipeline(
+        extract=OUTPUT_CONFIG.get('extract_assets', False),
+        vendor_chartjs=OUTPUT_CONFIG.get('vendor_chartjs', False),
+        google_fonts=OUTPUT_CONFIG.get('google_fonts', True),
+        cache_dir=os.path.join('.cache', 'assets')
+    )
+    if OUTPUT_CONFIG.get('precompress', False) and not BROTLI_AVAILABLE:
+        logging.getLogger(__name__).warning("⚠️ brotli nicht installiert - precompress erzeugt nur .gz "
+                                            "(pip install -r requirements-optional.txt)")
+    icon_cache = None
+    if OUTPUT_CONFIG.get('local_icons', False):
+        icon_cache = IconCache(
+            cache_dir=os.path.join('.cache', 'icons'),
+            offline=OUTPUT_CONFIG.get('offline_icons', False)
+        )
+    return GitHubPagesGenerator(
+        compact_json=OUTPUT_CONFIG.get('compact_json', False),
+        split_players=OUTPUT_CONFIG.get('split_players', False),
+        precompress=OUTPUT_CONFIG.get('precompress', False),
+        client_render=OUTPUT_CONFIG.get('client_render', False),
+        asset_pipeline=asset_pipeline,
+        icon_cache=icon_cache,
+        track_freshness=track_freshness
+    )
+
+def create_github_manager(token: str) -> GitHubManager:
+    """Erstellt den GitHub Manager mit dem Deployment-Modus aus GITHUB_CONFIG"""
+    return GitHubManager(
+        GITHUB_CONFIG['username'],
+        token,
+        GITHUB_CONFIG['repo_name'],
+        deploy_mode=GITHUB_CONFIG.get('deploy_mode', 'full'),
+        pages_branch=GITHUB_CONFIG.get('pages_branch', 'gh-pages'),
+        pages_keep_last=GITHUB_CONFIG.get('pages_keep_last', 10)
+    )
+
+def slugify_team_name(team_name: str) -> str:
+    """Erzeugt einen Verzeichnisnamen aus dem Teamnamen (z.B. 'The LoungeEsports' -> 'the-loungeesports')"""
+    slug = re.sub(r'[^a-z0-9]+', '-', team_name.lower()).strip('-')
+    return slug or 'team'
+
+def load_team_configs(paths: List[str], output_root: str = "docs") -> List[Dict]:
+    """Lädt Team-Configs (JSON) aus Dateien oder Verzeichnissen für den Batch Mode
+    
+    Format wie TEAM_CONFIG; die Lane steht pro Spieler als "lane" ("TOP", "JGL", ...).
+    Optional "output": Unterverzeichnis unter docs/ (Standard: aus dem Teamnamen).
+    """
+    logger = logging.getLogger(__name__)
+    
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(
+                os.path.join(path, name) for name in os.listdir(path) if name.endswith('.json')
+            ))
+        else:
+            files.append(path)
+    
+    team_configs = []
+    used_outputs = set()
+    for file_path in files:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                team_config = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"❌ Team-Config {file_path} nicht lesbar: {e}")
+            continue
+        
+        if not team_config.get('players'):
+            logger.error(f"❌ Keine Spieler in {file_path}")
+            continue
+        
+        output = team_config.get('output') or slugify_team_name(team_config.get('team_name', 'team'))
+        # Nur echte Unterverzeichnisse von output_root - kein "../..", kein absoluter Pfad, nicht docs/ selbst
+        root = os.path.realpath(output_root)
+        output_dir = os.path.realpath(os.path.join(root, str(output)))
+        if output_dir == root or os.path.commonpath([root, output_dir]) != root:
+            logger.error(f"❌ Ausgabeverzeichnis '{output}' liegt nicht unter {output_root}/ ({file_path})")
+            continue
+        output = os.path.relpath(output_dir, root)
+        if output in used_outputs:
+            logger.error(f"❌ Ausgabeverzeichnis '{output}' doppelt vergeben ({file_path})")
+            continue
+        used_outputs.add(output)
+        
+        team_config['output_dir'] = os.path.join(output_root, output)
+        team_configs.append(team_config)
+    
+    return team_configs
+
+def run_batch(paths: List[str]) -> bool:
+    """Batch Mode: mehrere Teams über eine Scraper-Session, ein Deployment am Ende"""
+    setup_logging()
+    logger = logging.getLogger(__name__)
+    
+    # Pfade relativ zum Aufrufer auflösen, dann ins Skript-Verzeichnis wechseln
+    paths = [os.path.abspath(path) for path in paths]
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    
+    if not validate_config(require_players=False):
+        logger.error("🔧 Bitte korrigiere config.py und führe das Skript erneut aus")
+        return False
+    
+    team_configs = load_team_configs(paths)
+    if not team_configs:
+        logger.error("❌ Keine gültigen Team-Configs gefunden!")
+        return False
+    
+    logger.info(f"🎯 Batch: {len(team_configs)} Teams")
+    
+    try:
+        scraper = create_scraper()
+        
+        # Incremental Mode: letzte Daten aller Teams zusammenführen (neuester Stand gewinnt)
+        previous_players = {}
+        if SCRAPER_CONFIG.get('incremental', False):
+            for team_config in team_configs:
+                data_file = os.path.join(team_config['output_dir'], 'data.json')
+                for riot_id, record in scraper.load_previous_team_data(data_file).items():
+                    known = previous_players.get(riot_id)
+                    if not known or record.get('last_updated', '') > known.get('last_updated', ''):
+                        previous_players[riot_id] = record
+        
+        all_team_data = scraper.scrape_teams(
+            team_configs,
+            previous_players=previous_players,
+            max_age_minutes=SCRAPER_CONFIG.get('max_age_minutes')
+        )
+        scraper.close()
+        
+        # Jedes Team in sein eigenes Unterverzeichnis rendern
+        generator = create_generator(track_freshness=SCRAPER_CONFIG.get('incremental', False))
+        generated = 0
+        changed_teams = 0
+        changed_paths = []
+        for team_config, team_data in zip(team_configs, all_team_data):
+            if not team_data['players']:
+                logger.error(f"❌ Keine Spielerdaten für {team_data['team_name']} - übersprungen")
+                continue
+            html_file = generator.generate_page(team_data, team_config['output_dir'])
+            if generator.changed_artifacts:
+                logger.info(f"✅ Website generiert: {html_file} ({', '.join(generator.changed_artifacts)})")
+                changed_teams += 1
+                changed_paths.extend(generator.changed_paths)
+            else:
+                logger.info(f"💤 {team_data['team_name']}: keine Änderungen")
+            generated += 1
+        
+        if generated == 0:
+            logger.error("❌ Keine Spielerdaten erhalten!")
+            return False
+        
+        # Ein Deployment für alle Teams
+        token = load_github_token()
+        if not token:
+            return False
+        
+        github_manager = create_github_manager(token)
+        if changed_teams == 0 and not github_manager.has_pending_push():
+            # Kein git add/commit/push und kein Netzwerk-Roundtrip
+            logger.info("💤 Keine Änderungen in allen Teams und nichts ausstehend - überspringe Deployment")
+            return True
+        
+        logger.info("🚀 Starte automatischen GitHub Deployment...")
+        success, website_url = github_manager.full_deployment(changed_paths)
+        
+        if success:
+            logger.info(f"🎉 {generated}/{len(team_configs)} Teams veröffentlicht: {website_url}")
+        else:
+            logger.warning(f"⚠️ {generated}/{len(team_configs)} Teams lokal generiert - GitHub Push fehlgeschlagen")
+        
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Fehler: {e}")
+        return False
+
+def run_daemon() -> bool:
+    """Dauerbetrieb: Session, Parser und Daten bleiben zwischen den Zyklen im Speicher"""
+    setup_logging()
+    logger = logging.getLogger(__name__)
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    
+    if not validate_config():
+        logger.error("🔧 Bitte korrigiere config.py und führe das Skript erneut aus")
+        return False
+    
+    # Ohne Token läuft der Scheduler trotzdem und aktualisiert docs/ lokal
+    token = load_github_token()
+    github_manager = None
+    if token:
+        github_manager = create_github_manager(token)
+    else:
+        logger.warning("⚠️ Kein GitHub Token - Dashboard wird nur lokal aktualisiert")
+    
+    deploy_queue = None
+    if github_manager and DAEMON_CONFIG.get('async_deploy', True):
+        deploy_queue = DeployQueue(github_manager, timeout=DAEMON_CONFIG.get('deploy_timeout', 120))
+    
+    scheduler = StatsScheduler(
+        scraper=create_scraper(),
+        # Der Daemon arbeitet immer inkrementell und liest das Alter der Spieler aus data.json
+        generator=create_generator(track_freshness=True),
+        team_config=TEAM_CONFIG,
+        output_dir="docs",
+        github_manager=github_manager,
+        cycle_interval=DAEMON_CONFIG.get('cycle_interval', 60),
+        max_age_minutes=SCRAPER_CONFIG.get('max_age_minutes', 30),
+        deploy_queue=deploy_queue
+    )
+    scheduler.run_forever()
+    return True
+
 def main():
     """Vollautomatischer Prozess - alles in einem!"""
     # Sicherstellen, dass wir im richtigen Verzeichnis sind
@@ -75,82 +395,48 @@ def main():
     try:
         # 2. Scrape Team-Daten
         logger.info("🔍 Scrape Team-Daten von op.gg...")
-        scraper = LoLScraper()
-        team_data = scraper.scrape_team(TEAM_CONFIG)
+        scraper = create_scraper()
+        
+        # Incremental Mode: nur veraltete Spieler neu scrapen
+        previous_players = {}
+        if SCRAPER_CONFIG.get('incremental', False):
+            previous_players = scraper.load_previous_team_data(os.path.join('docs', 'data.json'))
         
-        if team_data['success_count'] == 0:
+        team_data = scraper.scrape_team(
+            TEAM_CONFIG,
+            previous_players=previous_players,
+            max_age_minutes=SCRAPER_CONFIG.get('max_age_minutes')
+        )
+        scraper.close()
+        
+        if not team_data['players']:
             logger.error("❌ Keine Spielerdaten erhalten!")
             return False
         
         # 3. Generiere GitHub Pages
         logger.info("🌐 Generiere Website...")
-        generator = GitHubPagesGenerator()
+        generator = create_generator(track_freshness=SCRAPER_CONFIG.get('incremental', False))
         html_file = generator.generate_page(team_data)
-        logger.info(f"✅ Website generiert: {html_file}")
+        if not generator.changed_artifacts:
+            logger.info("💤 Keine Änderungen seit dem letzten Lauf")
+        else:
+            logger.info(f"✅ Website generiert: {html_file}")
+            for name, size in generator.write_stats.items():
+                logger.info(f"💾 {name}: {f'{size:,} Bytes' if size else 'unverändert'}")
         
         # 4. Automatischer GitHub Deployment
-        username = GITHUB_CONFIG['username']
-        repo_name = GITHUB_CONFIG['repo_name']
-        
-        # GitHub Token sicher laden (nicht aus versioniertem Code!)
-        token_file = "github_token.txt"
-        token = ""
-        
-        if os.path.exists(token_file):
-            try:
-                with open(token_file, 'r', encoding='utf-8') as f:
-                    token = f.read().strip()
-                if token and token != "HIER_IHREN_TOKEN_EINTRAGEN":
-                    logger.info("🔑 GitHub Token sicher geladen")
-                else:
-                    logger.error("❌ Token in github_token.txt nicht konfiguriert!")
-                    print(f"""
-⚠️  GITHUB TOKEN SETUP ERFORDERLICH:
-
-🔑 Erstelle neuen Token:
-    1. https://github.com/settings/tokens
-    2. "Generate new token (classic)"
-    3. Scopes: ✓ repo ✓ workflow
-    4. Token kopieren
-
-💾 Token sicher speichern:
-    Öffne: github_token.txt
-    Inhalt: ghp_xxxxxxxxxxxxxxxxxxxx (nur das Token!)
-    
-💡 Warum so? GitHub deaktiviert Token die im Code stehen automatisch!
-    """)
-                    return False
-            except Exception as e:
-                logger.error(f"❌ Fehler beim Laden des Tokens: {e}")
-                return False
-        else:
-            # Fallback: Token aus config.py (unsicher!)
-            token = GITHUB_CONFIG.get('token', '').strip()
-            if token and token != "HIER_NEUEN_TOKEN_EINTRAGEN":
-                logger.warning("⚠️  Token aus config.py geladen - unsicher! Verwende github_token.txt")
-            else:
-                logger.error("❌ Kein GitHub Token gefunden!")
-                print(f"""
-⚠️  GITHUB TOKEN SETUP ERFORDERLICH:
-
-🔑 Erstelle neuen Token:
-    1. https://github.com/settings/tokens
-    2. "Generate new token (classic)"  
-    3. Scopes: ✓ repo ✓ workflow
-    4. Token kopieren
-
-💾 Token sicher speichern:
-    Erstelle Datei: github_token.txt
-    Inhalt: ghp_xxxxxxxxxxxxxxxxxxxx (nur das Token!)
-    
-💡 Warum so? GitHub deaktiviert Token die im Code stehen automatisch!
-                """)
-                return False
+        token = load_github_token()
+        if not token:
+            return False
         
-        logger.info("🚀 Starte automatischen GitHub Deployment...")
-        github_manager = GitHubManager(username, token, repo_name)
+        github_manager = create_github_manager(token)
+        if not generator.changed_artifacts and not github_manager.has_pending_push():
+            # Kein git add/commit/push und kein Netzwerk-Roundtrip
+            logger.info("💤 Nichts zu deployen - überspringe GitHub Push")
+            return True
         
-        success, website_url = github_manager.full_deployment()
+        logger.info("🚀 Starte automatischen GitHub Deployment...")
+        success, website_url = github_manager.full_deployment(generator.changed_paths)
         
         if success:
             print(f"""
@@ -199,5 +485,17 @@ def main():
         return False
 
 if __name__ == "__main__":
-    success = main()
+    parser = argparse.ArgumentParser(description="LoL Team Stats - Scrapen, Dashboard generieren, deployen")
+    parser.add_argument('--batch', nargs='+', metavar='PATH',
+                        help="Team-Configs (JSON-Dateien oder Verzeichnisse) gemeinsam verarbeiten")
+    parser.add_argument('--daemon', action='store_true',
+                        help="Dauerbetrieb: Spieler zyklisch aktualisieren, nur bei Änderungen deployen")
+    args = parser.parse_args()
+    
+    if args.daemon:
+        success = run_daemon()
+    elif args.batch:
+        success = run_batch(args.batch)
+    else:
+        success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file
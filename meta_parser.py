@@ -0,0 +1,58 @@
+# meta_parser.py
+# Schneller Meta-Tag Parser für op.gg Seiten - liest nur den <head> statt den ganzen DOM
+
+from html.parser import HTMLParser
+from typing import Dict, Optional
+
+# Reihenfolge = Priorität (wie bisher: description, dann twitter, dann og)
+DESCRIPTION_META_NAMES = ('description', 'twitter:description', 'og:description')
+
+class MetaDescriptionParser(HTMLParser):
+    """Inkrementeller Parser: sammelt Description-Meta-Tags und stoppt nach description bzw. </head>"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.descriptions: Dict[str, str] = {}
+        self.done = False
+    
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        
+        if tag == 'meta':
+            attributes = dict(attrs)
+            name = (attributes.get('name') or attributes.get('property') or '').lower()
+            content = attributes.get('content')
+            if name in DESCRIPTION_META_NAMES and content is not None:
+                self.descriptions.setdefault(name, content)
+                if name == DESCRIPTION_META_NAMES[0]:
+                    self.done = True
+        elif tag == 'body':
+            # Kein </head> gesehen, aber der Body hat begonnen
+            self.done = True
+    
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self.done = True
+    
+    def feed(self, data: str):
+        """Ignoriert weitere Daten sobald der Parser fertig ist"""
+        if not self.done:
+            super().feed(data)
+    
+    @property
+    def description(self) -> Optional[str]:
+        """Beste gefundene Beschreibung nach Priorität (None wenn keine)"""
+        for name in DESCRIPTION_META_NAMES:
+            if name in self.descriptions:
+                return self.descriptions[name]
+        return None
+
+def extract_meta_description(html: str, chunk_size: int = 8192) -> Optional[str]:
+    """Liest HTML stückweise bis die Beschreibung gefunden oder der <head> zu Ende ist"""
+    parser = MetaDescriptionParser()
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start:start + chunk_size])
+        if parser.done:
+            break
+    return parser.description
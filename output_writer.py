@@ -0,0 +1,99 @@
+# output_writer.py
+# Atomares Schreiben der docs/ Artefakte: Temp-Datei + fsync + rename, unveränderte Dateien werden übersprungen
+
+import hashlib
+import os
+import tempfile
+from typing import Dict, List, NamedTuple, Union
+
+class WriteResult(NamedTuple):
+    """Ergebnis für ein Artefakt"""
+    name: str
+    bytes_written: int
+    skipped: bool
+
+class OutputWriter:
+    """Schreibt Dateien so, dass Leser (Webserver, git) nie eine halbe Datei sehen"""
+    
+    def __init__(self, output_dir: str, fsync: bool = True):
+        self.output_dir = output_dir
+        self.fsync = fsync
+        self.results: List[WriteResult] = []
+        os.makedirs(output_dir, exist_ok=True)
+    
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        """SHA-256 einer bestehenden Datei ('' wenn sie nicht existiert)"""
+        sha = hashlib.sha256()
+        try:
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(65536), b''):
+                    sha.update(chunk)
+        except OSError:
+            return ''
+        return sha.hexdigest()
+    
+    def _sync_dir(self, directory: str):
+        """Rename im Verzeichnis dauerhaft machen (nicht überall unterstützt)"""
+        if not self.fsync or not hasattr(os, 'O_DIRECTORY'):
+            return
+        try:
+            fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
+    def write(self, name: str, content: Union[str, bytes]) -> WriteResult:
+        """Schreibt name atomar - überspringt den Schreibvorgang wenn der Inhalt identisch ist"""
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        path = os.path.join(self.output_dir, name)
+        
+        if hashlib.sha256(data).hexdigest() == self._hash_file(path):
+            result = WriteResult(name, 0, True)
+            self.results.append(result)
+            return result
+        
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        
+        # Temp-Datei im selben Verzeichnis, damit os.replace() ein atomarer Rename bleibt
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(name)}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            # mkstemp legt 0600 an - Rechte der bisherigen Datei übernehmen, sonst 0644
+            try:
+                mode = os.stat(path).st_mode & 0o777
+            except OSError:
+                mode = 0o644
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        
+        self._sync_dir(directory)
+        result = WriteResult(name, len(data), False)
+        self.results.append(result)
+        return result
+    
+    @property
+    def changed(self) -> List[str]:
+        """Namen der tatsächlich geschriebenen Artefakte"""
+        return [result.name for result in self.results if not result.skipped]
+    
+    @property
+    def bytes_written(self) -> Dict[str, int]:
+        """Geschriebene Bytes pro Artefakt (0 = übersprungen)"""
+        return {result.name: result.bytes_written for result in self.results}
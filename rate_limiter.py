@@ -0,0 +1,106 @@
+# rate_limiter.py
+# Token-Bucket Rate Limiter pro Host - geteilt von allen op.gg Requests
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+class RateLimiter:
+    """Token-Bucket pro Host mit Unterstützung für Retry-After (429/503)"""
+    
+    # Status Codes bei denen der Server uns explizit bremst
+    THROTTLE_STATUS_CODES = (429, 503)
+    
+    def __init__(self, requests_per_second: float = 1.0, burst: int = 1,
+                 default_retry_after: float = 5.0, max_retry_after: float = 300.0):
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second muss größer als 0 sein")
+        
+        self.logger = logging.getLogger(__name__)
+        self.rate = float(requests_per_second)
+        self.burst = max(1, int(burst))
+        self.default_retry_after = default_retry_after
+        self.max_retry_after = max_retry_after
+        
+        self._lock = threading.Lock()
+        # host -> {'tokens': float, 'updated': float, 'blocked_until': float}
+        self._buckets: Dict[str, Dict[str, float]] = {}
+    
+    def _get_bucket(self, host: str, now: float) -> Dict[str, float]:
+        """Liefert den Bucket eines Hosts und füllt Tokens seit dem letzten Zugriff auf"""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = {'tokens': float(self.burst), 'updated': now, 'blocked_until': 0.0}
+            self._buckets[host] = bucket
+        else:
+            elapsed = now - bucket['updated']
+            bucket['tokens'] = min(float(self.burst), bucket['tokens'] + elapsed * self.rate)
+            bucket['updated'] = now
+        return bucket
+    
+    def acquire(self, url: str):
+        """Blockiert bis für den Host der URL ein Token verfügbar ist"""
+        host = urlsplit(url).netloc.lower()
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                bucket = self._get_bucket(host, now)
+                
+                if bucket['blocked_until'] > now:
+                    # Server hat uns per Retry-After gebremst
+                    wait = bucket['blocked_until'] - now
+                elif bucket['tokens'] >= 1:
+                    bucket['tokens'] -= 1
+                    return
+                else:
+                    wait = (1 - bucket['tokens']) / self.rate
+            
+            time.sleep(wait)
+    
+    def update_from_response(self, url: str, status_code: int, headers: Optional[Mapping[str, str]] = None) -> float:
+        """Wertet eine Antwort aus und sperrt den Host bei 429/503 gemäß Retry-After.
+        
+        Gibt die verhängte Pause in Sekunden zurück (0 wenn nicht gebremst wurde).
+        """
+        if status_code not in self.THROTTLE_STATUS_CODES:
+            return 0.0
+        
+        retry_after = self.parse_retry_after((headers or {}).get('Retry-After'))
+        if retry_after is None:
+            retry_after = self.default_retry_after
+        retry_after = min(retry_after, self.max_retry_after)
+        
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._get_bucket(host, now)
+            bucket['blocked_until'] = max(bucket['blocked_until'], now + retry_after)
+            # Nach der Sperre nicht sofort mit vollem Burst weitermachen
+            bucket['tokens'] = 0.0
+        
+        self.logger.warning(f"⏳ {host} antwortet mit {status_code} - pausiere {retry_after:.1f}s")
+        return retry_after
+    
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parst Retry-After als Sekunden oder HTTP-Datum"""
+        if not value:
+            return None
+        
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
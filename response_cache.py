@@ -0,0 +1,149 @@
+# response_cache.py
+# Persistenter HTTP Response Cache mit ETag/Last-Modified Revalidierung und LRU-Limit
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import quote, unquote, urlsplit, urlunsplit
+
+class ResponseCache:
+    """Speichert op.gg Seiten auf der Platte - frische Einträge ohne Request, alte per Conditional GET"""
+    
+    INDEX_FILE = 'index.json'
+    
+    def __init__(self, cache_dir: str = '.cache/responses', ttl: float = 300,
+                 max_entries: int = 500, max_bytes: int = 50 * 1024 * 1024):
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # key -> {'url': str, 'size': int, 'last_access': float}
+        self._index: Dict[str, Dict] = self._load_index()
+    
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Normalisiert Summoner-URLs (Schema/Host/Pfad klein, einheitliches Encoding, ohne Slash am Ende)"""
+        parts = urlsplit(url.strip())
+        # op.gg unterscheidet bei Riot IDs nicht zwischen Groß- und Kleinschreibung
+        path = quote(unquote(parts.path).lower(), safe='/-')
+        path = path.rstrip('/') or '/'
+        query = '&'.join(sorted(q for q in parts.query.split('&') if q))
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+    
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(self.normalize_url(url).encode('utf-8')).hexdigest()
+    
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _load_index(self) -> Dict[str, Dict]:
+        """Lädt den LRU-Index (defekter Index = leerer Cache)"""
+        try:
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _write_json(self, path: str, data: Dict):
+        """Schreibt JSON atomar (temp Datei + rename)"""
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    
+    def get(self, url: str) -> Optional[Dict]:
+        """Liefert den Cache-Eintrag (body, etag, last_modified, stored_at) oder None"""
+        key = self._key(url)
+        with self._lock:
+            if key not in self._index:
+                return None
+            
+            try:
+                with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                # Eintrag verschwunden oder kaputt - aus dem Index entfernen
+                self._index.pop(key, None)
+                return None
+            
+            self._index[key]['last_access'] = time.time()
+            return entry
+    
+    def is_fresh(self, entry: Dict) -> bool:
+        """True wenn der Eintrag jünger als die TTL ist"""
+        return time.time() - entry.get('stored_at', 0) < self.ttl
+    
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """Header für einen Conditional GET auf Basis der gespeicherten Validatoren"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def put(self, url: str, body: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Speichert eine Antwort und verdrängt bei Bedarf die ältesten Einträge"""
+        key = self._key(url)
+        entry = {
+            'url': self.normalize_url(url),
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': time.time()
+        }
+        
+        with self._lock:
+            try:
+                self._write_json(self._entry_path(key), entry)
+            except OSError as e:
+                self.logger.warning(f"⚠️ Cache-Eintrag konnte nicht gespeichert werden: {e}")
+                return
+            
+            self._index[key] = {
+                'url': entry['url'],
+                'size': len(body.encode('utf-8')),
+                'last_access': entry['stored_at']
+            }
+            self._evict()
+            self._save_index()
+    
+    def refresh(self, url: str, entry: Dict):
+        """Markiert einen Eintrag nach 304 Not Modified wieder als frisch"""
+        self.put(url, entry['body'], entry.get('etag'), entry.get('last_modified'))
+    
+    def _evict(self):
+        """LRU-Verdrängung bis Anzahl und Größe im Limit sind (Lock muss gehalten werden)"""
+        total_bytes = sum(meta.get('size', 0) for meta in self._index.values())
+        if len(self._index) <= self.max_entries and total_bytes <= self.max_bytes:
+            return
+        
+        for key in sorted(self._index, key=lambda k: self._index[k].get('last_access', 0)):
+            if len(self._index) <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            total_bytes -= self._index.pop(key).get('size', 0)
+            try:
+                os.remove(self._entry_path(key))
+            except OSError:
+                pass
+    
+    def _save_index(self):
+        try:
+            self._write_json(os.path.join(self.cache_dir, self.INDEX_FILE), self._index)
+        except OSError as e:
+            self.logger.warning(f"⚠️ Cache-Index konnte nicht gespeichert werden: {e}")
+    
+    def flush(self):
+        """Persistiert die LRU-Zugriffszeiten"""
+        with self._lock:
+            self._save_index()
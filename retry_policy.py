@@ -0,0 +1,123 @@
+# retry_policy.py
+# Wiederverwendbare Retry-Logik mit exponentiellem Backoff, Jitter und Deadline
+
+import logging
+import random
+import time
+from typing import Callable, Dict, Optional, TypeVar
+
+import requests
+
+from rate_limiter import RateLimiter
+
+T = TypeVar('T')
+
+class RetryPolicy:
+    """Exponentielles Backoff mit Jitter, getrennten Regeln pro Fehlerart und Gesamt-Deadline"""
+    
+    # Regeln pro Fehlerart: maximale Versuche und Basis-Pause (Sekunden)
+    DEFAULT_RULES = {
+        'timeout': {'max_attempts': 2, 'base_delay': 1.0},        # Server antwortet nicht rechtzeitig
+        'connection': {'max_attempts': 3, 'base_delay': 0.5},     # Connection Reset / DNS / Verbindungsabbruch
+        'throttled': {'max_attempts': 4, 'base_delay': 2.0},      # 429 - Retry-After hat Vorrang
+        'server_error': {'max_attempts': 3, 'base_delay': 1.0},   # 5xx
+    }
+    
+    def __init__(self, max_attempts: int = 4, deadline: float = 45.0, request_timeout: float = 15.0,
+                 max_delay: float = 10.0, jitter: float = 0.5, rules: Optional[Dict[str, Dict]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.max_attempts = max(1, max_attempts)
+        self.deadline = deadline
+        self.request_timeout = request_timeout
+        self.max_delay = max_delay
+        self.jitter = min(1.0, max(0.0, jitter))
+        
+        self.rules = {name: dict(rule) for name, rule in self.DEFAULT_RULES.items()}
+        for name, rule in (rules or {}).items():
+            self.rules.setdefault(name, {}).update(rule)
+        
+        self._random = random.Random()
+    
+    def classify_exception(self, error: Exception) -> Optional[str]:
+        """Ordnet eine Exception einer Retry-Regel zu (None = nicht wiederholen)"""
+        # ConnectTimeout ist sowohl Timeout als auch ConnectionError - Timeout zuerst prüfen
+        if isinstance(error, requests.exceptions.Timeout):
+            return 'timeout'
+        if isinstance(error, requests.exceptions.ConnectionError):
+            return 'connection'
+        # Verbindungsabbruch mitten im Body (iter_content/response.text) - kein ConnectionError in requests
+        if isinstance(error, (requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError)):
+            return 'connection'
+        return None
+    
+    def classify_status(self, status_code: int) -> Optional[str]:
+        """Ordnet einen HTTP Status einer Retry-Regel zu (None = Antwort ist endgültig)"""
+        if status_code == 429:
+            return 'throttled'
+        if 500 <= status_code < 600:
+            return 'server_error'
+        return None
+    
+    def compute_delay(self, category: str, attempt: int) -> float:
+        """Backoff für den n-ten Fehlversuch einer Kategorie inklusive Jitter"""
+        base_delay = self.rules[category].get('base_delay', 1.0)
+        delay = min(self.max_delay, base_delay * (2 ** (attempt - 1)))
+        return delay * (1 - self.jitter) + self._random.uniform(0, delay * self.jitter)
+    
+    def execute(self, send: Callable[[float], T], label: str = '') -> T:
+        """Führt send(timeout) mit Retries aus.
+        
+        send bekommt den für diesen Versuch erlaubten Timeout und liefert eine Response.
+        Zurückgegeben wird die erste endgültige Response oder die letzte nach Ablauf
+        der Versuche; Exceptions werden nach dem letzten Versuch weitergereicht.
+        """
+        started = time.monotonic()
+        failures: Dict[str, int] = {}
+        attempt = 0
+        
+        while True:
+            attempt += 1
+            remaining = self.deadline - (time.monotonic() - started)
+            timeout = max(0.1, min(self.request_timeout, remaining))
+            
+            response = None
+            error = None
+            try:
+                response = send(timeout)
+                category = self.classify_status(response.status_code)
+                reason = f"Status {response.status_code}"
+            except requests.exceptions.RequestException as e:
+                category = self.classify_exception(e)
+                if category is None:
+                    raise
+                error = e
+                reason = str(e)
+            
+            if category is None:
+                return response
+            
+            failures[category] = failures.get(category, 0) + 1
+            delay = self.compute_delay(category, failures[category])
+            
+            # Retry-After vom Server (429/503) hat Vorrang vor unserem Backoff
+            if response is not None:
+                retry_after = RateLimiter.parse_retry_after(response.headers.get('Retry-After'))
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+            
+            remaining = self.deadline - (time.monotonic() - started)
+            rule_attempts = self.rules[category].get('max_attempts', self.max_attempts)
+            give_up = (
+                attempt >= self.max_attempts
+                or failures[category] >= rule_attempts
+                or delay >= remaining
+            )
+            
+            if give_up:
+                self.logger.warning(f"⚠️  Versuch {attempt} für {label}: {reason} - gebe auf")
+                if error is not None:
+                    raise error
+                return response
+            
+            self.logger.warning(f"⚠️  Versuch {attempt} für {label}: {reason} - neuer Versuch in {delay:.1f}s")
+            time.sleep(delay)
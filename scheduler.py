@@ -0,0 +1,132 @@
+# scheduler.py
+# Dauerbetrieb: hält Session und Daten zwischen den Zyklen warm statt main() neu zu starten
+
+import logging
+import os
+import signal
+import threading
+import time
+from typing import Dict, Optional
+
+from deploy_queue import DeployQueue
+from lol_scraper import LoLScraper
+from github_pages_generator import GitHubPagesGenerator
+from github_manager import GitHubManager
+
+class StatsScheduler:
+    """Aktualisiert Spieler nach ihrem eigenen Intervall und deployt nur bei Änderungen"""
+    
+    def __init__(self, scraper: LoLScraper, generator: GitHubPagesGenerator, team_config: Dict,
+                 output_dir: str = "docs", github_manager: Optional[GitHubManager] = None,
+                 cycle_interval: float = 60, max_age_minutes: float = 30,
+                 deploy_queue: Optional[DeployQueue] = None):
+        self.logger = logging.getLogger(__name__)
+        self.scraper = scraper
+        self.generator = generator
+        self.team_config = team_config
+        self.output_dir = output_dir
+        self.github_manager = github_manager
+        # Mit Queue wird im Hintergrund deployt - der nächste Zyklus wartet nicht auf git push
+        self.deploy_queue = deploy_queue
+        # Seit dem letzten erfolgreichen Push geänderte Dateien - bleiben stehen, bis ein Deployment klappt
+        self.unpublished_paths: Dict[str, None] = {}
+        self.cycle_interval = cycle_interval
+        self.max_age_minutes = max_age_minutes
+        
+        self.stop_event = threading.Event()
+        self.cycles = 0
+        
+        # Letzter Stand im Speicher - beim Start aus data.json übernehmen
+        self.players: Dict[str, Dict] = scraper.load_previous_team_data(os.path.join(output_dir, 'data.json'))
+    
+    def run_cycle(self, force: bool = False) -> bool:
+        """Ein Zyklus: veraltete Spieler scrapen, bei Änderungen rendern und deployen"""
+        self.cycles += 1
+        started = time.monotonic()
+        
+        team_data = self.scraper.scrape_team(
+            self.team_config,
+            previous_players=self.players,
+            max_age_minutes=self.max_age_minutes
+        )
+        
+        if not team_data['players']:
+            self.logger.error("❌ Keine Spielerdaten erhalten!")
+            return False
+        
+        self.players = {
+            riot_id: {key: record[key] for key in LoLScraper.PLAYER_FIELDS if key in record}
+            for riot_id, record in team_data['players'].items()
+        }
+        
+        # Der Generator entscheidet über den Digest (Daten, Template, Assets, Optionen), ob sich etwas ändert
+        html_file = self.generator.generate_page(team_data, self.output_dir, force=force)
+        if not self.generator.changed_artifacts:
+            self.logger.info("💤 Keine Änderungen - überspringe Generierung")
+            self._publish()
+            return False
+        written = sum(self.generator.write_stats.values())
+        self.logger.info(f"✅ Website generiert: {html_file} ({', '.join(self.generator.changed_artifacts)}, {written:,} Bytes)")
+        
+        self.unpublished_paths.update(dict.fromkeys(self.generator.changed_paths))
+        self._publish()
+        
+        self.logger.info(f"⏱️ Zyklus {self.cycles} in {time.monotonic() - started:.1f}s")
+        return True
+    
+    def _publish(self):
+        """Deployt alle noch nicht veröffentlichten Dateien (auch aus Zyklen mit fehlgeschlagenem Push)"""
+        if not self.unpublished_paths:
+            return
+        paths = list(self.unpublished_paths)
+        
+        if self.deploy_queue:
+            # Die Queue wiederholt fehlgeschlagene Deployments selbst
+            self.deploy_queue.submit(paths)
+            self.unpublished_paths = {}
+            self.logger.info(f"📤 Deployment eingereiht (bisher: {self.deploy_queue.summary()})")
+        elif self.github_manager:
+            success, website_url = self.github_manager.full_deployment(paths)
+            if success:
+                self.unpublished_paths = {}
+                self.logger.info(f"🌐 Live: {website_url}")
+            else:
+                self.logger.warning("⚠️ GitHub Push fehlgeschlagen - nächster Versuch im nächsten Zyklus")
+        else:
+            # Nur lokaler Betrieb: nichts zu veröffentlichen
+            self.unpublished_paths = {}
+    
+    def _handle_signal(self, signum, frame):
+        self.logger.info(f"🛑 Signal {signum} empfangen - beende nach aktuellem Zyklus")
+        self.stop_event.set()
+    
+    def stop(self):
+        """Beendet run_forever() nach dem laufenden Zyklus"""
+        self.stop_event.set()
+    
+    def run_forever(self):
+        """Läuft bis SIGINT/SIGTERM oder stop()"""
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self._handle_signal)
+            signal.signal(signal.SIGTERM, self._handle_signal)
+        
+        self.logger.info(f"🔁 Scheduler gestartet (Zyklus alle {self.cycle_interval}s)")
+        if self.deploy_queue:
+            self.deploy_queue.start()
+        
+        while not self.stop_event.is_set():
+            try:
+                self.run_cycle()
+            except Exception as e:
+                # Ein fehlerhafter Zyklus darf den Dauerbetrieb nicht beenden
+                self.logger.error(f"❌ Fehler im Zyklus {self.cycles}: {e}")
+            
+            self.stop_event.wait(self.cycle_interval)
+        
+        if self.deploy_queue:
+            # Letztes eingereihtes Deployment noch abschließen
+            self.deploy_queue.stop(timeout=self.deploy_queue.timeout)
+            self.logger.info(f"📤 Deployments: {self.deploy_queue.summary()}")
+        
+        self.scraper.close()
+        self.logger.info("👋 Scheduler beendet")
@@ -0,0 +1,24 @@
+# seeded_random.py
+# Reproduzierbare Zufallswerte pro Spieler: gleiche gescrapte Daten = gleiche generierte Stats
+
+import hashlib
+import json
+import random
+from typing import Dict
+
+# Gescrapte Felder, aus denen der Seed abgeleitet wird
+SEED_FIELDS = ('tier', 'rank', 'lp', 'wins', 'losses', 'win_rate')
+
+def player_seed(player: Dict, namespace: str = '') -> int:
+    """Seed aus riot_id + gescrapten Zahlen (+ namespace, damit jede Verwendung eigene Werte bekommt)"""
+    champions = [
+        [champ.get('name', ''), champ.get('games', 0), champ.get('win_rate', 0)]
+        for champ in player.get('main_champions', [])
+    ]
+    key = [namespace, player.get('riot_id', ''), [player.get(field) for field in SEED_FIELDS], champions]
+    digest = hashlib.sha256(json.dumps(key, ensure_ascii=False).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+def player_rng(player: Dict, namespace: str = '') -> random.Random:
+    """Eigener Zufallsgenerator pro Spieler - unabhängig vom globalen random-Modul"""
+    return random.Random(player_seed(player, namespace))
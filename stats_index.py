@@ -0,0 +1,197 @@
+# stats_index.py
+# Vorberechneter Statistik-Index pro Render: alle Ranglisten-Werte in einem Durchlauf, jede Sortierung nur einmal
+
+from typing import Dict, List, Tuple
+
+TIER_VALUES = {
+    'challenger': 9000,
+    'grandmaster': 8000,
+    'master': 7000,
+    'diamond': 6000,
+    'emerald': 5000,
+    'platinum': 4000,
+    'gold': 3000,
+    'silver': 2000,
+    'bronze': 1000,
+    'iron': 0
+}
+
+# Alle Metriken, für die das Dashboard Leaderboards anzeigt
+RANKED_METRICS = (
+    'win_rate', 'performance_score', 'kda_ratio', 'rank_value',
+    'avg_gold', 'avg_cs', 'avg_damage', 'kill_participation', 'vision_score'
+)
+
+def get_rank_value(player: Dict) -> int:
+    """Konvertiert Rank zu numerischem Wert für Sortierung"""
+    return TIER_VALUES.get(player.get('tier', '').lower(), 0) + player.get('lp', 0)
+
+def get_performance_score(player: Dict) -> int:
+    """Performance Score aus Win Rate, KDA und Kill Participation (max. 100)"""
+    wr = player.get('win_rate', 0)
+    kda = player.get('kda_ratio', 1.0)
+    kp = player.get('kill_participation', 50)
+    return min(100, round(wr * 0.4 + kda * 15 + kp * 0.45))
+
+def format_metric(metric: str, value, player: Dict) -> str:
+    """Anzeige-Text eines Wertes im Leaderboard"""
+    if metric == 'rank_value':
+        return f"{player.get('tier', 'Unranked')} {player.get('lp', 0)}LP"
+    if metric == 'performance_score':
+        return f"{value}/100"
+    if metric == 'win_rate':
+        return f"{value:.2f}%"
+    if metric == 'kda_ratio':
+        return f"{value:.2f}"
+    if metric == 'avg_gold':
+        return f"{value:,}g"
+    if metric == 'avg_cs':
+        return f"{value} CS"
+    if metric == 'avg_damage':
+        return f"{value:,}"
+    return str(value)
+
+def rate_champion(champion: Dict) -> Dict[str, str]:
+    """Bewertung eines Champions (CSS-Klassen und Analyse-Text) aus Win Rate und KDA"""
+    win_rate = champion.get('win_rate', 0)
+    avg_kda = champion.get('avg_kda', 0)
+    
+    # Realistische Farbe basierend auf Winrate
+    if win_rate >= 70:
+        wr_class = "excellent"  # Sehr starke Performance
+    elif win_rate >= 60:
+        wr_class = "good"       # Gute Performance
+    elif win_rate >= 50:
+        wr_class = "average"    # Durchschnittlich
+    elif win_rate >= 40:
+        wr_class = "below"      # Unter Durchschnitt
+    else:
+        wr_class = "poor"       # Schwache Performance
+    
+    # KDA Farbe
+    if avg_kda >= 2.5:
+        kda_class = "excellent"
+    elif avg_kda >= 2.0:
+        kda_class = "good"
+    elif avg_kda >= 1.5:
+        kda_class = "average"
+    else:
+        kda_class = "poor"
+    
+    if win_rate >= 65:
+        analysis = "🔥 Starker Champion für diesen Spieler!"
+    elif win_rate >= 55:
+        analysis = "✅ Solide Performance"
+    elif win_rate >= 45:
+        analysis = "⚡ Gute Grundlage"
+    else:
+        analysis = "📈 Potential für Verbesserung"
+    
+    return {'wr_class': wr_class, 'kda_class': kda_class, 'rating': wr_class.title(), 'analysis': analysis}
+
+class StatsIndex:
+    """Berechnet alle Ranglisten-Metriken einmal und hält die sortierten Reihenfolgen vor"""
+    
+    def __init__(self, players: List[Tuple[str, Dict]]):
+        self.players = players
+        self.names: List[str] = [name.split('#')[0] if '#' in name else name for name, _ in players]
+        self.values: Dict[str, List] = {metric: [] for metric in RANKED_METRICS}
+        self.totals: Dict[str, float] = {}
+        
+        # Ein Durchlauf über alle Spieler für alle Metriken
+        for _, player_data in players:
+            for metric in RANKED_METRICS:
+                if metric == 'rank_value':
+                    value = get_rank_value(player_data)
+                elif metric == 'performance_score':
+                    value = get_performance_score(player_data)
+                else:
+                    value = player_data.get(metric, 0)
+                self.values[metric].append(value)
+        
+        # Summen für Team-Durchschnitte
+        for key in ('total_games', 'wins'):
+            self.totals[key] = sum(player_data.get(key, 0) for _, player_data in players)
+        for metric in RANKED_METRICS:
+            self.totals[metric] = sum(self.values[metric])
+        
+        # Absteigend sortierte Positionen pro Metrik (stabil: bei Gleichstand zählt die Lane-Reihenfolge)
+        self.orderings: Dict[str, List[int]] = {
+            metric: sorted(range(len(players)), key=values.__getitem__, reverse=True)
+            for metric, values in self.values.items()
+        }
+    
+    def __len__(self) -> int:
+        return len(self.players)
+    
+    def average(self, metric: str) -> float:
+        """Team-Durchschnitt einer Metrik"""
+        return self.totals[metric] / len(self.players) if self.players else 0
+    
+    def best(self, metric: str) -> Tuple[str, Dict]:
+        """Spieler (riot_id, Daten) mit dem höchsten Wert der Metrik"""
+        return self.players[self.orderings[metric][0]]
+    
+    def top(self, metric: str, limit: int = 5) -> List[Tuple[str, object, str]]:
+        """Die besten Spieler einer Metrik als (Name, Wert, Anzeige-Text)"""
+        values = self.values[metric]
+        return [
+            (self.names[i], values[i], format_metric(metric, values[i], self.players[i][1]))
+            for i in self.orderings[metric][:limit]
+        ]
+    
+    def leaderboards(self, limit: int = 5) -> Dict[str, List[Dict[str, str]]]:
+        """Top-Spieler aller Metriken mit fertigem Anzeige-Text (für data.json im Client Rendering)"""
+        return {
+            metric: [
+                {'riot_id': self.players[i][0], 'name': self.names[i],
+                 'text': format_metric(metric, self.values[metric][i], self.players[i][1])}
+                for i in self.orderings[metric][:limit]
+            ]
+            for metric in RANKED_METRICS
+        }
+    
+    def team_overview(self) -> Dict:
+        """Team-KPIs des Dashboards (Durchschnitte, Performance Rating, Trend, höchster Rank)"""
+        if not self.players:
+            return {}
+        
+        total_games = self.totals['total_games']
+        total_wins = self.totals['wins']
+        avg_wr = round((total_wins / max(total_games, 1)) * 100)
+        avg_kda = round(self.average('kda_ratio'), 2)
+        avg_kill_participation = round(self.average('kill_participation'))
+        
+        # Team Performance Rating
+        performance_rating = min(100, round((avg_wr * 0.4 + avg_kda * 10 + avg_kill_participation * 0.6)))
+        
+        # Trend Direction basierend auf aktueller Performance
+        if avg_wr >= 60:
+            trend_icon, trend_class = "📈", "trend-up"
+        elif avg_wr >= 50:
+            trend_icon, trend_class = "➡️", "trend-stable"
+        else:
+            trend_icon, trend_class = "📉", "trend-down"
+        
+        # Höchster Rank (nur die Tier, z.B. "Diamond" aus "Diamond II")
+        best = self.orderings['rank_value'][0]
+        highest_rank = self.players[best][1].get('rank', 'Unranked') or 'Unranked'
+        
+        return {
+            'total_games': total_games,
+            'total_wins': total_wins,
+            'total_losses': total_games - total_wins,
+            'avg_win_rate': avg_wr,
+            'avg_gold': round(self.average('avg_gold')),
+            'avg_cs': round(self.average('avg_cs')),
+            'avg_vision': round(self.average('vision_score')),
+            'avg_damage': round(self.average('avg_damage')),
+            'avg_kda': avg_kda,
+            'avg_kill_participation': avg_kill_participation,
+            'performance_rating': performance_rating,
+            'trend_icon': trend_icon,
+            'trend_class': trend_class,
+            'highest_rank': highest_rank.split()[0] if highest_rank.split() else 'Unranked',
+            'highest_name': self.names[best],
+            'team_size': len(self.players)
+        }
@@ -0,0 +1,69 @@
+# template_engine.py
+# Vorkompilierte HTML Templates: einmal in statische Stücke + Platzhalter zerlegen, danach nur noch join
+
+import hashlib
+import threading
+from string import Formatter
+from typing import Callable, Dict, List, Optional, Tuple
+
+class CompiledTemplate:
+    """Template im str.format-Stil, das beim Kompilieren in Text-Chunks und Slots zerlegt wird"""
+    
+    def __init__(self, source: str, partials: Optional[Dict[str, str]] = None):
+        self.source = source
+        # Statische Teile (CSS, JS) werden beim Kompilieren fest eingesetzt und brauchen keine {{ }}
+        partials = partials or {}
+        
+        # Ändert sich mit jeder Template-Änderung (z.B. für Content-Digests)
+        fingerprint = hashlib.sha256(source.encode('utf-8'))
+        for name in sorted(partials):
+            fingerprint.update(f"\0{name}\0{partials[name]}".encode('utf-8'))
+        self.fingerprint = fingerprint.hexdigest()
+        # (statischer Text vor dem Slot, Slot-Name) - der Rest nach dem letzten Slot steht in tail
+        self.parts: List[Tuple[str, str]] = []
+        
+        chunks: List[str] = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(source):
+            # parse() hat doppelte Klammern ({{ / }}) bereits zu einfachen aufgelöst
+            chunks.append(literal)
+            if field_name is None:
+                continue
+            if not field_name.isidentifier() or format_spec or conversion:
+                raise ValueError(f"Nicht unterstützter Platzhalter: {{{field_name}}}")
+            if field_name in partials:
+                chunks.append(partials[field_name])
+                continue
+            self.parts.append((''.join(chunks), field_name))
+            chunks = []
+        self.tail = ''.join(chunks)
+        
+        self.slots = tuple(dict.fromkeys(name for _, name in self.parts))
+    
+    def render(self, **values) -> str:
+        """Setzt die Werte in die Slots ein (zusätzliche Werte werden ignoriert wie bei str.format)"""
+        missing = [slot for slot in self.slots if slot not in values]
+        if missing:
+            raise KeyError(f"Fehlende Template-Werte: {', '.join(missing)}")
+        
+        output = []
+        for literal, slot in self.parts:
+            output.append(literal)
+            output.append(str(values[slot]))
+        output.append(self.tail)
+        return ''.join(output)
+
+_cache: Dict[str, CompiledTemplate] = {}
+_cache_lock = threading.Lock()
+
+def get_compiled_template(key: str, loader: Callable[[], str],
+                          partials: Optional[Dict[str, Callable[[], str]]] = None) -> CompiledTemplate:
+    """Liefert das kompilierte Template für key - loader/partials werden nur beim ersten Zugriff aufgerufen"""
+    template = _cache.get(key)
+    if template is None:
+        with _cache_lock:
+            template = _cache.get(key)
+            if template is None:
+                loaded_partials = {name: load() for name, load in (partials or {}).items()}
+                template = CompiledTemplate(loader(), loaded_partials)
+                _cache[key] = template
+    return template
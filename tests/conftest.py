@@ -0,0 +1,49 @@
+# conftest.py
+# Module liegen flach im Repo-Root - für die Tests importierbar machen
+# Gemeinsame Testdaten-Helfer (from conftest import make_player, make_team, git)
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def make_player(riot_id, tier='Gold', wins=10, losses=8, lane='TOP', last_updated='2025-01-01 12:00:00'):
+    return {
+        'riot_id': riot_id, 'summoner_name': riot_id, 'tier': tier, 'rank': f'{tier} 2', 'lp': 40,
+        'wins': wins, 'losses': losses, 'total_games': wins + losses, 'win_rate': round(wins * 100 / (wins + losses)),
+        'main_champions': [{'name': 'Ahri', 'wins': 5, 'losses': 3, 'games': 8, 'win_rate': 62}],
+        'last_updated': last_updated, 'lane': lane, 'recent_games': []
+    }
+
+def make_team(*players, last_updated='2025-01-01 12:00:00'):
+    return {
+        'team_name': 'Test Team', 'last_updated': last_updated, 'total_players': len(players),
+        'success_count': len(players), 'players': {player['riot_id']: player for player in players}
+    }
+
+def git(cwd, *args) -> str:
+    """git im Repository cwd ausführen und stdout liefern"""
+    return subprocess.run(['git', *args], cwd=str(cwd), check=True, capture_output=True, text=True).stdout.rstrip('\n')
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """Leeres Repository als Arbeitsverzeichnis mit bare Remote daneben (origin) - ohne globale git Config"""
+    home = tmp_path / 'home'
+    home.mkdir()
+    monkeypatch.setenv('HOME', str(home))
+    monkeypatch.setenv('GIT_CONFIG_NOSYSTEM', '1')
+    for prefix in ('GIT_AUTHOR', 'GIT_COMMITTER'):
+        monkeypatch.setenv(f'{prefix}_NAME', 'Test')
+        monkeypatch.setenv(f'{prefix}_EMAIL', 'test@example.com')
+    
+    remote = tmp_path / 'remote.git'
+    git(tmp_path, 'init', '--quiet', '--bare', str(remote))
+    repo = tmp_path / 'repo'
+    repo.mkdir()
+    git(repo, 'init', '--quiet', '--initial-branch=main')
+    git(repo, 'remote', 'add', 'origin', str(remote))
+    monkeypatch.chdir(repo)
+    return repo
@@ -0,0 +1,80 @@
+# test_asset_pipeline.py
+# Assets mit Content-Hash: stabile Namen, keine Duplikate, CDN-Fallback für Chart.js und Cache-Key der Seiten-Assets
+
+import requests
+
+import asset_pipeline
+from asset_pipeline import CHARTJS_CDN_URL, CHARTJS_VERSION, AssetPipeline
+from github_pages_generator import GitHubPagesGenerator
+
+def test_hashed_name_is_stable_and_follows_content():
+    first = AssetPipeline(extract=True).add('dashboard', 'body { color: red; }', 'css')
+    second = AssetPipeline(extract=True).add('dashboard', b'body { color: red; }', 'css')
+    changed = AssetPipeline(extract=True).add('dashboard', 'body { color: blue; }', 'css')
+    
+    assert first == second
+    assert first.startswith('assets/dashboard.') and first.endswith('.css')
+    assert changed != first
+
+def test_identical_content_is_stored_once():
+    pipeline = AssetPipeline(extract=True)
+    first = pipeline.script_html('client', 'console.log(1);')
+    second = pipeline.script_html('client', 'console.log(1);')
+    
+    assert len(pipeline.assets) == 1
+    assert first.startswith('<script src="assets/client.')
+    # Dieselbe Datei wird nur einmal eingebunden
+    assert second == ''
+
+def test_inline_mode_registers_no_files():
+    pipeline = AssetPipeline()
+    head = pipeline.head_html('body {}')
+    
+    assert f'<script src="{CHARTJS_CDN_URL}"></script>' in head
+    assert '<style>body {}</style>' in head
+    assert pipeline.assets == {}
+
+def test_vendored_chartjs_from_cache(tmp_path):
+    (tmp_path / f'chart-{CHARTJS_VERSION}.umd.min.js').write_bytes(b'/* chart */')
+    pipeline = AssetPipeline(vendor_chartjs=True, cache_dir=str(tmp_path), offline=True)
+    head = pipeline.head_html('')
+    
+    [name] = pipeline.assets
+    assert name.startswith('assets/chart.') and pipeline.assets[name] == b'/* chart */'
+    assert f'<script src="{name}"></script>' in head
+    assert CHARTJS_CDN_URL not in head
+
+def test_missing_chartjs_offline_falls_back_to_cdn(tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError('offline: kein Download')
+    
+    monkeypatch.setattr(asset_pipeline.requests, 'get', fail)
+    pipeline = AssetPipeline(vendor_chartjs=True, cache_dir=str(tmp_path), offline=True)
+    
+    assert f'<script src="{CHARTJS_CDN_URL}"></script>' in pipeline.head_html('')
+    assert pipeline.assets == {}
+
+def test_failed_chartjs_download_falls_back_to_cdn(tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise requests.exceptions.ConnectionError('offline')
+    
+    monkeypatch.setattr(asset_pipeline.requests, 'get', fail)
+    pipeline = AssetPipeline(vendor_chartjs=True, cache_dir=str(tmp_path / 'cache'))
+    
+    assert f'<script src="{CHARTJS_CDN_URL}"></script>' in pipeline.head_html('')
+    assert pipeline.assets == {}
+    assert not (tmp_path / 'cache').exists()
+
+def test_page_assets_are_cached_per_cache_dir_and_offline(tmp_path):
+    cached = tmp_path / 'cached'
+    cached.mkdir()
+    (cached / f'chart-{CHARTJS_VERSION}.umd.min.js').write_bytes(b'/* chart */')
+    
+    vendored = GitHubPagesGenerator(asset_pipeline=AssetPipeline(vendor_chartjs=True, cache_dir=str(cached),
+                                                                 offline=True))
+    # Gleiche Optionen, aber leerer Cache: darf nicht die Assets der ersten Instanz wiederverwenden
+    empty = GitHubPagesGenerator(asset_pipeline=AssetPipeline(vendor_chartjs=True, cache_dir=str(tmp_path / 'empty'),
+                                                              offline=True))
+    
+    assert any(name.startswith('assets/chart.') for name in vendored.asset_pipeline.assets)
+    assert not any(name.startswith('assets/chart.') for name in empty.asset_pipeline.assets)
@@ -0,0 +1,76 @@
+# test_batch.py
+# Batch Mode: Team-Configs laden, Ausgabeverzeichnisse prüfen und Spieler teamübergreifend einmal scrapen
+
+import json
+import os
+
+import pytest
+
+from lol_scraper import LoLScraper
+from main import load_team_configs, slugify_team_name
+
+def write_team(directory, name, **fields):
+    config = {'team_name': name, 'players': {f'{name}#EUW': {'lane': 'TOP'}}, **fields}
+    path = directory / f'{slugify_team_name(name)}.json'
+    path.write_text(json.dumps(config), encoding='utf-8')
+    return path
+
+@pytest.fixture
+def teams_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    directory = tmp_path / 'teams'
+    directory.mkdir()
+    return directory
+
+def test_loads_directory_sorted_with_default_output(teams_dir):
+    write_team(teams_dir, 'Zeta Team')
+    write_team(teams_dir, 'The LoungeEsports')
+    (teams_dir / 'notes.txt').write_text('kein JSON')
+    
+    configs = load_team_configs([str(teams_dir)])
+    
+    assert [config['team_name'] for config in configs] == ['The LoungeEsports', 'Zeta Team']
+    assert configs[0]['output_dir'] == os.path.join('docs', 'the-loungeesports')
+
+def test_skips_invalid_configs(teams_dir):
+    (teams_dir / 'broken.json').write_text('{kaputt')
+    (teams_dir / 'empty.json').write_text(json.dumps({'team_name': 'Empty', 'players': {}}))
+    write_team(teams_dir, 'Valid')
+    
+    assert [config['team_name'] for config in load_team_configs([str(teams_dir)])] == ['Valid']
+
+def test_custom_and_duplicate_output(teams_dir):
+    first = write_team(teams_dir, 'A', output='team/a')
+    second = write_team(teams_dir, 'B', output='team/./a')
+    
+    configs = load_team_configs([str(first), str(second)])
+    
+    assert [config['team_name'] for config in configs] == ['A']
+    assert configs[0]['output_dir'] == os.path.join('docs', 'team', 'a')
+
+@pytest.mark.parametrize('output', ['../..', '..', '.', 'a/../../x', '/tmp/outside'])
+def test_rejects_output_outside_docs(teams_dir, output):
+    path = write_team(teams_dir, 'Evil', output=output)
+    assert load_team_configs([str(path)]) == []
+
+def test_players_in_several_teams_are_scraped_once():
+    scraper = LoLScraper()
+    fetched = []
+    
+    def get_player_stats(riot_id, region='euw'):
+        fetched.append(riot_id)
+        return {'riot_id': riot_id, 'tier': 'Gold', 'lane': 'FLEX'}
+    
+    scraper.get_player_stats = get_player_stats
+    teams = [
+        {'team_name': 'A', 'players': {'shared#EUW': {'lane': 'TOP'}, 'a#EUW': {'lane': 'MID'}}},
+        {'team_name': 'B', 'players': {'shared#EUW': {'lane': 'SUPP'}}},
+    ]
+    
+    team_a, team_b = scraper.scrape_teams(teams)
+    
+    assert sorted(fetched) == ['a#EUW', 'shared#EUW']
+    # Lane kommt pro Team aus der jeweiligen Config
+    assert team_a['players']['shared#EUW']['lane'] == 'TOP'
+    assert team_b['players']['shared#EUW']['lane'] == 'SUPP'
+    assert (team_a['success_count'], team_b['success_count']) == (2, 1)
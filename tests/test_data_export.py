@@ -0,0 +1,78 @@
+# test_data_export.py
+# data.json Formate (normal, compact, split) müssen verlustfrei wieder eingelesen werden
+
+import gzip
+import json
+
+import pytest
+
+import data_export
+from data_export import build_data_artifacts, compress_variants, load_team_data
+
+def make_team():
+    player = {
+        'riot_id': 'Kai Sa#EUW', 'summoner_name': 'Kai Sa#EUW', 'tier': 'Gold', 'rank': 'Gold 2', 'lp': 40,
+        'wins': 10, 'losses': 8, 'total_games': 18, 'win_rate': 56, 'lane': 'ADC',
+        'last_updated': '2025-01-01 12:00:00', 'kda_ratio': 2.5,
+        'main_champions': [{'name': "Kai'Sa", 'wins': 5, 'losses': 3, 'games': 8, 'win_rate': 62},
+                           {'name': 'Jinx', 'wins': 2, 'losses': 2, 'games': 4, 'win_rate': 50}],
+        'enhanced_champions': [{'name': "Kai'Sa", 'games': 8, 'kda': 3.1, 'icon': 'KaiSa.png'},
+                               {'name': 'Jinx', 'games': 4, 'kda': 2.0, 'icon': 'Jinx.png'}],
+        'recent_games': [{'result': 'W', 'champion': "Kai'Sa", 'kda': '5/1/7'},
+                         {'result': 'L', 'champion': 'Jinx', 'kda': '2/4/3', 'cs': 180}]
+    }
+    other = {**player, 'riot_id': 'Thresh#EUW', 'summoner_name': 'Thresh#EUW', 'lane': 'SUPP'}
+    return {'team_name': 'Test Team', 'last_updated': '2025-01-01 12:00:00', 'total_players': 2,
+            'success_count': 2, 'players': {player['riot_id']: player, other['riot_id']: other}}
+
+def write_artifacts(tmp_path, artifacts):
+    for name, content in artifacts.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+    return str(tmp_path / 'data.json')
+
+@pytest.mark.parametrize('compact,split_players', [(False, False), (True, False), (False, True), (True, True)])
+def test_round_trip(tmp_path, compact, split_players):
+    team = make_team()
+    artifacts = build_data_artifacts(team, compact=compact, split_players=split_players)
+    
+    assert load_team_data(write_artifacts(tmp_path, artifacts)) == team
+    assert len(artifacts) == (3 if split_players else 1)
+
+def test_compact_is_smaller_and_minified():
+    team = make_team()
+    normal = build_data_artifacts(team, compact=False)['data.json']
+    compact = build_data_artifacts(team, compact=True)['data.json']
+    
+    assert len(compact) < len(normal)
+    assert '\n' not in compact
+    assert json.loads(compact)['format'] == data_export.COMPACT_FORMAT
+
+def test_split_manifest_carries_summary(tmp_path):
+    artifacts = build_data_artifacts(make_team(), compact=True, split_players=True)
+    manifest = json.loads(artifacts['data.json'])
+    entry = manifest['players']['Kai Sa#EUW']
+    
+    assert entry['file'] in artifacts and entry['file'].startswith('players/kai-sa-euw-')
+    assert (entry['tier'], entry['kda_ratio']) == ('Gold', 2.5)
+    assert 'recent_games' not in entry
+
+def test_split_with_missing_player_file(tmp_path):
+    artifacts = build_data_artifacts(make_team(), compact=True, split_players=True)
+    data_file = write_artifacts(tmp_path, artifacts)
+    (tmp_path / json.loads(artifacts['data.json'])['players']['Thresh#EUW']['file']).unlink()
+    
+    assert list(load_team_data(data_file)['players']) == ['Kai Sa#EUW']
+
+def test_compress_variants_are_deterministic():
+    content = json.dumps(make_team()).encode('utf-8')
+    variants = compress_variants(content)
+    
+    assert gzip.decompress(variants['.gz']) == content
+    assert compress_variants(content)['.gz'] == variants['.gz']
+    assert ('.br' in variants) == data_export.BROTLI_AVAILABLE
+
+def test_compress_variants_without_brotli(monkeypatch):
+    monkeypatch.setattr(data_export, 'brotli', None)
+    assert list(compress_variants(b'{}')) == ['.gz']
@@ -0,0 +1,144 @@
+# test_deploy_queue.py
+# Deployment im Hintergrund: Zusammenfassen, Timeout, Wiederholung mit Backoff und sauberes Beenden
+
+import threading
+import time
+
+from deploy_queue import DeployQueue
+
+class FakeGitHubManager:
+    """Zeichnet Deployments auf - blockiert solange gate nicht gesetzt ist, die ersten fail_first schlagen fehl"""
+    
+    def __init__(self, fail_first=0, blocked=False):
+        self.calls = []
+        self.call_times = []
+        self.fail_first = fail_first
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        if not blocked:
+            self.gate.set()
+    
+    def full_deployment(self, paths=None):
+        self.calls.append(sorted(paths or []))
+        self.call_times.append(time.monotonic())
+        self.started.set()
+        self.gate.wait(5)
+        return len(self.calls) > self.fail_first, 'https://example.github.io/test/'
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'Bedingung nicht rechtzeitig erfüllt'
+        time.sleep(0.005)
+
+def test_submits_while_busy_are_coalesced():
+    manager = FakeGitHubManager(blocked=True)
+    queue = DeployQueue(manager, timeout=5)
+    queue.start()
+    
+    queue.submit(['docs/index.html'])
+    assert manager.started.wait(5)
+    # Während das erste Deployment läuft: drei weitere werden zu einem zusammengefasst
+    queue.submit(['docs/data.json'])
+    queue.submit(['docs/players/a.json', 'docs/data.json'])
+    queue.submit(['docs/players/b.json'])
+    manager.gate.set()
+    
+    assert queue.wait(5)
+    queue.stop(5)
+    assert manager.calls == [['docs/index.html'], ['docs/data.json', 'docs/players/a.json', 'docs/players/b.json']]
+    assert (queue.submitted, queue.coalesced, queue.succeeded, queue.failed) == (4, 2, 2, 0)
+    assert queue.last_url == 'https://example.github.io/test/'
+
+def test_hanging_deploy_counts_as_timeout():
+    manager = FakeGitHubManager(blocked=True)
+    queue = DeployQueue(manager, timeout=0.05, retry_delay=60)
+    queue.start()
+    
+    queue.submit(['docs/index.html'])
+    assert queue.wait(5)
+    
+    assert queue.timeouts == 1 and queue.failed == 1 and queue.succeeded == 0
+    # Pfade warten auf den nächsten Versuch
+    assert list(queue._retry_paths) == ['docs/index.html']
+    
+    manager.gate.set()
+    queue.stop(5)
+    assert 'Timeouts' in queue.summary()
+
+def test_stuck_deploy_does_not_block_the_queue():
+    manager = FakeGitHubManager(blocked=True)
+    queue = DeployQueue(manager, timeout=0.05, retry_delay=60)
+    queue.start()
+    
+    queue.submit(['docs/index.html'])
+    assert queue.wait(5)
+    # Erstes Deployment hängt weiter: das nächste wartet nur begrenzt und wird dann zurückgestellt
+    queue.submit(['docs/data.json'])
+    assert queue.wait(5)
+    
+    assert manager.calls == [['docs/index.html']]
+    assert (queue.timeouts, queue.stuck, queue.failed) == (1, 1, 2)
+    assert sorted(queue._retry_paths) == ['docs/data.json', 'docs/index.html']
+    
+    manager.gate.set()
+    queue.stop(5)
+
+def test_failed_deploy_is_retried_with_growing_delay():
+    manager = FakeGitHubManager(fail_first=3)
+    queue = DeployQueue(manager, timeout=5, retry_delay=0.05, max_retry_delay=1)
+    queue.start()
+    
+    queue.submit(['docs/index.html'])
+    wait_until(lambda: queue.succeeded == 1)
+    queue.stop(5)
+    
+    assert manager.calls == [['docs/index.html']] * 4
+    assert (queue.failed, queue.retries, queue.succeeded) == (3, 3, 1)
+    gaps = [later - earlier for earlier, later in zip(manager.call_times, manager.call_times[1:])]
+    # Backoff 0.05s, 0.1s, 0.2s
+    assert gaps[0] >= 0.05 and gaps[1] >= 0.1 and gaps[2] >= 0.2
+    assert queue._failures_in_row == 0
+
+def test_retry_delay_doubles_up_to_max():
+    queue = DeployQueue(FakeGitHubManager(), retry_delay=10, max_retry_delay=35)
+    with queue._condition:
+        delays = [queue._schedule_retry(['docs/index.html']) for _ in range(4)]
+    
+    assert delays == [10, 20, 35, 35]
+    assert queue.failed == 4
+
+def test_failed_paths_join_a_waiting_deploy():
+    queue = DeployQueue(FakeGitHubManager())
+    queue.submit(['docs/data.json'])
+    with queue._condition:
+        assert queue._schedule_retry(['docs/index.html']) == 0.0
+    
+    assert sorted(queue._pending) == ['docs/data.json', 'docs/index.html']
+    assert queue._retry_paths == {}
+
+def test_stop_finishes_pending_deploy_and_ends_worker():
+    manager = FakeGitHubManager()
+    queue = DeployQueue(manager)
+    queue.start()
+    worker = queue._worker
+    
+    queue.submit(['docs/index.html'])
+    queue.stop(5)
+    
+    assert not worker.is_alive()
+    assert queue._worker is None
+    assert manager.calls == [['docs/index.html']]
+    assert queue.wait(0)
+
+def test_wait_times_out_while_deploy_runs():
+    manager = FakeGitHubManager(blocked=True)
+    queue = DeployQueue(manager, timeout=5)
+    queue.start()
+    queue.submit(['docs/index.html'])
+    
+    assert not queue.wait(0.05)
+    manager.gate.set()
+    assert queue.wait(5)
+    queue.stop(5)
+    assert queue.summary().startswith('1 ok, 0 fehlgeschlagen (0 Timeouts, 0 hängend), 0 Wiederholungen, 0 zusammengefasst')
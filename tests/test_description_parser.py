@@ -0,0 +1,38 @@
+# test_description_parser.py
+# Single-Pass Description Parser gegen den (synthetischen) Benchmark-Korpus
+
+import json
+import os
+
+from description_parser import parse_description
+
+CORPUS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks',
+                           'description_corpus.json')
+
+def test_description_corpus():
+    with open(CORPUS_FILE, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+    
+    for entry in corpus:
+        parsed = parse_description(entry['description'])
+        result = {
+            'tier': parsed.tier,
+            'rank': parsed.rank,
+            'lp': parsed.lp,
+            'wins': parsed.wins,
+            'losses': parsed.losses,
+            'champions': [[c.name, c.wins, c.losses, c.win_rate] for c in parsed.champions]
+        }
+        assert result == entry['expected'], entry['note']
+
+def test_division_and_derived_values():
+    parsed = parse_description('x#EUW / Gold 2 1,234LP / 10Win 5Lose Win rate 67% / Kai’Sa - 6Win 4Lose Win rate 60%')
+    
+    assert (parsed.tier, parsed.rank, parsed.lp) == ('Gold', 'Gold 2', 1234)
+    assert parsed.total_games == 15
+    assert parsed.champions[0].name == "Kai'Sa"
+    assert parsed.champions[0].games == 10
+
+def test_empty_description_is_unranked():
+    parsed = parse_description('')
+    assert (parsed.tier, parsed.rank, parsed.wins, parsed.champions) == ('Unranked', '', 0, [])
@@ -0,0 +1,212 @@
+# test_git_plumbing.py
+# Plumbing-Deployment gegen ein temporäres Repository: eigener Index, Compare-and-Swap, State-Datei, Push nur bei neuem Tree
+# und gh-pages Branch mit begrenzter History
+
+import json
+import subprocess
+
+import pytest
+
+from git_plumbing import PAGES_STATE_FILE, STATE_FILE, PagesDeployer, PlumbingDeployer
+
+from conftest import git
+
+def write(repo, name, content):
+    path = repo / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return name
+
+def tree_files(repo, ref):
+    return git(repo, 'ls-tree', '-r', '--name-only', ref).splitlines()
+
+def test_commits_only_given_paths(git_repo):
+    write(git_repo, 'docs/index.html', '<html>')
+    write(git_repo, 'docs/data.json', '{}')
+    write(git_repo, 'notes.txt', 'nicht deployen')
+    deployer = PlumbingDeployer()
+    
+    first = deployer.commit(['docs/index.html'])
+    assert first.committed and not first.pushed
+    assert tree_files(git_repo, 'main') == ['docs/index.html']
+    
+    second = deployer.commit(['docs/data.json'])
+    assert tree_files(git_repo, 'main') == ['docs/data.json', 'docs/index.html']
+    assert git(git_repo, 'rev-parse', 'main^') == first.commit
+    assert git(git_repo, 'rev-parse', 'main') == second.commit
+
+def test_user_index_and_staged_files_are_untouched(git_repo):
+    write(git_repo, 'staged.txt', 'vom Benutzer gestaged')
+    git(git_repo, 'add', 'staged.txt')
+    write(git_repo, 'docs/index.html', '<html>')
+    
+    PlumbingDeployer().commit(['docs/index.html'])
+    
+    assert 'staged.txt' not in tree_files(git_repo, 'main')
+    # staged.txt bleibt gestaged, das deployte Artefakt erscheint nicht als Änderung
+    assert git(git_repo, 'status', '--porcelain').splitlines() == ['A  staged.txt']
+
+def test_unchanged_tree_makes_no_commit(git_repo):
+    write(git_repo, 'docs/index.html', '<html>')
+    deployer = PlumbingDeployer()
+    first = deployer.commit(['docs/index.html'])
+    
+    again = deployer.commit(['docs/index.html'])
+    assert not again.committed
+    assert again.commit == first.commit
+    assert git(git_repo, 'rev-list', '--count', 'main') == '1'
+
+def test_removed_paths_leave_the_tree(git_repo):
+    paths = [write(git_repo, 'docs/index.html', '<html>'), write(git_repo, 'docs/players/a.json', '{}')]
+    deployer = PlumbingDeployer()
+    deployer.commit(paths)
+    
+    (git_repo / 'docs/players/a.json').unlink()
+    assert deployer.commit(['docs/players/a.json']).committed
+    assert tree_files(git_repo, 'main') == ['docs/index.html']
+
+def test_branch_moved_by_user_is_picked_up(git_repo):
+    write(git_repo, 'docs/index.html', 'v1')
+    deployer = PlumbingDeployer()
+    deployer.commit(['docs/index.html'])
+    
+    write(git_repo, 'README.md', 'readme')
+    git(git_repo, 'add', 'README.md')
+    git(git_repo, 'commit', '--quiet', '-m', 'user commit')
+    user_commit = git(git_repo, 'rev-parse', 'main')
+    
+    write(git_repo, 'docs/index.html', 'v2')
+    result = deployer.commit(['docs/index.html'])
+    assert git(git_repo, 'rev-parse', f'{result.commit}^') == user_commit
+    assert tree_files(git_repo, 'main') == ['README.md', 'docs/index.html']
+
+def test_compare_and_swap_fails_when_branch_moved(git_repo, monkeypatch):
+    write(git_repo, 'docs/index.html', 'v1')
+    deployer = PlumbingDeployer()
+    deployer.commit(['docs/index.html'])
+    state_before = json.loads((git_repo / '.git' / STATE_FILE).read_text())
+    
+    real_git = deployer._git
+    moved = []
+    
+    def racing_git(*args, **kwargs):
+        if args[0] == 'update-ref' and not moved:
+            # Zwischen commit-tree und update-ref committet jemand anderes auf main
+            git(git_repo, 'commit', '--quiet', '--allow-empty', '-m', 'concurrent')
+            moved.append(git(git_repo, 'rev-parse', 'main'))
+        return real_git(*args, **kwargs)
+    
+    monkeypatch.setattr(deployer, '_git', racing_git)
+    write(git_repo, 'docs/index.html', 'v2')
+    
+    with pytest.raises(subprocess.CalledProcessError):
+        deployer.commit(['docs/index.html'])
+    assert git(git_repo, 'rev-parse', 'main') == moved[0]
+    assert json.loads((git_repo / '.git' / STATE_FILE).read_text()) == state_before
+
+def test_deploy_pushes_only_new_trees(git_repo, tmp_path, monkeypatch):
+    write(git_repo, 'docs/index.html', 'v1')
+    deployer = PlumbingDeployer()
+    
+    result = deployer.deploy(['docs/index.html'])
+    assert result.committed and result.pushed
+    assert not deployer.needs_push
+    assert git(tmp_path / 'remote.git', 'rev-parse', 'main') == result.commit
+    
+    state = json.loads((git_repo / '.git' / STATE_FILE).read_text())
+    assert state == {'commit': result.commit, 'tree': result.tree, 'pushed_tree': result.tree}
+    
+    # Neue Instanz (neuer Prozess) liest den State: ohne Änderungen kein einziger git Aufruf
+    restarted = PlumbingDeployer()
+    calls = []
+    monkeypatch.setattr(restarted, '_git', lambda *args, **kwargs: calls.append(args))
+    assert restarted.deploy([]) == (result.commit, result.tree, False, False)
+    assert calls == []
+
+def test_failed_push_is_retried_on_next_deploy(git_repo, tmp_path):
+    write(git_repo, 'docs/index.html', 'v1')
+    git(git_repo, 'remote', 'set-url', 'origin', str(tmp_path / 'missing.git'))
+    deployer = PlumbingDeployer()
+    
+    with pytest.raises(subprocess.CalledProcessError):
+        deployer.deploy(['docs/index.html'])
+    assert deployer.needs_push
+    
+    git(git_repo, 'remote', 'set-url', 'origin', str(tmp_path / 'remote.git'))
+    result = PlumbingDeployer().deploy([])
+    assert not result.committed and result.pushed
+    assert git(tmp_path / 'remote.git', 'rev-parse', 'main') == git(git_repo, 'rev-parse', 'main')
+
+# ---------- gh-pages ----------
+
+def publish(repo, deployer, version):
+    # Wie der Generator: geänderte Pfade melden (PagesDeployer baut den Tree trotzdem aus ganz docs/)
+    path = write(repo, 'docs/index.html', f'<html>{version}</html>')
+    return deployer.deploy([path], message=f'Deploy {version}')
+
+def test_first_publish_creates_root_commit_with_site_only(git_repo, tmp_path):
+    write(git_repo, 'README.md', 'readme')
+    git(git_repo, 'add', 'README.md')
+    git(git_repo, 'commit', '--quiet', '-m', 'init')
+    main_before = git(git_repo, 'rev-parse', 'main')
+    write(git_repo, 'docs/data.json', '{}')
+    
+    result = publish(git_repo, PagesDeployer(), 1)
+    
+    assert result.committed and result.pushed
+    assert tree_files(git_repo, 'gh-pages') == ['.nojekyll', 'data.json', 'index.html']
+    assert git(git_repo, 'rev-list', '--count', 'gh-pages') == '1'
+    assert git(git_repo, 'show', 'gh-pages:.nojekyll') == ''
+    assert git(tmp_path / 'remote.git', 'rev-parse', 'gh-pages') == result.commit
+    # Arbeits-Branch und Index des Benutzers bleiben unberührt
+    assert git(git_repo, 'rev-parse', 'main') == main_before
+    assert git(git_repo, 'symbolic-ref', '--short', 'HEAD') == 'main'
+    assert git(git_repo, 'status', '--porcelain').splitlines() == ['?? docs/']
+    assert (git_repo / '.git' / PAGES_STATE_FILE).exists()
+
+def test_history_is_trimmed_to_keep_last(git_repo, tmp_path):
+    deployer = PagesDeployer(keep_last=3)
+    for version in range(1, 6):
+        result = publish(git_repo, deployer, version)
+    
+    assert git(git_repo, 'rev-list', '--count', 'gh-pages') == '3'
+    assert git(git_repo, 'log', '--format=%s', 'gh-pages').splitlines() == ['Deploy 5', 'Deploy 4', 'Deploy 3']
+    assert [git(git_repo, 'show', f'gh-pages~{n}:index.html') for n in range(3)] == [
+        '<html>5</html>', '<html>4</html>', '<html>3</html>']
+    # Umgeschriebene History landet per Force-Push auf dem Remote
+    assert git(tmp_path / 'remote.git', 'rev-parse', 'gh-pages') == result.commit
+
+def test_keep_last_one_squashes_every_deploy(git_repo):
+    deployer = PagesDeployer(keep_last=1)
+    for version in range(1, 4):
+        publish(git_repo, deployer, version)
+    
+    assert git(git_repo, 'rev-list', '--count', 'gh-pages') == '1'
+    assert git(git_repo, 'show', 'gh-pages:index.html') == '<html>3</html>'
+
+def test_excluded_files_stay_out_of_the_tree(git_repo):
+    write(git_repo, 'docs/.content-digest.json', '{}')
+    write(git_repo, 'docs/.data.json.abc123.tmp', 'halb geschrieben')
+    write(git_repo, 'docs/players/.content-digest.json', '{}')
+    write(git_repo, 'docs/players/.a.json.abc123.tmp', 'halb geschrieben')
+    write(git_repo, 'docs/players/a.json', '{}')
+    
+    publish(git_repo, PagesDeployer(), 1)
+    
+    assert tree_files(git_repo, 'gh-pages') == ['.nojekyll', 'index.html', 'players/a.json']
+
+def test_unchanged_site_makes_no_commit(git_repo, monkeypatch):
+    deployer = PagesDeployer()
+    first = publish(git_repo, deployer, 1)
+    
+    again = deployer.commit([])
+    assert not again.committed
+    assert again.commit == first.commit
+    assert git(git_repo, 'rev-list', '--count', 'gh-pages') == '1'
+    
+    # Alles gepusht und kein geänderter Pfad gemeldet: kein git Aufruf
+    calls = []
+    monkeypatch.setattr(deployer, '_git', lambda *args, **kwargs: calls.append(args))
+    assert not deployer.deploy([]).pushed
+    assert calls == []
+
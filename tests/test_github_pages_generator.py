@@ -0,0 +1,204 @@
+# test_github_pages_generator.py
+# Generator: Schreiben nur geänderter Artefakte, Digest-Skip, Aufräumen veralteter Dateien und Client Rendering
+
+import json
+import os
+import time
+
+from content_digest import DIGEST_FILE
+from data_export import load_team_data
+from github_pages_generator import GitHubPagesGenerator
+from lol_scraper import LoLScraper
+
+from conftest import make_player, make_team
+
+def test_stale_player_files_are_removed(tmp_path):
+    output_dir = str(tmp_path)
+    generator = GitHubPagesGenerator(split_players=True)
+    generator.generate_page(make_team(make_player('a#EUW'), make_player('b#EUW', lane='MID')), output_dir)
+    players_before = set(os.listdir(os.path.join(output_dir, 'players')))
+    assert len(players_before) == 2
+    
+    generator.generate_page(make_team(make_player('a#EUW')), output_dir)
+    players_after = set(os.listdir(os.path.join(output_dir, 'players')))
+    removed = players_before - players_after
+    
+    assert len(players_after) == 1 and len(removed) == 1
+    assert f"players/{removed.pop()}" in generator.changed_artifacts
+
+def test_stale_assets_from_last_run_are_removed(tmp_path):
+    output_dir = str(tmp_path)
+    assets_dir = tmp_path / 'assets'
+    assets_dir.mkdir()
+    for name in ('champion-icons.0123456789.png', 'icon-Ahri.0123456789.png', 'logo.png'):
+        (assets_dir / name).write_bytes(b'old')
+    # Letzter Lauf hat die beiden Icons erzeugt, logo.png hat jemand von Hand abgelegt
+    (tmp_path / DIGEST_FILE).write_text(json.dumps({'digest': '', 'artifacts': {
+        'assets/champion-icons.0123456789.png': '', 'assets/icon-Ahri.0123456789.png': '', '../outside.txt': ''
+    }}))
+    (tmp_path.parent / 'outside.txt').write_text('keep')
+    
+    generator = GitHubPagesGenerator()
+    generator.generate_page(make_team(make_player('a#EUW')), output_dir)
+    
+    assert os.listdir(assets_dir) == ['logo.png']
+    assert 'assets/champion-icons.0123456789.png' in generator.changed_artifacts
+    assert 'assets/icon-Ahri.0123456789.png' in generator.changed_artifacts
+    assert (tmp_path.parent / 'outside.txt').exists()
+
+def test_unknown_files_are_kept(tmp_path):
+    output_dir = str(tmp_path)
+    (tmp_path / 'players').mkdir()
+    (tmp_path / 'players' / 'notes.txt').write_text('von Hand')
+    
+    generator = GitHubPagesGenerator(split_players=True)
+    generator.generate_page(make_team(make_player('a#EUW')), output_dir)
+    generator.generate_page(make_team(make_player('b#EUW')), output_dir)
+    
+    assert 'notes.txt' in os.listdir(tmp_path / 'players')
+    assert 'players/notes.txt' not in generator.changed_artifacts
+
+def test_unchanged_data_skips_rendering(tmp_path):
+    output_dir = str(tmp_path)
+    generator = GitHubPagesGenerator()
+    generator.generate_page(make_team(make_player('a#EUW'), make_player('b#EUW', lane='MID')), output_dir)
+    assert 'index.html' in generator.changed_artifacts
+    assert os.path.join(output_dir, 'data.json') in generator.changed_paths
+    # Manifest ist lokaler State (.gitignore) und wird nicht deployt
+    assert os.path.join(output_dir, DIGEST_FILE) not in generator.changed_paths
+    
+    # Nur der Team-Zeitstempel ist neu: Digest gleich, nichts wird geschrieben
+    generator.generate_page(make_team(make_player('a#EUW'), make_player('b#EUW', lane='MID'),
+                                      last_updated='2025-01-01 13:00:00'), output_dir)
+    assert generator.changed_artifacts == []
+    assert generator.changed_paths == []
+    assert generator.write_stats == {}
+
+def test_changed_data_rerenders(tmp_path):
+    output_dir = str(tmp_path)
+    generator = GitHubPagesGenerator()
+    generator.generate_page(make_team(make_player('a#EUW')), output_dir)
+    
+    generator.generate_page(make_team(make_player('a#EUW', wins=11)), output_dir)
+    assert 'data.json' in generator.changed_artifacts
+
+def test_missing_output_is_regenerated(tmp_path):
+    output_dir = str(tmp_path)
+    generator = GitHubPagesGenerator()
+    team = make_team(make_player('a#EUW'))
+    generator.generate_page(team, output_dir)
+    
+    os.remove(os.path.join(output_dir, 'index.html'))
+    generator.generate_page(team, output_dir)
+    assert generator.changed_artifacts == ['index.html']
+
+def test_player_timestamps_rewrite_only_data(tmp_path):
+    output_dir = str(tmp_path)
+    generator = GitHubPagesGenerator(split_players=True, precompress=True, track_freshness=True)
+    generator.generate_page(make_team(make_player('a#EUW')), output_dir)
+    manifest_before = json.loads((tmp_path / DIGEST_FILE).read_text())
+    
+    generator.generate_page(make_team(make_player('a#EUW', last_updated='2025-01-02 12:00:00')), output_dir)
+    
+    assert 'index.html' not in generator.changed_artifacts
+    assert 'data.json' in generator.changed_artifacts
+    manifest_after = json.loads((tmp_path / DIGEST_FILE).read_text())
+    assert manifest_after['artifacts']['index.html'] == manifest_before['artifacts']['index.html']
+    assert set(manifest_after['artifacts']) == set(manifest_before['artifacts'])
+    assert any(name.startswith('players/') for name in generator.changed_artifacts)
+    assert os.path.exists(tmp_path / 'index.html.gz')
+
+def test_player_timestamps_alone_are_no_change_without_freshness_tracking(tmp_path):
+    output_dir = str(tmp_path)
+    generator = GitHubPagesGenerator()
+    generator.generate_page(make_team(make_player('a#EUW')), output_dir)
+    data_before = (tmp_path / 'data.json').read_bytes()
+    
+    # Ohne Incremental Mode hat jeder Lauf neue Zeitstempel - das allein wird nicht geschrieben oder deployt
+    generator.generate_page(make_team(make_player('a#EUW', last_updated='2025-01-02 12:00:00')), output_dir)
+    
+    assert generator.changed_artifacts == []
+    assert generator.changed_paths == []
+    assert (tmp_path / 'data.json').read_bytes() == data_before
+
+def test_incremental_scrape_sees_fresh_timestamps(tmp_path):
+    """Zwei Zyklen Scrapen + Generieren ohne neue Daten: der zweite Zyklus scraped niemanden mehr"""
+    output_dir = str(tmp_path)
+    data_file = os.path.join(output_dir, 'data.json')
+    generator = GitHubPagesGenerator(track_freshness=True)
+    generator.generate_page(make_team(make_player('a#EUW', last_updated='2020-01-01 00:00:00')), output_dir)
+    
+    scraper = LoLScraper()
+    fetched = []
+    
+    def fake_stats(riot_id, region='euw'):
+        fetched.append(riot_id)
+        return make_player(riot_id, last_updated=time.strftime('%Y-%m-%d %H:%M:%S'))
+    
+    scraper.get_player_stats = fake_stats
+    team_config = {'team_name': 'Test Team', 'players': {'a#EUW': {'lane': 'TOP'}}}
+    
+    for _ in range(2):
+        previous = scraper.load_previous_team_data(data_file)
+        team_data = scraper.scrape_team(team_config, previous_players=previous, max_age_minutes=30)
+        generator.generate_page(team_data, output_dir)
+    
+    assert fetched == ['a#EUW']
+    assert load_team_data(data_file)['players']['a#EUW']['last_updated'] != '2020-01-01 00:00:00'
+
+def test_client_render_shell_has_no_player_markup(tmp_path):
+    generator = GitHubPagesGenerator(client_render=True)
+    generator.generate_page(make_team(make_player('Faker#KR1'), make_player('b#EUW', lane='MID')), str(tmp_path))
+    
+    shell = (tmp_path / 'index.html').read_text(encoding='utf-8')
+    assert 'Faker' not in shell
+    assert '<div class="players-grid" id="players-grid"></div>' in shell
+    data = json.loads((tmp_path / 'data.json').read_text(encoding='utf-8'))
+    assert 'Faker#KR1' in data['players']
+    assert 'Ahri' in data['champion_icons']
+
+def test_client_render_leaderboards_match_server_render(tmp_path):
+    team = make_team(make_player('a#EUW', wins=12), make_player('b#EUW', tier='Platinum', lane='MID'),
+                     make_player('c#EUW', tier='Silver', wins=3, lane='ADC'))
+    GitHubPagesGenerator(client_render=True).generate_page(team, str(tmp_path / 'client'))
+    GitHubPagesGenerator().generate_page(team, str(tmp_path / 'server'))
+    
+    leaderboards = json.loads((tmp_path / 'client' / 'data.json').read_text(encoding='utf-8'))['leaderboards']
+    server_html = (tmp_path / 'server' / 'index.html').read_text(encoding='utf-8')
+    assert [entry['riot_id'] for entry in leaderboards['rank_value']] == ['b#EUW', 'a#EUW', 'c#EUW']
+    for metric, entries in leaderboards.items():
+        for entry in entries:
+            assert f'<span class="rank-value">{entry["text"]}</span>' in server_html, metric
+
+def test_client_render_overview_and_champion_ratings_match_server_render(tmp_path):
+    team = make_team(make_player('a#EUW', wins=12), make_player('b#EUW', tier='Platinum', lane='MID'),
+                     make_player('c#EUW', tier='Silver', wins=3, lane='ADC'))
+    GitHubPagesGenerator(client_render=True).generate_page(team, str(tmp_path / 'client'))
+    GitHubPagesGenerator().generate_page(team, str(tmp_path / 'server'))
+    
+    data = json.loads((tmp_path / 'client' / 'data.json').read_text(encoding='utf-8'))
+    server_html = (tmp_path / 'server' / 'index.html').read_text(encoding='utf-8')
+    overview = data['overview']
+    assert (overview['total_games'], overview['total_wins'], overview['team_size']) == (49, 25, 3)
+    assert (overview['highest_rank'], overview['highest_name']) == ('Platinum', 'b')
+    assert f'<div class="kpi-value">{overview["avg_win_rate"]}%</div>' in server_html
+    assert f'<span class="kpi-trend {overview["trend_class"]}">{overview["trend_icon"]}</span>' in server_html
+    assert f'<div class="kpi-value">{overview["performance_rating"]}/100</div>' in server_html
+    assert f'<div class="kpi-value">{overview["avg_kda"]}</div>' in server_html
+    assert f'<span class="stat-value">{overview["avg_gold"]:,}</span>' in server_html
+    assert f'<span class="stat-value">{overview["avg_kill_participation"]}%</span>' in server_html
+    
+    for player in data['players'].values():
+        for champ in player['enhanced_champions']:
+            assert f'<div class="champion-winrate {champ["wr_class"]}">' in server_html
+            assert f'<span class="stat-value {champ["kda_class"]}">{champ["avg_kda"]}</span>' in server_html
+            assert champ['analysis'] in server_html
+
+def test_client_render_data_change_rewrites_only_data(tmp_path):
+    output_dir = str(tmp_path)
+    generator = GitHubPagesGenerator(client_render=True)
+    generator.generate_page(make_team(make_player('a#EUW')), output_dir)
+    assert 'index.html' in generator.changed_artifacts
+    
+    generator.generate_page(make_team(make_player('a#EUW', wins=11)), output_dir)
+    assert generator.changed_artifacts == ['data.json']
@@ -0,0 +1,60 @@
+# test_icon_cache.py
+# Lokale Champion-Icons: Data URIs, einzelne Dateien, Sprite Sheet und Warnung ohne Pillow
+
+import logging
+
+import pytest
+
+import icon_cache
+from icon_cache import IconCache
+
+BASE_URL = 'https://ddragon.leagueoflegends.com/cdn/14.1.1/img/champion/'
+NAMES = ['Ahri', 'LeeSin', 'Jinx', 'Thresh']
+
+def make_cache(tmp_path, names=NAMES, **kwargs):
+    """Offline-Cache mit vorab abgelegten Icons (<Name>.png direkt im cache_dir)"""
+    for name in names:
+        (tmp_path / f'{name}.png').write_bytes(f'png-{name}'.encode())
+    return IconCache(cache_dir=str(tmp_path), offline=True, **kwargs)
+
+def make_html(names=NAMES):
+    return ''.join(f'<img src="{BASE_URL}{name}.png">' for name in names)
+
+def test_few_icons_become_data_uris(tmp_path):
+    html, assets = make_cache(tmp_path).rewrite_html(make_html())
+    
+    assert assets == {}
+    assert BASE_URL not in html
+    assert html.count('src="data:image/png;base64,') == len(NAMES)
+
+def test_missing_icons_keep_remote_url(tmp_path):
+    html, _ = make_cache(tmp_path, names=['Ahri']).rewrite_html(make_html(['Ahri', 'Zed']))
+    
+    assert f'{BASE_URL}Zed.png' in html
+    assert f'{BASE_URL}Ahri.png' not in html
+
+def test_many_icons_without_pillow_warn_once(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(icon_cache, 'Image', None)
+    cache = make_cache(tmp_path, inline_limit=2)
+    
+    with caplog.at_level(logging.WARNING, logger='icon_cache'):
+        html, assets = cache.rewrite_html(make_html())
+        cache.rewrite_html(make_html())
+    
+    assert sorted(name.split('.')[0] for name in assets) == sorted(f'assets/icon-{name}' for name in NAMES)
+    assert all(f'src="{name}"' in html for name in assets)
+    assert len([record for record in caplog.records if 'Pillow' in record.message]) == 1
+
+def test_many_icons_with_pillow_use_sprite(tmp_path):
+    Image = pytest.importorskip('PIL.Image')
+    from io import BytesIO
+    for index, name in enumerate(NAMES):
+        output = BytesIO()
+        Image.new('RGBA', (120, 120), (index * 60, 0, 0, 255)).save(output, format='PNG')
+        (tmp_path / f'{name}.png').write_bytes(output.getvalue())
+    cache = IconCache(cache_dir=str(tmp_path), offline=True, inline_limit=2)
+    
+    html, assets = cache.rewrite_html(make_html())
+    
+    assert list(assets)[0].startswith('assets/champion-icons.')
+    assert html.count(f'url({list(assets)[0]})') == len(NAMES)
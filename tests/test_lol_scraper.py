@@ -0,0 +1,163 @@
+# test_lol_scraper.py
+# Scraper ohne Netzwerk: Incremental Mode, Fallback auf alte Daten und parallele Worker
+
+import threading
+import time
+
+from lol_scraper import LoLScraper
+
+def fresh_timestamp(minutes_ago=0):
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(time.time() - minutes_ago * 60))
+
+def make_scraper(stats=None, **kwargs):
+    """Scraper, dessen get_player_stats aufgezeichnet und durch stats(riot_id) ersetzt wird"""
+    scraper = LoLScraper(**kwargs)
+    scraper.fetched = []
+    
+    def get_player_stats(riot_id, region='euw'):
+        scraper.fetched.append(riot_id)
+        return stats(riot_id) if stats else {'riot_id': riot_id, 'tier': 'Gold', 'last_updated': fresh_timestamp()}
+    
+    scraper.get_player_stats = get_player_stats
+    return scraper
+
+TEAM_CONFIG = {'team_name': 'Test', 'players': {'a#EUW': {'lane': 'TOP'}, 'b#EUW': {'lane': 'MID'}}}
+
+def test_incremental_reuses_fresh_players():
+    scraper = make_scraper()
+    previous = {
+        'a#EUW': {'riot_id': 'a#EUW', 'tier': 'Silver', 'last_updated': fresh_timestamp(5)},
+        'b#EUW': {'riot_id': 'b#EUW', 'tier': 'Silver', 'last_updated': fresh_timestamp(60)},
+    }
+    
+    team_data = scraper.scrape_team(TEAM_CONFIG, previous_players=previous, max_age_minutes=30)
+    
+    assert scraper.fetched == ['b#EUW']
+    assert team_data['players']['a#EUW']['tier'] == 'Silver'
+    assert team_data['players']['b#EUW']['tier'] == 'Gold'
+    assert (team_data['refreshed_count'], team_data['reused_count'], team_data['success_count']) == (1, 1, 2)
+
+def test_per_player_max_age_overrides_default():
+    scraper = make_scraper()
+    config = {'team_name': 'Test', 'players': {'a#EUW': {'lane': 'TOP', 'max_age_minutes': 1}}}
+    previous = {'a#EUW': {'riot_id': 'a#EUW', 'last_updated': fresh_timestamp(5)}}
+    
+    scraper.scrape_team(config, previous_players=previous, max_age_minutes=30)
+    assert scraper.fetched == ['a#EUW']
+
+def test_without_max_age_everyone_is_scraped():
+    scraper = make_scraper()
+    previous = {'a#EUW': {'riot_id': 'a#EUW', 'last_updated': fresh_timestamp()}}
+    
+    scraper.scrape_team(TEAM_CONFIG, previous_players=previous)
+    assert sorted(scraper.fetched) == ['a#EUW', 'b#EUW']
+
+def test_failed_players_fall_back_to_previous_data():
+    scraper = make_scraper(stats=lambda riot_id: None)
+    previous = {'a#EUW': {'riot_id': 'a#EUW', 'tier': 'Gold', 'last_updated': '2025-01-01 00:00:00'}}
+    
+    team_data = scraper.scrape_team(TEAM_CONFIG, previous_players=previous)
+    
+    assert list(team_data['players']) == ['a#EUW']
+    assert team_data['players']['a#EUW']['tier'] == 'Gold'
+    assert team_data['fallback_count'] == 1
+    assert team_data['success_count'] == 0
+
+def test_load_previous_team_data_keeps_scraped_fields(tmp_path):
+    data_file = tmp_path / 'data.json'
+    data_file.write_text('{"players": {"a#EUW": {"riot_id": "a#EUW", "tier": "Gold", "avg_gold": 12000, '
+                         '"last_updated": "2025-01-01 00:00:00"}, "b#EUW": {"tier": "Gold"}}}')
+    
+    previous = LoLScraper().load_previous_team_data(str(data_file))
+    
+    assert previous == {'a#EUW': {'riot_id': 'a#EUW', 'tier': 'Gold', 'last_updated': '2025-01-01 00:00:00'}}
+    assert LoLScraper().load_previous_team_data(str(tmp_path / 'missing.json')) == {}
+
+class ChunkedResponse:
+    """Response-Ersatz für _read_head: zählt, wie viele Chunks gelesen wurden"""
+    
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.read = 0
+    
+    def iter_content(self, chunk_size=None):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+def test_read_head_stops_after_description():
+    head = '<html><head><meta name="description" content="Faker#KR1 / Challenger 1,234LP"></head>'.encode('utf-8')
+    response = ChunkedResponse([head[:30], head[30:], b'<body>' + b'x' * 1000, b'y' * 1000])
+    
+    body = LoLScraper()._read_head(response)
+    
+    assert response.read == 2
+    assert body == head.decode('utf-8')
+
+def test_read_head_decodes_split_utf8():
+    text = '<head><meta name="description" content="Artelî#EUW"></head>'
+    data = text.encode('utf-8')
+    split = data.index('î'.encode('utf-8')) + 1
+    
+    assert LoLScraper()._read_head(ChunkedResponse([data[:split], data[split:]])) == text
+
+def test_parallel_workers_scrape_concurrently_and_keep_config_order():
+    team_config = {'team_name': 'Test', 'players': {f'p{i}#EUW': {'lane': 'TOP'} for i in range(3)}}
+    # Alle drei Worker müssen gleichzeitig laufen, sonst läuft die Barrier in den Timeout
+    barrier = threading.Barrier(3, timeout=5)
+    
+    def stats(riot_id):
+        barrier.wait()
+        if riot_id == 'p1#EUW':
+            raise RuntimeError('op.gg down')
+        return {'riot_id': riot_id, 'tier': 'Gold'}
+    
+    scraper = make_scraper(stats, max_workers=3)
+    team_data = scraper.scrape_team(team_config)
+    
+    assert sorted(scraper.fetched) == ['p0#EUW', 'p1#EUW', 'p2#EUW']
+    assert list(team_data['players']) == ['p0#EUW', 'p2#EUW']
+    assert (team_data['success_count'], team_data['refreshed_count'], team_data['total_players']) == (2, 2, 3)
+
+def test_each_worker_thread_gets_its_own_session():
+    team_config = {'team_name': 'Test', 'players': {f'p{i}#EUW': {'lane': 'TOP'} for i in range(3)}}
+    barrier = threading.Barrier(3, timeout=5)
+    sessions = {}
+    
+    def stats(riot_id):
+        barrier.wait()
+        sessions[riot_id] = scraper.session
+        assert scraper.session is sessions[riot_id]
+        return {'riot_id': riot_id, 'tier': 'Gold'}
+    
+    scraper = make_scraper(stats, max_workers=3)
+    scraper.scrape_team(team_config)
+    
+    assert len({id(session) for session in sessions.values()}) == 3
+    assert scraper.session not in sessions.values()
+    assert all(session.verify is False and 'User-Agent' in session.headers for session in sessions.values())
+    
+    scraper.close()
+    assert scraper._sessions == []
+
+def test_sessions_are_reused_across_scrape_runs():
+    team_config = {'team_name': 'Test', 'players': {f'p{i}#EUW': {'lane': 'TOP'} for i in range(2)}}
+    barrier = threading.Barrier(2, timeout=5)
+    used = []
+    
+    def stats(riot_id):
+        barrier.wait()
+        used.append(scraper.session)
+        return {'riot_id': riot_id, 'tier': 'Gold'}
+    
+    scraper = make_scraper(stats, max_workers=2)
+    for _ in range(5):
+        scraper.scrape_team(team_config)
+    
+    # Ein Worker-Pool für die ganze Lebensdauer: nie mehr Sessions als Worker
+    assert len(scraper._sessions) == 2
+    assert {id(session) for session in used} == {id(session) for session in scraper._sessions}
+    
+    scraper.close()
+    assert scraper._executor is None and scraper._sessions == []
+
@@ -0,0 +1,76 @@
+# test_main.py
+# Einmal-Lauf und Batch Mode: ohne Änderungen und ohne ausstehenden Push wird gar nicht deployt
+
+import json
+
+import pytest
+
+import main
+
+from conftest import make_player, make_team
+
+class FakeScraper:
+    def load_previous_team_data(self, data_file):
+        return {}
+    
+    def scrape_team(self, team_config, previous_players=None, max_age_minutes=None):
+        return make_team(make_player('a#EUW'))
+    
+    def scrape_teams(self, team_configs, previous_players=None, max_age_minutes=None):
+        return [make_team(make_player('a#EUW')) for _ in team_configs]
+    
+    def close(self):
+        pass
+
+class FakeGenerator:
+    def __init__(self, changed):
+        self.changed_artifacts = ['data.json'] if changed else []
+        self.changed_paths = ['docs/data.json'] if changed else []
+        self.write_stats = {name: 1 for name in self.changed_artifacts}
+    
+    def generate_page(self, team_data, output_dir='docs', force=False):
+        return f'{output_dir}/index.html'
+
+class FakeGitHubManager:
+    def __init__(self, pending):
+        self.pending = pending
+        self.deployments = []
+    
+    def has_pending_push(self):
+        return self.pending
+    
+    def full_deployment(self, paths=None):
+        self.deployments.append(paths)
+        return True, 'https://example.github.io/test/'
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    """Führt main() bzw. run_batch() mit Fakes aus und liefert die Deployments"""
+    # main() wechselt ins Skript-Verzeichnis - monkeypatch stellt das Arbeitsverzeichnis danach wieder her
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, 'validate_config', lambda require_players=True: True)
+    monkeypatch.setattr(main, 'load_github_token', lambda: 'token')
+    monkeypatch.setattr(main, 'create_scraper', FakeScraper)
+    team_file = tmp_path / 'team.json'
+    team_file.write_text(json.dumps({'team_name': 'Test', 'players': {'a#EUW': {'lane': 'TOP'}}}))
+    
+    def run_mode(mode, changed, pending):
+        manager = FakeGitHubManager(pending)
+        monkeypatch.setattr(main, 'create_generator', lambda track_freshness=False: FakeGenerator(changed))
+        monkeypatch.setattr(main, 'create_github_manager', lambda token: manager)
+        assert (main.main() if mode == 'single' else main.run_batch([str(team_file)]))
+        return manager.deployments
+    
+    return run_mode
+
+@pytest.mark.parametrize('mode', ['single', 'batch'])
+def test_unchanged_run_skips_deployment(run, mode):
+    assert run(mode, changed=False, pending=False) == []
+
+@pytest.mark.parametrize('mode', ['single', 'batch'])
+def test_unchanged_run_pushes_pending_commits(run, mode):
+    assert run(mode, changed=False, pending=True) == [[]]
+
+@pytest.mark.parametrize('mode', ['single', 'batch'])
+def test_changed_run_deploys(run, mode):
+    assert run(mode, changed=True, pending=False) == [['docs/data.json']]
@@ -0,0 +1,49 @@
+# test_meta_parser.py
+# Meta-Description ohne DOM: Tag-Priorität, Chunk-Grenzen und BeautifulSoup-Fallback im Scraper
+
+from lol_scraper import LoLScraper
+from meta_parser import extract_meta_description
+
+DESCRIPTION = 'cl1ck9r#EUWES / Master 1 47LP / 59Win 43Lose Win rate 58% / Viego - 24Win 14Lose Win rate 63%'
+
+def test_meta_description_priority():
+    html = ('<html><head><meta property="og:description" content="og">'
+            '<meta name="twitter:description" content="twitter">'
+            '<meta name="description" content="main"></head><body>')
+    assert extract_meta_description(html) == 'main'
+
+def test_meta_description_falls_back_to_twitter_and_og():
+    assert extract_meta_description('<head><meta property="og:description" content="og">'
+                                    '<meta name="twitter:description" content="twitter"></head>') == 'twitter'
+    assert extract_meta_description('<head><meta property="og:description" content="og"></head>') == 'og'
+    assert extract_meta_description('<head><title>op.gg</title></head><body>') is None
+
+def test_meta_description_split_across_chunks():
+    html = f'<html><head><meta name="description" content="{DESCRIPTION}"></head>'
+    assert extract_meta_description(html, chunk_size=7) == DESCRIPTION
+
+def test_extract_player_data_fast_path():
+    html = f'<html><head><meta name="description" content="{DESCRIPTION}"></head><body></body></html>'
+    scraper = LoLScraper()
+    
+    def no_soup(html):
+        raise AssertionError('BeautifulSoup darf im Fast Path nicht laufen')
+    
+    scraper._find_description_with_soup = no_soup
+    data = scraper._extract_player_data(html, 'cl1ck9r#EUWES')
+    
+    assert (data['tier'], data['rank'], data['lp']) == ('Master', 'Master', 47)
+    assert (data['wins'], data['losses'], data['win_rate']) == (59, 43, 58)
+    assert data['main_champions'][0] == {'name': 'Viego', 'wins': 24, 'losses': 14, 'games': 38, 'win_rate': 63}
+
+def test_extract_player_data_falls_back_to_soup():
+    # Meta-Tag erst im <body>: der Head-Parser gibt auf, BeautifulSoup findet ihn trotzdem
+    html = f'<html><head><title>op.gg</title></head><body><meta name="description" content="{DESCRIPTION}"></body>'
+    assert extract_meta_description(html) is None
+    
+    data = LoLScraper()._extract_player_data(html, 'cl1ck9r#EUWES')
+    assert (data['tier'], data['lp'], data['wins']) == ('Master', 47, 59)
+
+def test_extract_player_data_without_description():
+    data = LoLScraper()._extract_player_data('<html><head></head><body></body></html>', 'x#EUW')
+    assert (data['tier'], data['wins'], data['main_champions']) == ('Unranked', 0, [])
@@ -0,0 +1,75 @@
+# test_output_writer.py
+# Atomares Schreiben: Temp-Datei + Rename, Skip bei identischem Inhalt, Dateirechte und Ergebnis-Zähler
+
+import os
+import stat
+
+import pytest
+
+import output_writer
+from output_writer import OutputWriter
+
+def test_writes_new_file_and_subdirectories(tmp_path):
+    writer = OutputWriter(str(tmp_path))
+    result = writer.write('players/a.json', 'äöü')
+    
+    assert (tmp_path / 'players' / 'a.json').read_text(encoding='utf-8') == 'äöü'
+    assert result == ('players/a.json', len('äöü'.encode('utf-8')), False)
+    assert stat.S_IMODE(os.stat(tmp_path / 'players' / 'a.json').st_mode) == 0o644
+
+def test_identical_content_is_skipped(tmp_path):
+    (tmp_path / 'index.html').write_bytes(b'<html></html>')
+    mtime = os.stat(tmp_path / 'index.html').st_mtime_ns
+    writer = OutputWriter(str(tmp_path))
+    
+    result = writer.write('index.html', b'<html></html>')
+    
+    assert result.skipped and result.bytes_written == 0
+    assert os.stat(tmp_path / 'index.html').st_mtime_ns == mtime
+
+def test_changed_and_bytes_written(tmp_path):
+    writer = OutputWriter(str(tmp_path), fsync=False)
+    writer.write('a.txt', 'a')
+    writer.write('b.txt', 'bb')
+    writer.write('a.txt', 'a')
+    
+    assert writer.changed == ['a.txt', 'b.txt']
+    assert writer.bytes_written == {'a.txt': 0, 'b.txt': 2}
+
+def test_replace_goes_through_temp_file_and_keeps_mode(tmp_path, monkeypatch):
+    target = tmp_path / 'data.json'
+    target.write_text('old')
+    os.chmod(target, 0o640)
+    replaced = []
+    real_replace = os.replace
+    
+    def replace(src, dst):
+        # Während des Renames liegt der neue Inhalt vollständig in einer Temp-Datei daneben
+        replaced.append((os.path.basename(src), open(src).read(), open(dst).read()))
+        real_replace(src, dst)
+    
+    monkeypatch.setattr(output_writer.os, 'replace', replace)
+    OutputWriter(str(tmp_path)).write('data.json', 'new')
+    
+    [(tmp_name, tmp_content, old_content)] = replaced
+    assert tmp_name.startswith('.data.json.') and tmp_name.endswith('.tmp')
+    assert (tmp_content, old_content) == ('new', 'old')
+    assert target.read_text() == 'new'
+    assert stat.S_IMODE(os.stat(target).st_mode) == 0o640
+    assert os.listdir(tmp_path) == ['data.json']
+
+def test_failed_write_keeps_old_file_and_removes_temp(tmp_path, monkeypatch):
+    target = tmp_path / 'data.json'
+    target.write_text('old')
+    
+    def replace(src, dst):
+        raise OSError('disk full')
+    
+    monkeypatch.setattr(output_writer.os, 'replace', replace)
+    writer = OutputWriter(str(tmp_path))
+    with pytest.raises(OSError):
+        writer.write('data.json', 'new')
+    
+    assert target.read_text() == 'old'
+    assert os.listdir(tmp_path) == ['data.json']
+    assert writer.changed == []
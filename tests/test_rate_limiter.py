@@ -0,0 +1,77 @@
+# test_rate_limiter.py
+# Token-Bucket pro Host und Retry-After Behandlung (Zeit per monkeypatch, kein echtes Warten)
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+import rate_limiter
+from rate_limiter import RateLimiter
+
+class FakeClock:
+    """Ersetzt time.monotonic/time.sleep - sleep springt nur die Uhr vor"""
+    
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+    
+    def monotonic(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(rate_limiter.time, 'sleep', clock.sleep)
+    return clock
+
+URL = 'https://www.op.gg/summoners/euw/a-EUW'
+
+def test_burst_then_rate(clock):
+    limiter = RateLimiter(requests_per_second=2.0, burst=2)
+    
+    for _ in range(3):
+        limiter.acquire(URL)
+    
+    # Zwei Tokens sofort, das dritte nach 1/rate Sekunden
+    assert clock.sleeps == [0.5]
+
+def test_hosts_have_separate_buckets(clock):
+    limiter = RateLimiter(requests_per_second=1.0, burst=1)
+    
+    limiter.acquire(URL)
+    limiter.acquire('https://other.example/x')
+    
+    assert clock.sleeps == []
+
+def test_retry_after_blocks_host(clock):
+    limiter = RateLimiter(requests_per_second=10.0, burst=5)
+    
+    assert limiter.update_from_response(URL, 200, {}) == 0.0
+    assert limiter.update_from_response(URL, 429, {'Retry-After': '7'}) == 7.0
+    limiter.acquire(URL)
+    
+    # Erst die Sperre absitzen, vorher gibt es kein Token
+    assert clock.sleeps == [7.0]
+
+def test_retry_after_default_and_cap(clock):
+    limiter = RateLimiter(default_retry_after=5.0, max_retry_after=60.0)
+    
+    assert limiter.update_from_response(URL, 503) == 5.0
+    assert limiter.update_from_response(URL, 429, {'Retry-After': '3600'}) == 60.0
+
+def test_parse_retry_after():
+    assert RateLimiter.parse_retry_after('120') == 120.0
+    assert RateLimiter.parse_retry_after(None) is None
+    assert RateLimiter.parse_retry_after('bald') is None
+    assert RateLimiter.parse_retry_after(formatdate(0, usegmt=True)) == 0.0
+    assert 25 < RateLimiter.parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+
+def test_rejects_invalid_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(requests_per_second=0)
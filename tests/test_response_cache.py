@@ -0,0 +1,119 @@
+# test_response_cache.py
+# op.gg Response Cache: URL-Normalisierung, TTL, Conditional GET mit 304 und LRU-Verdrängung
+
+import itertools
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+import response_cache
+from lol_scraper import LoLScraper
+from rate_limiter import RateLimiter
+from response_cache import ResponseCache
+
+URL = 'https://op.gg/lol/summoners/euw/Faker-KR1'
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Streng steigende Uhr - LRU-Reihenfolge hängt nicht von der Timer-Auflösung ab"""
+    ticks = itertools.count(1_700_000_000)
+    monkeypatch.setattr(response_cache.time, 'time', lambda: float(next(ticks)))
+
+def test_normalize_url():
+    assert ResponseCache.normalize_url('HTTPS://OP.GG/lol/summoners/euw/Faker-KR1/') == URL.lower()
+    assert ResponseCache.normalize_url('https://op.gg/lol/summoners/euw/faker-kr1?b=2&a=1') == f'{URL.lower()}?a=1&b=2'
+    assert ResponseCache.normalize_url('https://op.gg/lol/summoners/euw/Kai%20Sa') \
+        == ResponseCache.normalize_url('https://op.gg/lol/summoners/euw/kai sa')
+
+def test_put_get_and_persistence(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.put(URL, '<html>', etag='"v1"', last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+    
+    entry = ResponseCache(str(tmp_path)).get(URL.lower() + '/')
+    assert entry['body'] == '<html>'
+    assert ResponseCache(str(tmp_path)).conditional_headers(entry) == {
+        'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'
+    }
+    assert cache.get('https://op.gg/other') is None
+    assert cache.conditional_headers(None) == {}
+
+def test_ttl(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=60)
+    cache.put(URL, '<html>')
+    assert cache.is_fresh(cache.get(URL))
+    assert not ResponseCache(str(tmp_path), ttl=0).is_fresh(cache.get(URL))
+
+def test_lru_eviction_by_entries(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path), max_entries=2)
+    cache.put('https://op.gg/a', 'a')
+    cache.put('https://op.gg/b', 'b')
+    cache.get('https://op.gg/a')  # a zuletzt benutzt, b ist der älteste Zugriff
+    cache.put('https://op.gg/c', 'c')
+    
+    assert cache.get('https://op.gg/b') is None
+    assert cache.get('https://op.gg/a')['body'] == 'a'
+    assert cache.get('https://op.gg/c')['body'] == 'c'
+    assert len(list(tmp_path.glob('*.json'))) == 3  # 2 Einträge + index.json
+
+def test_lru_eviction_by_size(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path), max_bytes=10)
+    cache.put('https://op.gg/a', 'x' * 6)
+    cache.put('https://op.gg/b', 'y' * 6)
+    
+    assert cache.get('https://op.gg/a') is None
+    assert cache.get('https://op.gg/b') is not None
+
+def test_corrupt_entry_is_dropped(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.put(URL, '<html>')
+    for path in tmp_path.glob('*.json'):
+        if path.name != ResponseCache.INDEX_FILE:
+            path.write_text('{kaputt')
+    assert cache.get(URL) is None
+
+class RevalidatingAdapter(HTTPAdapter):
+    """op.gg Ersatz: 200 mit ETag, danach 304 wenn If-None-Match passt"""
+    
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+    
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        if request.headers.get('If-None-Match') == '"v1"':
+            response.status_code = 304
+            response.headers = CaseInsensitiveDict()
+            response._content = b''
+        else:
+            response.status_code = 200
+            response.headers = CaseInsensitiveDict({'ETag': '"v1"', 'Content-Type': 'text/html'})
+            response._content = b'<html><head><meta name="description" content="x"></head></html>'
+        return response
+
+def make_scraper(cache):
+    scraper = LoLScraper(rate_limiter=RateLimiter(requests_per_second=1000, burst=100), response_cache=cache)
+    adapter = RevalidatingAdapter()
+    scraper.session.mount('https://', adapter)
+    return scraper, adapter
+
+def test_fetch_uses_fresh_entry_without_request(tmp_path):
+    scraper, adapter = make_scraper(ResponseCache(str(tmp_path), ttl=300))
+    first = scraper._fetch(URL, 'test')
+    second = scraper._fetch(URL, 'test')
+    
+    assert first == second and first[0] == 200
+    assert len(adapter.requests) == 1
+
+def test_fetch_revalidates_stale_entry_with_304(tmp_path):
+    scraper, adapter = make_scraper(ResponseCache(str(tmp_path), ttl=0))
+    status, body = scraper._fetch(URL, 'test')
+    
+    assert scraper._fetch(URL, 'test') == (status, body)
+    assert len(adapter.requests) == 2
+    assert 'If-None-Match' not in adapter.requests[0].headers
+    assert adapter.requests[1].headers['If-None-Match'] == '"v1"'
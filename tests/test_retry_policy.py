@@ -0,0 +1,199 @@
+# test_retry_policy.py
+# Retry-Klassifizierung, Backoff mit Jitter, Deadline, Retry-After und Wiederholung bei Verbindungsabbruch mitten im Body
+
+import random
+
+import pytest
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+import retry_policy
+from lol_scraper import LoLScraper
+from rate_limiter import RateLimiter
+from retry_policy import RetryPolicy
+
+PAGE = b'<html><head><meta name="description" content="Faker#KR1 / Challenger 1,234LP / 300Win 200Lose"></head><body>'
+
+class FakeRaw:
+    """urllib3-Response Ersatz: liefert die Chunks und bricht optional danach ab"""
+    
+    def __init__(self, chunks, drop=False):
+        self.chunks = chunks
+        self.drop = drop
+    
+    def stream(self, chunk_size, decode_content=True):
+        yield from self.chunks
+        if self.drop:
+            raise urllib3.exceptions.ProtocolError('Connection broken', ConnectionResetError(104, 'reset'))
+    
+    def close(self):
+        pass
+    
+    def release_conn(self):
+        pass
+
+class DroppingAdapter(HTTPAdapter):
+    """Erste n Antworten brechen nach dem ersten Chunk ab, danach kommt die ganze Seite"""
+    
+    def __init__(self, drops=1):
+        super().__init__()
+        self.drops = drops
+        self.calls = 0
+    
+    def send(self, request, **kwargs):
+        self.calls += 1
+        drop = self.calls <= self.drops
+        response = requests.Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict({'Content-Type': 'text/html; charset=utf-8'})
+        response.raw = FakeRaw([PAGE[:40]] if drop else [PAGE[:40], PAGE[40:]], drop=drop)
+        response.url = request.url
+        response.request = request
+        return response
+
+def make_policy(**kwargs):
+    return RetryPolicy(jitter=0, rules={'connection': {'base_delay': 0.0}}, **kwargs)
+
+def test_classify_exception():
+    policy = make_policy()
+    assert policy.classify_exception(requests.exceptions.ConnectTimeout()) == 'timeout'
+    assert policy.classify_exception(requests.exceptions.ReadTimeout()) == 'timeout'
+    assert policy.classify_exception(requests.exceptions.ConnectionError()) == 'connection'
+    assert policy.classify_exception(requests.exceptions.ChunkedEncodingError()) == 'connection'
+    assert policy.classify_exception(requests.exceptions.ContentDecodingError()) == 'connection'
+    assert policy.classify_exception(requests.exceptions.InvalidURL()) is None
+
+def test_classify_status():
+    policy = make_policy()
+    assert policy.classify_status(429) == 'throttled'
+    assert policy.classify_status(503) == 'server_error'
+    assert policy.classify_status(200) is None
+    assert policy.classify_status(404) is None
+
+class FakeResponse:
+    """Antwort mit Status und Headern für execute()"""
+    
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+
+def run_responses(policy, responses, monkeypatch):
+    """execute() mit vorgegebenen Antworten und simulierter Uhr - liefert (Ergebnis, Anzahl Aufrufe, Pausen)"""
+    clock = [1000.0]
+    sleeps = []
+    
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+    
+    monkeypatch.setattr(retry_policy.time, 'monotonic', lambda: clock[0])
+    monkeypatch.setattr(retry_policy.time, 'sleep', sleep)
+    queue = list(responses)
+    calls = []
+    
+    def send(timeout):
+        calls.append(timeout)
+        return queue.pop(0)
+    
+    return policy.execute(send, 'test'), len(calls), sleeps
+
+def test_backoff_doubles_per_failure_and_caps_at_max_delay():
+    policy = RetryPolicy(jitter=0, max_delay=5.0)
+    assert [policy.compute_delay('server_error', attempt) for attempt in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+    assert policy.compute_delay('throttled', 1) == 2.0
+
+def test_jitter_stays_within_bounds():
+    policy = RetryPolicy(jitter=0.5, max_delay=100.0)
+    policy._random = random.Random(1)
+    for attempt in (1, 2, 3):
+        delay = 2.0 ** (attempt - 1)
+        samples = [policy.compute_delay('server_error', attempt) for _ in range(200)]
+        # Jitter nimmt bis zu 50 % der Pause weg, legt aber nie etwas drauf
+        assert all(delay * 0.5 <= sample <= delay for sample in samples)
+        assert max(samples) - min(samples) > delay * 0.3
+
+def test_server_errors_are_retried_with_backoff(monkeypatch):
+    policy = RetryPolicy(jitter=0)
+    result, calls, sleeps = run_responses(policy, [FakeResponse(500), FakeResponse(502), FakeResponse(200)],
+                                          monkeypatch)
+    
+    assert result.status_code == 200
+    assert calls == 3
+    assert sleeps == [1.0, 2.0]
+
+def test_gives_up_when_deadline_is_reached(monkeypatch):
+    # Zweite Pause (2s) passt nicht mehr in die Deadline: letzte Antwort zurückgeben statt zu warten
+    policy = RetryPolicy(jitter=0, deadline=2.5)
+    result, calls, sleeps = run_responses(policy, [FakeResponse(500), FakeResponse(503), FakeResponse(200)],
+                                          monkeypatch)
+    
+    assert result.status_code == 503
+    assert calls == 2
+    assert sleeps == [1.0]
+
+def test_request_timeout_never_exceeds_remaining_deadline():
+    policy = RetryPolicy(deadline=3.0, request_timeout=15.0)
+    timeouts = []
+    policy.execute(lambda timeout: timeouts.append(timeout) or FakeResponse(200), 'test')
+    assert 0 < timeouts[0] <= 3.0
+
+@pytest.mark.parametrize('status', [429, 503])
+def test_retry_after_overrides_shorter_backoff(status, monkeypatch):
+    policy = RetryPolicy(jitter=0)
+    result, calls, sleeps = run_responses(policy, [FakeResponse(status, {'Retry-After': '7'}), FakeResponse(200)],
+                                          monkeypatch)
+    
+    assert result.status_code == 200
+    assert calls == 2
+    assert sleeps == [7.0]
+
+def test_retry_after_beyond_deadline_gives_up(monkeypatch):
+    policy = RetryPolicy(jitter=0, deadline=5.0)
+    result, calls, sleeps = run_responses(policy, [FakeResponse(429, {'Retry-After': '60'}), FakeResponse(200)],
+                                          monkeypatch)
+    
+    assert result.status_code == 429
+    assert calls == 1
+    assert sleeps == []
+
+def test_throttled_respects_rule_attempts(monkeypatch):
+    policy = RetryPolicy(jitter=0, max_attempts=10, deadline=1000, max_delay=0.0)
+    result, calls, _ = run_responses(policy, [FakeResponse(429)] * 10, monkeypatch)
+    
+    assert result.status_code == 429
+    assert calls == RetryPolicy.DEFAULT_RULES['throttled']['max_attempts']
+
+def make_scraper(adapter, stream_head):
+    scraper = LoLScraper(rate_limiter=RateLimiter(requests_per_second=1000, burst=100), retry_policy=make_policy(),
+                         stream_head=stream_head, stream_chunk_size=16)
+    scraper.session.mount('https://', adapter)
+    return scraper
+
+def test_body_dropped_mid_stream_is_retried():
+    adapter = DroppingAdapter(drops=1)
+    scraper = make_scraper(adapter, stream_head=True)
+    
+    result = scraper.retry_policy.execute(lambda timeout: scraper._get('https://op.gg/test', timeout), 'test')
+    
+    assert adapter.calls == 2
+    assert result.status_code == 200
+    assert 'Challenger 1,234LP' in result.body
+
+def test_body_dropped_without_streaming_is_retried():
+    adapter = DroppingAdapter(drops=1)
+    scraper = make_scraper(adapter, stream_head=False)
+    
+    result = scraper.retry_policy.execute(lambda timeout: scraper._get('https://op.gg/test', timeout), 'test')
+    
+    assert adapter.calls == 2
+    assert result.body == PAGE.decode('utf-8')
+
+def test_gives_up_after_connection_attempts():
+    adapter = DroppingAdapter(drops=10)
+    scraper = make_scraper(adapter, stream_head=True)
+    
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        scraper.retry_policy.execute(lambda timeout: scraper._get('https://op.gg/test', timeout), 'test')
+    assert adapter.calls == RetryPolicy.DEFAULT_RULES['connection']['max_attempts']
@@ -0,0 +1,92 @@
+# test_scheduler.py
+# Dauerbetrieb: Neu-Rendern ohne neue Daten, Wiederholung fehlgeschlagener Deployments und warme Sessions
+
+import threading
+
+from github_pages_generator import GitHubPagesGenerator
+from lol_scraper import LoLScraper
+from scheduler import StatsScheduler
+
+PLAYER = {
+    'riot_id': 'a#EUW', 'summoner_name': 'a#EUW', 'tier': 'Gold', 'rank': 'Gold 2', 'lp': 40, 'wins': 10,
+    'losses': 8, 'total_games': 18, 'win_rate': 56, 'main_champions': [], 'last_updated': '2025-01-01 12:00:00',
+    'lane': 'TOP', 'recent_games': []
+}
+
+class FakeScraper:
+    """Liefert immer dieselben Daten, ohne neu zu scrapen"""
+    
+    def load_previous_team_data(self, data_file):
+        return {}
+    
+    def scrape_team(self, team_config, previous_players=None, max_age_minutes=None):
+        return {'team_name': 'Test', 'last_updated': '2025-01-01 12:00:00', 'total_players': 1, 'success_count': 1,
+                'refreshed_count': 0, 'reused_count': 1, 'fallback_count': 0, 'players': {'a#EUW': dict(PLAYER)}}
+
+class FakeGitHubManager:
+    """Zeichnet Deployments auf - die ersten fail_first schlagen fehl"""
+    
+    def __init__(self, fail_first=0):
+        self.calls = []
+        self.fail_first = fail_first
+    
+    def full_deployment(self, paths=None):
+        self.calls.append(sorted(paths or []))
+        return len(self.calls) > self.fail_first, 'https://example.github.io/test/'
+
+def make_scheduler(tmp_path, manager=None, generator=None):
+    return StatsScheduler(FakeScraper(), generator or GitHubPagesGenerator(), {}, output_dir=str(tmp_path),
+                          github_manager=manager)
+
+def test_rerenders_after_template_change_without_new_data(tmp_path):
+    scheduler = make_scheduler(tmp_path)
+    assert scheduler.run_cycle()
+    assert not scheduler.run_cycle()
+    
+    # Andere Generator-Konfiguration = anderes Template: neu rendern, obwohl kein Spieler neu gescraped wurde
+    scheduler.generator = GitHubPagesGenerator(client_render=True)
+    assert scheduler.run_cycle()
+    assert 'index.html' in scheduler.generator.changed_artifacts
+
+def test_failed_deploy_is_retried_next_cycle(tmp_path):
+    manager = FakeGitHubManager(fail_first=1)
+    scheduler = make_scheduler(tmp_path, manager)
+    
+    scheduler.run_cycle()
+    assert scheduler.unpublished_paths
+    first = manager.calls[0]
+    
+    # Nächster Zyklus ohne neue Daten: derselbe Stand wird erneut deployt
+    scheduler.run_cycle()
+    assert manager.calls == [first, first]
+    assert scheduler.unpublished_paths == {}
+    
+    scheduler.run_cycle()
+    assert len(manager.calls) == 2
+
+def test_cycles_reuse_the_scraper_sessions(tmp_path):
+    scraper = LoLScraper(max_workers=2)
+    barrier = threading.Barrier(2, timeout=5)
+    used = []
+    
+    def get_player_stats(riot_id, region='euw'):
+        # Beide Worker sind gleichzeitig beschäftigt - jeder Zyklus braucht zwei Threads
+        barrier.wait()
+        used.append(scraper.session)
+        return {**PLAYER, 'riot_id': riot_id, 'summoner_name': riot_id}
+    
+    scraper.get_player_stats = get_player_stats
+    team_config = {'team_name': 'Test', 'players': {'a#EUW': {'lane': 'TOP'}, 'b#EUW': {'lane': 'MID'}}}
+    # max_age_minutes=0: jeder Zyklus scraped alle Spieler neu
+    scheduler = StatsScheduler(scraper, GitHubPagesGenerator(), team_config, output_dir=str(tmp_path),
+                               max_age_minutes=0)
+    
+    scheduler.run_cycle()
+    sessions_after_first = list(scraper._sessions)
+    scheduler.run_cycle()
+    
+    assert len(sessions_after_first) == 2
+    assert scraper._sessions == sessions_after_first
+    assert {id(session) for session in used[2:]} == {id(session) for session in used[:2]}
+    scraper.close()
+
@@ -0,0 +1,45 @@
+# test_stats_index.py
+# Statistik-Index: Werte, Sortierung und Durchschnitte wie bei den alten _generate_ranking Durchläufen
+
+from stats_index import StatsIndex, get_performance_score, get_rank_value
+
+PLAYERS = [
+    ('top#EUW', {'tier': 'Gold', 'lp': 50, 'win_rate': 55.0, 'kda_ratio': 2.5, 'kill_participation': 60,
+                 'avg_gold': 12000, 'total_games': 40, 'wins': 22}),
+    ('jgl#EUW', {'tier': 'Diamond', 'lp': 10, 'win_rate': 48.0, 'kda_ratio': 3.1, 'kill_participation': 70,
+                 'avg_gold': 11000, 'total_games': 60, 'wins': 29}),
+    ('mid#EUW', {'tier': 'Gold', 'lp': 50, 'win_rate': 60.0, 'kda_ratio': 2.0, 'kill_participation': 55,
+                 'avg_gold': 12000, 'total_games': 20, 'wins': 12}),
+]
+
+def test_rank_value():
+    assert get_rank_value({'tier': 'Master', 'lp': 120}) == 7120
+    assert get_rank_value({'tier': 'Unranked'}) == 0
+    assert get_rank_value({}) == 0
+
+def test_performance_score_is_capped():
+    assert get_performance_score({'win_rate': 50, 'kda_ratio': 2.0, 'kill_participation': 60}) == 77
+    assert get_performance_score({'win_rate': 100, 'kda_ratio': 10.0, 'kill_participation': 100}) == 100
+
+def test_best_and_top():
+    index = StatsIndex(PLAYERS)
+    
+    assert len(index) == 3
+    assert index.best('rank_value')[0] == 'jgl#EUW'
+    assert index.best('win_rate')[0] == 'mid#EUW'
+    assert index.top('win_rate', limit=2) == [('mid', 60.0, '60.00%'), ('top', 55.0, '55.00%')]
+    assert index.top('rank_value', limit=1) == [('jgl', 6010, 'Diamond 10LP')]
+
+def test_ties_keep_lane_order():
+    index = StatsIndex(PLAYERS)
+    
+    assert [name for name, _, _ in index.top('avg_gold')] == ['top', 'mid', 'jgl']
+    assert index.top('avg_gold')[0][2] == '12,000g'
+
+def test_averages_and_totals():
+    index = StatsIndex(PLAYERS)
+    
+    assert index.totals['total_games'] == 120
+    assert index.totals['wins'] == 63
+    assert index.average('win_rate') == 163.0 / 3
+    assert StatsIndex([]).average('win_rate') == 0
@@ -0,0 +1,55 @@
+# test_template_engine.py
+# Vorkompilierte Templates: Slots, Partials, Fingerprint und Cache
+
+import pytest
+
+import template_engine
+from template_engine import CompiledTemplate, get_compiled_template
+
+def test_render_matches_str_format():
+    source = '<style>{{ color: red }}</style><h1>{title}</h1><p>{title} - {count}</p>'
+    template = CompiledTemplate(source)
+    
+    assert template.slots == ('title', 'count')
+    assert template.render(title='Team', count=5, unused='x') == source.format(title='Team', count=5)
+
+def test_partials_are_inlined_at_compile_time():
+    template = CompiledTemplate('<style>{css}</style>{body}', {'css': 'a { color: red }'})
+    
+    assert template.slots == ('body',)
+    assert template.render(body='<p>hi</p>') == '<style>a { color: red }</style><p>hi</p>'
+
+def test_missing_value_raises_key_error():
+    with pytest.raises(KeyError, match='count'):
+        CompiledTemplate('{title} {count}').render(title='Team')
+
+def test_rejects_format_specs():
+    with pytest.raises(ValueError):
+        CompiledTemplate('{value:.2f}')
+    with pytest.raises(ValueError):
+        CompiledTemplate('{player.name}')
+
+def test_fingerprint_covers_source_and_partials():
+    base = CompiledTemplate('{css}{body}', {'css': 'a'})
+    
+    assert base.fingerprint == CompiledTemplate('{css}{body}', {'css': 'a'}).fingerprint
+    assert base.fingerprint != CompiledTemplate('{css}{body}', {'css': 'b'}).fingerprint
+    assert base.fingerprint != CompiledTemplate('{css} {body}', {'css': 'a'}).fingerprint
+
+def test_get_compiled_template_loads_once(monkeypatch):
+    monkeypatch.setattr(template_engine, '_cache', {})
+    calls = []
+    
+    def loader():
+        calls.append('source')
+        return '{css}{body}'
+    
+    def css():
+        calls.append('css')
+        return 'a'
+    
+    first = get_compiled_template('page', loader, {'css': css})
+    second = get_compiled_template('page', loader, {'css': css})
+    
+    assert first is second
+    assert calls == ['css', 'source']